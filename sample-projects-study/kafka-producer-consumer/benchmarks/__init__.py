@@ -0,0 +1 @@
+"""Benchmarks for Kafka Producer-Consumer."""
@@ -0,0 +1,72 @@
+"""Shared helpers for benchmarks running against the in-process fake broker."""
+
+import time
+from typing import Any, Dict, List
+
+
+def make_messages(count: int, payload_size: int = 200) -> List[Dict[str, Any]]:
+    """Build benchmark messages with a repetitive, compressible payload.
+
+    Args:
+        count: Number of messages
+        payload_size: Approximate size of the value payload in bytes
+
+    Returns:
+        List of send_batch message dictionaries
+    """
+    filler = "sensor-reading " * (payload_size // 15 + 1)
+    data = filler[:payload_size]
+    return [
+        {"value": {"id": index, "ts": 1700000000 + index, "data": data}}
+        for index in range(count)
+    ]
+
+
+def format_table(rows: List[Dict[str, Any]], columns: List[str]) -> str:
+    """Render rows as a fixed-width text table.
+
+    Args:
+        rows: Result dictionaries
+        columns: Keys to print, in order
+
+    Returns:
+        Table as a string
+    """
+    widths = {
+        column: max(len(column), *(len(str(row[column])) for row in rows))
+        for column in columns
+    }
+    lines = ["  ".join(column.rjust(widths[column]) for column in columns)]
+    for row in rows:
+        lines.append(
+            "  ".join(str(row[column]).rjust(widths[column]) for column in columns)
+        )
+    return "\n".join(lines)
+
+
+class Timer:
+    """Context manager measuring wall-clock time."""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.elapsed = time.perf_counter() - self.start
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Get a percentile of samples using the nearest-rank method.
+
+    Args:
+        samples: Measured values
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        Percentile value, or 0.0 for no samples
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return ordered[index]
@@ -0,0 +1,121 @@
+"""Sweep producer batching and compression settings against a fake broker.
+
+Usage:
+    python -m benchmarks.producer_tuning --messages 20000 --latency-ms 2
+"""
+
+import argparse
+import itertools
+from typing import Any, Dict, List, Optional
+
+from src.kafka.config import KafkaConfig
+from src.kafka.fake_broker import FakeBroker, FakeBrokerProducerService
+
+from .common import Timer, format_table, make_messages
+
+COLUMNS = [
+    "partitioner",
+    "compression",
+    "linger_ms",
+    "batch_size",
+    "in_flight",
+    "msgs/s",
+    "requests",
+    "recs/req",
+    "wire_kb",
+    "ratio",
+]
+
+
+def run_once(
+    messages: List[Dict[str, Any]],
+    partitioner: str,
+    compression_type: Optional[str],
+    linger_ms: int,
+    batch_size: int,
+    max_in_flight: int,
+    latency_ms: float,
+    partitions: int,
+) -> Dict[str, Any]:
+    """Send messages once with the given settings and collect results.
+
+    Returns:
+        Result row for the table
+    """
+    broker = FakeBroker(num_partitions=partitions, request_latency_ms=latency_ms)
+    config = KafkaConfig(
+        topic="benchmark",
+        partitioner=partitioner,
+        compression_type=compression_type,
+        linger_ms=linger_ms,
+        batch_size=batch_size,
+        max_in_flight_requests_per_connection=max_in_flight,
+    )
+    producer = FakeBrokerProducerService(broker, config)
+
+    with Timer() as timer:
+        producer.send_batch(messages)
+        producer.flush()
+    producer.close()
+
+    stats = broker.stats
+    requests = stats["produce_requests"] or 1
+    return {
+        "partitioner": partitioner,
+        "compression": compression_type or "none",
+        "linger_ms": linger_ms,
+        "batch_size": batch_size,
+        "in_flight": max_in_flight,
+        "msgs/s": int(len(messages) / timer.elapsed),
+        "requests": stats["produce_requests"],
+        "recs/req": round(stats["records"] / requests, 1),
+        "wire_kb": stats["compressed_bytes_in"] // 1024,
+        "ratio": round(stats["bytes_in"] / (stats["compressed_bytes_in"] or 1), 2),
+    }
+
+
+def main() -> None:
+    """Run the parameter sweep and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--payload-size", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=2.0)
+    parser.add_argument("--partitions", type=int, default=3)
+    parser.add_argument("--partitioner", nargs="+", default=["client"])
+    parser.add_argument("--compression", nargs="+", default=["none", "gzip"])
+    parser.add_argument("--linger-ms", nargs="+", type=int, default=[0, 5, 20])
+    parser.add_argument(
+        "--batch-size", nargs="+", type=int, default=[16384, 65536, 262144]
+    )
+    parser.add_argument("--max-in-flight", nargs="+", type=int, default=[5])
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages, args.payload_size)
+    rows = []
+    for partitioner, compression, linger_ms, batch_size, in_flight in (
+        itertools.product(
+            args.partitioner,
+            args.compression,
+            args.linger_ms,
+            args.batch_size,
+            args.max_in_flight,
+        )
+    ):
+        rows.append(
+            run_once(
+                messages,
+                partitioner,
+                None if compression == "none" else compression,
+                linger_ms,
+                batch_size,
+                in_flight,
+                args.latency_ms,
+                args.partitions,
+            )
+        )
+
+    print(format_table(rows, COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Measure throughput and latency of every send and consume mode.
+
+Producer modes report send-to-acknowledgement latency. Consumer modes run
+a producer thread concurrently and report end-to-end latency from the
+record timestamp to the moment the consumer sees the record.
+
+Usage:
+    python -m benchmarks.throughput --messages 20000 --latency-ms 1
+"""
+
+import argparse
+import threading
+import time
+from typing import Any, Callable, Dict, List
+
+from src.kafka.config import KafkaConfig
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+)
+
+from .common import Timer, format_table, make_messages, percentile
+
+COLUMNS = ["mode", "messages", "msgs/s", "p50_ms", "p99_ms", "kb/s"]
+TOPIC = "benchmark"
+
+
+def _row(
+    mode: str, count: int, elapsed: float, latencies_ms: List[float], nbytes: int
+) -> Dict[str, Any]:
+    """Build a result row."""
+    return {
+        "mode": mode,
+        "messages": count,
+        "msgs/s": int(count / elapsed),
+        "p50_ms": round(percentile(latencies_ms, 0.50), 2),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 2),
+        "kb/s": int(nbytes / elapsed / 1024),
+    }
+
+
+def _config(args: argparse.Namespace, **overrides: Any) -> KafkaConfig:
+    """Build the benchmark configuration."""
+    settings = {
+        "topic": TOPIC,
+        "group_id": "benchmark",
+        "auto_offset_reset": "earliest",
+        "linger_ms": args.linger_ms,
+        "max_poll_records": args.max_poll_records,
+    }
+    settings.update(overrides)
+    return KafkaConfig(**settings)
+
+
+def bench_producer(
+    mode: str, args: argparse.Namespace, messages: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Send messages with one producer mode.
+
+    Returns:
+        Result row for the table
+    """
+    broker = FakeBroker(args.partitions, args.latency_ms, args.jitter_ms)
+    producer = FakeBrokerProducerService(broker, _config(args))
+    client = producer._producer
+    latencies_ms: List[float] = []
+
+    with Timer() as timer:
+        if mode == "send_message":
+            for message in messages:
+                start = time.perf_counter()
+                producer.send_message(message["value"])
+                latencies_ms.append((time.perf_counter() - start) * 1000)
+        elif mode == "send_batch":
+            producer.send_batch(messages)
+        else:
+            for message in messages:
+                producer.send_async(message["value"])
+            producer.flush()
+    producer.close()
+
+    if mode != "send_message":
+        latencies_ms = [s * 1000 for s in client.ack_latencies]
+    return _row(
+        mode, len(messages), timer.elapsed, latencies_ms, broker.stats["bytes_in"]
+    )
+
+
+def bench_consumer(
+    mode: str, args: argparse.Namespace, messages: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Consume messages with one consumer mode while they are produced.
+
+    Returns:
+        Result row for the table
+    """
+    broker = FakeBroker(args.partitions, args.latency_ms, args.jitter_ms)
+    broker.create_topic(TOPIC)
+    config = _config(args, enable_auto_commit=mode != "process_parallel")
+    producer = FakeBrokerProducerService(broker, config)
+    consumer = FakeBrokerConsumerService(broker, config)
+    latencies_ms: List[float] = []
+    lock = threading.Lock()
+
+    def observe(timestamp_ms: int) -> None:
+        latency = time.time() * 1000 - timestamp_ms
+        with lock:
+            latencies_ms.append(latency)
+
+    def produce() -> None:
+        for message in messages:
+            producer.send_async(message["value"])
+        producer.flush()
+
+    runners: Dict[str, Callable[[], None]] = {
+        "consume": lambda: [
+            observe(message["timestamp"])
+            for message in consumer.consume(max_messages=len(messages))
+        ],
+        "consume_batches": lambda: _drain_batches(consumer, len(messages), observe),
+        "process_parallel": lambda: consumer.process_parallel(
+            lambda message: observe(message["timestamp"]),
+            max_workers=args.workers,
+            max_messages=len(messages),
+        ),
+    }
+
+    producer_thread = threading.Thread(target=produce)
+    with Timer() as timer:
+        producer_thread.start()
+        runners[mode]()
+        producer_thread.join()
+    producer.close()
+    consumer.close()
+
+    return _row(
+        mode, len(messages), timer.elapsed, latencies_ms, broker.stats["bytes_out"]
+    )
+
+
+def _drain_batches(
+    consumer: FakeBrokerConsumerService,
+    count: int,
+    observe: Callable[[int], None],
+) -> None:
+    """Consume columnar batches until count records were seen."""
+    seen = 0
+    while seen < count:
+        for batch in consumer.consume_batches(max_batches=1):
+            for partition_batch in batch:
+                for timestamp in partition_batch.timestamps:
+                    observe(timestamp)
+            seen += len(batch)
+
+
+def main() -> None:
+    """Run every mode and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--sync-messages", type=int, default=500)
+    parser.add_argument("--payload-size", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=1.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--partitions", type=int, default=3)
+    parser.add_argument("--linger-ms", type=int, default=5)
+    parser.add_argument("--max-poll-records", type=int, default=500)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    messages = make_messages(args.messages, args.payload_size)
+    rows = [
+        bench_producer("send_message", args, messages[: args.sync_messages]),
+        bench_producer("send_batch", args, messages),
+        bench_producer("send_async", args, messages),
+        bench_consumer("consume", args, messages),
+        bench_consumer("consume_batches", args, messages),
+        bench_consumer("process_parallel", args, messages),
+    ]
+
+    print(format_table(rows, COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,29 @@
 
 from .producer import KafkaProducerService
 from .consumer import KafkaConsumerService
-from .exceptions import KafkaError, ProducerError, ConsumerError
+from .aio import AsyncKafkaConsumerService, AsyncKafkaProducerService
+from .retry import DeadLetterRouter, RetryConsumer
+from .transactions import TransactionalProcessor
+from .metrics import MetricsRegistry, start_metrics_server
+from .exceptions import KafkaError, ProducerError, ConsumerError, SerializationError
+from .serializers import Serializer, SerializerRegistry, StructSerializer
 
 __all__ = [
     "KafkaProducerService",
     "KafkaConsumerService",
+    "AsyncKafkaProducerService",
+    "AsyncKafkaConsumerService",
+    "TransactionalProcessor",
+    "DeadLetterRouter",
+    "RetryConsumer",
+    "MetricsRegistry",
+    "start_metrics_server",
     "KafkaError",
     "ProducerError",
     "ConsumerError",
+    "SerializationError",
+    "Serializer",
+    "SerializerRegistry",
+    "StructSerializer",
 ]
 
@@ -0,0 +1,296 @@
+"""Asyncio-native wrappers around the Kafka producer and consumer services."""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncGenerator, Dict, List, Optional
+
+from kafka.errors import KafkaError as LibKafkaError
+
+from .batch import PartitionBatch
+from .config import KafkaConfig
+from .consumer import KafkaConsumerService
+from .exceptions import ConsumerError, ProducerError
+from .producer import KafkaProducerService
+
+
+def _set_future_result(future: asyncio.Future, result: Any) -> None:
+    """Resolve an asyncio future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _set_future_exception(future: asyncio.Future, error: BaseException) -> None:
+    """Fail an asyncio future unless it was cancelled meanwhile."""
+    if not future.done():
+        future.set_exception(error)
+
+
+class AsyncKafkaProducerService:
+    """Asyncio producer service.
+
+    Records are handed to the kafka-python producer, whose own I/O thread
+    talks to the broker; delivery callbacks are bridged onto the event loop.
+    Awaiting a send therefore costs no extra thread, and thousands of sends
+    can be outstanding on one loop.
+    """
+
+    def __init__(
+        self,
+        config: Optional[KafkaConfig] = None,
+        bootstrap_servers: Optional[list] = None,
+        topic: Optional[str] = None,
+    ):
+        """Initialize async Kafka producer service.
+
+        Args:
+            config: KafkaConfig instance
+            bootstrap_servers: List of bootstrap servers (overrides config)
+            topic: Kafka topic (overrides config)
+
+        Raises:
+            ProducerError: If initialization fails
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._service = KafkaProducerService(config, bootstrap_servers, topic)
+        self.config = self._service.config
+        self.topic = self._service.topic
+
+    async def send_message(
+        self,
+        value: Any,
+        key: Optional[Any] = None,
+        topic: Optional[str] = None,
+        timeout_ms: int = 10000,
+    ) -> Dict[str, Any]:
+        """Send a message and await its acknowledgement.
+
+        Args:
+            value: Message value
+            key: Message key (optional)
+            topic: Topic to send to (overrides default)
+            timeout_ms: Timeout for send operation
+
+        Returns:
+            Dictionary with send metadata
+
+        Raises:
+            ProducerError: If send fails or times out
+        """
+        target_topic = topic or self.topic
+
+        if not target_topic:
+            raise ProducerError("Topic must be specified")
+
+        loop = asyncio.get_running_loop()
+        result = loop.create_future()
+
+        started = time.perf_counter()
+        try:
+            future = self._service._send_record(target_topic, value, key)
+        except LibKafkaError as e:
+            self._service._record_send(target_topic, started, success=False)
+            raise ProducerError(f"Failed to send message to {target_topic}: {e}")
+
+        future.add_callback(
+            lambda metadata: loop.call_soon_threadsafe(
+                _set_future_result, result, metadata
+            )
+        )
+        future.add_errback(
+            lambda error: loop.call_soon_threadsafe(
+                _set_future_exception, result, error
+            )
+        )
+
+        try:
+            record_metadata = await asyncio.wait_for(result, timeout_ms / 1000)
+        except asyncio.TimeoutError:
+            self._service._record_send(target_topic, started, success=False)
+            raise ProducerError(
+                f"Timed out after {timeout_ms}ms sending message to {target_topic}"
+            )
+        except LibKafkaError as e:
+            self._service._record_send(target_topic, started, success=False)
+            error_msg = f"Failed to send message to {target_topic}: {str(e)}"
+            self.logger.error(error_msg)
+            raise ProducerError(error_msg)
+
+        self._service._record_send(target_topic, started, success=True)
+        return self._service._metadata_to_dict(record_metadata)
+
+    async def send_batch(
+        self,
+        messages: List[Dict[str, Any]],
+        topic: Optional[str] = None,
+        timeout_ms: int = 10000,
+    ) -> List[Dict[str, Any]]:
+        """Send multiple messages concurrently.
+
+        Args:
+            messages: List of message dictionaries with 'value' and optional 'key'
+            topic: Topic to send to (overrides default)
+            timeout_ms: Timeout per message
+
+        Returns:
+            List of send results in input order
+        """
+        async def send_one(index: int, message: Any) -> Dict[str, Any]:
+            try:
+                if not isinstance(message, dict) or "value" not in message:
+                    raise ProducerError(
+                        f"Message {index} must be dict with a 'value' field"
+                    )
+                return await self.send_message(
+                    message["value"], message.get("key"), topic, timeout_ms
+                )
+            except ProducerError as e:
+                return {"index": index, "success": False, "error": str(e)}
+
+        self._service._metrics.batch_size.labels(topic or self.topic).observe(
+            len(messages)
+        )
+        return list(
+            await asyncio.gather(
+                *(send_one(index, message) for index, message in enumerate(messages))
+            )
+        )
+
+    async def flush(self, timeout_ms: int = 10000) -> None:
+        """Flush pending messages without blocking the event loop.
+
+        Args:
+            timeout_ms: Timeout in milliseconds
+
+        Raises:
+            ProducerError: If flush fails
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._service.flush, timeout_ms)
+
+    async def close(self) -> None:
+        """Close producer connection without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._service.close)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+class AsyncKafkaConsumerService:
+    """Asyncio consumer service.
+
+    KafkaConsumer is not thread-safe, so every call into it runs on one
+    dedicated thread owned by the service; the event loop only awaits the
+    results.
+    """
+
+    def __init__(
+        self,
+        config: Optional[KafkaConfig] = None,
+        bootstrap_servers: Optional[list] = None,
+        topic: Optional[str] = None,
+        group_id: Optional[str] = None,
+    ):
+        """Initialize async Kafka consumer service.
+
+        Args:
+            config: KafkaConfig instance
+            bootstrap_servers: List of bootstrap servers (overrides config)
+            topic: Kafka topic (overrides config)
+            group_id: Consumer group ID (overrides config)
+
+        Raises:
+            ConsumerError: If initialization fails
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._service = KafkaConsumerService(
+            config, bootstrap_servers, topic, group_id
+        )
+        self.config = self._service.config
+        self.topic = self._service.topic
+        self.group_id = self._service.group_id
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="kafka-consumer"
+        )
+
+    async def _run(self, func, *args) -> Any:
+        """Run a consumer call on the consumer thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    async def consume(
+        self,
+        timeout_ms: int = 1000,
+        max_messages: Optional[int] = None,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Consume messages from topic.
+
+        Args:
+            timeout_ms: Poll timeout in milliseconds
+            max_messages: Maximum messages to consume (None for infinite)
+
+        Yields:
+            Message dictionaries with metadata
+
+        Raises:
+            ConsumerError: If consumption fails
+        """
+        message_count = 0
+        service = self._service
+
+        while max_messages is None or message_count < max_messages:
+            try:
+                messages = await self._run(service._poll, timeout_ms)
+            except LibKafkaError as e:
+                error_msg = f"Error during consumption: {str(e)}"
+                self.logger.error(error_msg)
+                raise ConsumerError(error_msg)
+
+            if not messages:
+                if service._commit_manager:
+                    await self._run(service._maybe_commit)
+                continue
+
+            for topic_partition, records in messages.items():
+                batch = PartitionBatch(
+                    topic_partition.topic,
+                    topic_partition.partition,
+                    records,
+                    self._service._decode_value,
+                )
+                for message in batch.messages():
+                    message_count += 1
+                    yield message
+
+                    if service._commit_manager:
+                        await self._run(
+                            service._mark_consumed, topic_partition, message["offset"]
+                        )
+
+    async def commit(self) -> None:
+        """Commit current offset.
+
+        Raises:
+            ConsumerError: If commit fails
+        """
+        await self._run(self._service.commit)
+
+    async def close(self) -> None:
+        """Close consumer connection and its thread."""
+        await self._run(self._service.close)
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
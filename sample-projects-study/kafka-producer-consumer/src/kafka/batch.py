@@ -0,0 +1,125 @@
+"""Columnar views over polled Kafka records."""
+
+from array import array
+from typing import Any, Callable, Dict, Generator, Iterator, List, Optional, Sequence
+
+
+class PartitionBatch:
+    """Records polled from a single partition, exposed column by column.
+
+    Columns are built on first access and cached, so code that only needs
+    offsets never decodes values and no per-record dictionary is created
+    unless :meth:`messages` is called.
+    """
+
+    def __init__(
+        self,
+        topic: str,
+        partition: int,
+        records: Sequence[Any],
+        decode_value: Callable[[Any], Any],
+    ):
+        """Initialize partition batch.
+
+        Args:
+            topic: Topic name
+            partition: Partition number
+            records: ConsumerRecords in offset order
+            decode_value: Callable decoding the value of one record
+        """
+        self.topic = topic
+        self.partition = partition
+        self._records = records
+        self._decode_value = decode_value
+        self._offsets: Optional[array] = None
+        self._timestamps: Optional[array] = None
+        self._keys: Optional[List[Any]] = None
+        self._values: Optional[List[Any]] = None
+
+    def __len__(self) -> int:
+        """Number of records in the batch."""
+        return len(self._records)
+
+    @property
+    def offsets(self) -> array:
+        """Record offsets as a signed 64-bit array."""
+        if self._offsets is None:
+            self._offsets = array("q", [record.offset for record in self._records])
+        return self._offsets
+
+    @property
+    def timestamps(self) -> array:
+        """Record timestamps (ms) as a signed 64-bit array."""
+        if self._timestamps is None:
+            self._timestamps = array(
+                "q", [record.timestamp for record in self._records]
+            )
+        return self._timestamps
+
+    @property
+    def keys(self) -> List[Any]:
+        """Deserialized record keys."""
+        if self._keys is None:
+            self._keys = [record.key for record in self._records]
+        return self._keys
+
+    @property
+    def values(self) -> List[Any]:
+        """Decoded record values."""
+        if self._values is None:
+            decode = self._decode_value
+            self._values = [decode(record) for record in self._records]
+        return self._values
+
+    @property
+    def raw_values(self) -> List[Optional[bytes]]:
+        """Undecoded record value bytes."""
+        return [record.value for record in self._records]
+
+    @property
+    def headers(self) -> List[List[Any]]:
+        """Record headers."""
+        return [record.headers or [] for record in self._records]
+
+    @property
+    def next_offset(self) -> int:
+        """Offset to commit once every record in the batch is processed."""
+        return self._records[-1].offset + 1
+
+    def messages(self) -> Generator[Dict[str, Any], None, None]:
+        """Materialize records as message dictionaries.
+
+        Yields:
+            Message dictionaries shaped like ``KafkaConsumerService.consume``
+        """
+        values = self.values
+        for record, value in zip(self._records, values):
+            yield {
+                "topic": record.topic,
+                "partition": record.partition,
+                "offset": record.offset,
+                "timestamp": record.timestamp,
+                "key": record.key,
+                "value": value,
+                "headers": record.headers or [],
+            }
+
+
+class MessageBatch:
+    """Result of one consumer poll, grouped by partition."""
+
+    def __init__(self, partitions: Dict[Any, PartitionBatch]):
+        """Initialize message batch.
+
+        Args:
+            partitions: Mapping of TopicPartition to PartitionBatch
+        """
+        self.partitions = partitions
+
+    def __len__(self) -> int:
+        """Total number of records across partitions."""
+        return sum(len(batch) for batch in self.partitions.values())
+
+    def __iter__(self) -> Iterator[PartitionBatch]:
+        """Iterate over partition batches."""
+        return iter(self.partitions.values())
@@ -0,0 +1,174 @@
+"""Batched and time-based offset commit management."""
+
+import functools
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from kafka.errors import KafkaError as LibKafkaError
+from kafka.structs import OffsetAndMetadata
+
+from .exceptions import ConsumerError
+from .metrics import NOOP
+
+
+def offset_and_metadata(offset: int) -> OffsetAndMetadata:
+    """Build OffsetAndMetadata across kafka-python versions.
+
+    kafka-python 2.0 takes (offset, metadata); later releases add
+    leader_epoch.
+
+    Args:
+        offset: Next offset to consume
+
+    Returns:
+        OffsetAndMetadata for commit requests
+    """
+    fields = (offset, "", -1)
+    return OffsetAndMetadata(*fields[: len(OffsetAndMetadata._fields)])
+
+
+class OffsetCommitManager:
+    """Track processed offsets and commit them in batches.
+
+    Offsets are committed once ``every_messages`` records were marked as
+    processed or ``interval_ms`` elapsed since the last commit, whichever
+    comes first. Only the highest offset per partition is kept, so a commit
+    costs one request regardless of how many records it covers.
+    """
+
+    def __init__(
+        self,
+        consumer: Any,
+        every_messages: int = 0,
+        interval_ms: int = 0,
+        async_commit: bool = True,
+        commit_latency: Any = NOOP,
+    ):
+        """Initialize commit manager.
+
+        Args:
+            consumer: KafkaConsumer instance
+            every_messages: Commit after this many processed records (0 disables)
+            interval_ms: Commit after this much time (0 disables)
+            async_commit: Use commit_async for periodic commits
+            commit_latency: Histogram observing the seconds each commit took
+
+        Raises:
+            ConsumerError: If neither trigger is enabled
+        """
+        if every_messages <= 0 and interval_ms <= 0:
+            raise ConsumerError(
+                "Commit manager needs every_messages or interval_ms to be positive"
+            )
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._consumer = consumer
+        self.every_messages = every_messages
+        self.interval_ms = interval_ms
+        self.async_commit = async_commit
+        self._commit_latency = commit_latency
+
+        self._pending: Dict[Any, int] = {}
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+        self._stats = {"commits": 0, "failed_commits": 0}
+
+    def track(self, topic_partition: Any, offset: int, count: int = 1) -> None:
+        """Mark records up to and including an offset as processed.
+
+        Args:
+            topic_partition: TopicPartition of the records
+            offset: Offset of the last processed record
+            count: Number of records this call covers
+        """
+        self._pending[topic_partition] = offset + 1
+        self._uncommitted += count
+
+    def maybe_commit(self) -> bool:
+        """Commit pending offsets if a trigger fired.
+
+        Returns:
+            True if a commit was issued
+
+        Raises:
+            ConsumerError: If a synchronous commit fails
+        """
+        if not self._pending:
+            return False
+
+        due = self.every_messages > 0 and self._uncommitted >= self.every_messages
+        if not due and self.interval_ms > 0:
+            elapsed_ms = (time.monotonic() - self._last_commit) * 1000
+            due = elapsed_ms >= self.interval_ms
+
+        if due:
+            self._commit(self.async_commit)
+        return due
+
+    def flush(self) -> None:
+        """Synchronously commit all pending offsets.
+
+        Raises:
+            ConsumerError: If commit fails
+        """
+        if self._pending:
+            self._commit(async_commit=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Get commit counters.
+
+        Returns:
+            Dictionary with commits, failed_commits and uncommitted counts
+        """
+        return dict(self._stats, uncommitted=self._uncommitted)
+
+    def _commit(self, async_commit: bool) -> None:
+        """Commit pending offsets and reset the triggers."""
+        offsets = {
+            tp: offset_and_metadata(offset) for tp, offset in self._pending.items()
+        }
+        self._pending = {}
+        self._uncommitted = 0
+        self._last_commit = time.monotonic()
+
+        started = time.perf_counter()
+        try:
+            if async_commit:
+                self._consumer.commit_async(
+                    offsets=offsets,
+                    callback=functools.partial(self._on_async_commit, started=started),
+                )
+            else:
+                self._consumer.commit(offsets=offsets)
+                self._stats["commits"] += 1
+                self._commit_latency.observe(time.perf_counter() - started)
+        except LibKafkaError as e:
+            self._stats["failed_commits"] += 1
+            # Keep the offsets so a retry or flush() commits them again
+            for tp, committed in offsets.items():
+                self._pending.setdefault(tp, committed.offset)
+            error_msg = f"Failed to commit offsets: {str(e)}"
+            self.logger.error(error_msg)
+            raise ConsumerError(error_msg)
+
+    def _on_async_commit(
+        self,
+        offsets: Dict[Any, Any],
+        response: Any,
+        started: Optional[float] = None,
+    ) -> None:
+        """Record the outcome of an asynchronous commit.
+
+        Offsets of a failed commit are put back for partitions that have not
+        advanced since, so the next commit retries them.
+        """
+        if isinstance(response, Exception):
+            self._stats["failed_commits"] += 1
+            self.logger.warning("Async offset commit failed: %s", response)
+            for tp, committed in offsets.items():
+                self._pending.setdefault(tp, committed.offset)
+        else:
+            self._stats["commits"] += 1
+            if started is not None:
+                self._commit_latency.observe(time.perf_counter() - started)
@@ -1,10 +1,12 @@
 """Configuration module for Kafka services."""
 
 import os
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from .serializers import Serializer, SerializerRegistry, default_registry
+
 
 class KafkaConfig(BaseModel):
     """Configuration for Kafka services."""
@@ -24,6 +26,45 @@ class KafkaConfig(BaseModel):
     max_poll_records: int = Field(
         default=int(os.getenv("KAFKA_MAX_POLL_RECORDS", "500"))
     )
+    adaptive_poll: bool = Field(
+        default=os.getenv("KAFKA_ADAPTIVE_POLL", "false").lower() == "true"
+    )
+    adaptive_poll_min_records: int = Field(
+        default=int(os.getenv("KAFKA_ADAPTIVE_POLL_MIN_RECORDS", "50"))
+    )
+    adaptive_poll_max_records: int = Field(
+        default=int(os.getenv("KAFKA_ADAPTIVE_POLL_MAX_RECORDS", "5000"))
+    )
+    adaptive_poll_min_timeout_ms: int = Field(
+        default=int(os.getenv("KAFKA_ADAPTIVE_POLL_MIN_TIMEOUT_MS", "10"))
+    )
+    lag_refresh_interval_ms: int = Field(
+        default=int(os.getenv("KAFKA_LAG_REFRESH_INTERVAL_MS", "1000"))
+    )
+    isolation_level: str = Field(
+        default=os.getenv("KAFKA_ISOLATION_LEVEL", "read_uncommitted")
+    )
+    prefetch_batches: int = Field(
+        default=int(os.getenv("KAFKA_PREFETCH_BATCHES", "0"))
+    )
+    commit_every_messages: int = Field(
+        default=int(os.getenv("KAFKA_COMMIT_EVERY_MESSAGES", "0"))
+    )
+    commit_interval_ms: int = Field(
+        default=int(os.getenv("KAFKA_COMMIT_INTERVAL_MS", "0"))
+    )
+    commit_async: bool = Field(
+        default=os.getenv("KAFKA_COMMIT_ASYNC", "true").lower() == "true"
+    )
+    retry_delays_ms: List[int] = Field(
+        default_factory=lambda: [
+            int(delay)
+            for delay in os.getenv(
+                "KAFKA_RETRY_DELAYS_MS", "1000,10000,60000"
+            ).split(",")
+            if delay.strip()
+        ]
+    )
     session_timeout_ms: int = Field(
         default=int(os.getenv("KAFKA_SESSION_TIMEOUT_MS", "30000"))
     )
@@ -34,11 +75,55 @@ class KafkaConfig(BaseModel):
     retry_backoff_ms: int = Field(
         default=int(os.getenv("KAFKA_RETRY_BACKOFF_MS", "100"))
     )
+    compression_type: Optional[str] = Field(
+        default=os.getenv("KAFKA_COMPRESSION_TYPE") or None
+    )
+    linger_ms: int = Field(default=int(os.getenv("KAFKA_LINGER_MS", "0")))
+    batch_size: int = Field(default=int(os.getenv("KAFKA_BATCH_SIZE", "16384")))
+    buffer_memory: int = Field(
+        default=int(os.getenv("KAFKA_BUFFER_MEMORY", "33554432"))
+    )
+    max_in_flight_requests_per_connection: int = Field(
+        default=int(os.getenv("KAFKA_MAX_IN_FLIGHT_REQUESTS_PER_CONNECTION", "5"))
+    )
+    partitioner: str = Field(default=os.getenv("KAFKA_PARTITIONER", "client"))
+    transactional_id: Optional[str] = Field(
+        default=os.getenv("KAFKA_TRANSACTIONAL_ID") or None
+    )
+    transaction_max_messages: int = Field(
+        default=int(os.getenv("KAFKA_TRANSACTION_MAX_MESSAGES", "1000"))
+    )
+    transaction_max_bytes: int = Field(
+        default=int(os.getenv("KAFKA_TRANSACTION_MAX_BYTES", "1048576"))
+    )
+    batch_max_in_flight: int = Field(
+        default=int(os.getenv("KAFKA_BATCH_MAX_IN_FLIGHT", "1000"))
+    )
+    max_pending_messages: int = Field(
+        default=int(os.getenv("KAFKA_MAX_PENDING_MESSAGES", "10000"))
+    )
+    overflow_policy: str = Field(
+        default=os.getenv("KAFKA_OVERFLOW_POLICY", "block")
+    )
+    overflow_timeout_ms: int = Field(
+        default=int(os.getenv("KAFKA_OVERFLOW_TIMEOUT_MS", "10000"))
+    )
+    value_serializer: str = Field(
+        default=os.getenv("KAFKA_VALUE_SERIALIZER", "json")
+    )
+    topic_serializers: Dict[str, str] = Field(default_factory=dict)
+    serializers: SerializerRegistry = Field(
+        default_factory=default_registry, exclude=True
+    )
+    metrics_enabled: bool = Field(
+        default=os.getenv("KAFKA_METRICS_ENABLED", "true").lower() == "true"
+    )
 
     class Config:
         """Pydantic config."""
 
         extra = "allow"
+        arbitrary_types_allowed = True
 
     def to_dict(self) -> dict:
         """Convert config to dictionary for Kafka client.
@@ -48,3 +133,18 @@ class KafkaConfig(BaseModel):
         """
         return self.model_dump()
 
+    def serializer_for(self, topic: str) -> Serializer:
+        """Get the value serializer configured for a topic.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Serializer from ``topic_serializers`` or the default one
+
+        Raises:
+            SerializationError: If the configured codec is not registered
+        """
+        name = self.topic_serializers.get(topic, self.value_serializer)
+        return self.serializers.get(name)
+
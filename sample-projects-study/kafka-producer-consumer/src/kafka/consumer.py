@@ -2,13 +2,21 @@
 
 import json
 import logging
-from typing import Any, Dict, Generator, Optional
+import time
+from typing import Any, Callable, Dict, Generator, List, Optional, Set
 
 from kafka import KafkaConsumer, TopicPartition
 from kafka.errors import KafkaError as LibKafkaError
 
+from .batch import MessageBatch, PartitionBatch
+from .commit import OffsetCommitManager, offset_and_metadata
 from .config import KafkaConfig
-from .exceptions import ConsumerError
+from .exceptions import ConsumerError, SerializationError
+from .lag import AdaptivePollSizer, LagTracker
+from .metrics import REGISTRY, ConsumerMetrics
+from .prefetch import PrefetchPoller
+from .serializers import CODEC_HEADER
+from .workers import PartitionWorkerPool
 
 
 class KafkaConsumerService:
@@ -56,7 +64,22 @@ class KafkaConsumerService:
         if not self.group_id:
             raise ConsumerError("Consumer group_id must be specified")
 
+        self._metrics = ConsumerMetrics(REGISTRY if config.metrics_enabled else None)
+        self._commit_latency = self._metrics.commit_latency.labels(self.topic)
         self._consumer = self._create_consumer()
+        self._commit_manager = self._create_commit_manager()
+        self._lag_tracker = LagTracker(
+            self._consumer, config.lag_refresh_interval_ms, self._metrics.end_offset_lag
+        )
+        self._poll_sizer: Optional[AdaptivePollSizer] = None
+        if config.adaptive_poll:
+            self._poll_sizer = AdaptivePollSizer(
+                config.adaptive_poll_min_records,
+                config.adaptive_poll_max_records,
+                config.adaptive_poll_min_timeout_ms,
+            )
+        self._prefetcher: Optional[PrefetchPoller] = None
+        self._prefetch_offsets: Dict[TopicPartition, int] = {}
         self.logger.info(
             f"KafkaConsumerService initialized for topic: {self.topic}, "
             f"group: {self.group_id}"
@@ -72,19 +95,7 @@ class KafkaConsumerService:
             ConsumerError: If consumer creation fails
         """
         try:
-            consumer = KafkaConsumer(
-                self.topic,
-                bootstrap_servers=self.config.bootstrap_servers,
-                group_id=self.group_id,
-                client_id=self.config.client_id,
-                auto_offset_reset=self.config.auto_offset_reset,
-                enable_auto_commit=self.config.enable_auto_commit,
-                max_poll_records=self.config.max_poll_records,
-                session_timeout_ms=self.config.session_timeout_ms,
-                request_timeout_ms=self.config.request_timeout_ms,
-                value_deserializer=self._deserialize_value,
-                key_deserializer=self._deserialize_key,
-            )
+            consumer = KafkaConsumer(self.topic, **self._consumer_configs())
             self.logger.debug("KafkaConsumer instance created successfully")
             return consumer
 
@@ -93,6 +104,48 @@ class KafkaConsumerService:
             self.logger.error(error_msg)
             raise ConsumerError(error_msg)
 
+    def _consumer_configs(self) -> Dict[str, Any]:
+        """Build keyword arguments for the underlying consumer client.
+
+        Returns:
+            Dictionary of KafkaConsumer configuration
+        """
+        return {
+            "bootstrap_servers": self.config.bootstrap_servers,
+            "group_id": self.group_id,
+            "client_id": self.config.client_id,
+            "auto_offset_reset": self.config.auto_offset_reset,
+            "enable_auto_commit": self.config.enable_auto_commit,
+            "max_poll_records": self.config.max_poll_records,
+            "session_timeout_ms": self.config.session_timeout_ms,
+            "request_timeout_ms": self.config.request_timeout_ms,
+            "isolation_level": self.config.isolation_level,
+            "key_deserializer": self._deserialize_key,
+        }
+
+    def _create_commit_manager(self) -> Optional[OffsetCommitManager]:
+        """Create the offset commit manager if batched commits are configured.
+
+        Returns:
+            OffsetCommitManager, or None when auto-commit is enabled or no
+            commit trigger is configured
+        """
+        if self.config.enable_auto_commit:
+            return None
+        if (
+            self.config.commit_every_messages <= 0
+            and self.config.commit_interval_ms <= 0
+        ):
+            return None
+
+        return OffsetCommitManager(
+            self._consumer,
+            every_messages=self.config.commit_every_messages,
+            interval_ms=self.config.commit_interval_ms,
+            async_commit=self.config.commit_async,
+            commit_latency=self._commit_latency,
+        )
+
     @staticmethod
     def _deserialize_key(key: Optional[bytes]) -> Optional[Any]:
         """Deserialize message key.
@@ -143,6 +196,45 @@ class KafkaConsumerService:
         except UnicodeDecodeError as e:
             raise ConsumerError(f"Failed to deserialize value: {str(e)}")
 
+    def _decode_value(self, record: Any) -> Any:
+        """Decode a raw record value using its codec header.
+
+        Records without a codec header are decoded with the serializer
+        configured for their topic in ``topic_serializers``, or with the
+        legacy JSON-or-string fallback when none is configured.
+
+        Args:
+            record: ConsumerRecord with raw value bytes
+
+        Returns:
+            Deserialized value
+
+        Raises:
+            ConsumerError: If deserialization fails
+        """
+        value = record.value
+        if value is None:
+            return None
+
+        codec = None
+        for header_key, header_value in record.headers or ():
+            if header_key == CODEC_HEADER:
+                codec = header_value.decode("utf-8")
+                break
+
+        if codec is None:
+            codec = self.config.topic_serializers.get(record.topic)
+            if codec is None:
+                return self._deserialize_value(value)
+
+        try:
+            return self.config.serializers.get(codec).deserialize(value)
+        except SerializationError as e:
+            raise ConsumerError(
+                f"Failed to deserialize message from {record.topic}:"
+                f"{record.partition}:{record.offset}: {e}"
+            )
+
     def consume(
         self,
         timeout_ms: int = 1000,
@@ -150,6 +242,9 @@ class KafkaConsumerService:
     ) -> Generator[Dict[str, Any], None, None]:
         """Consume messages from topic.
 
+        With ``prefetch_batches`` configured, a background thread keeps
+        polling while messages are handled; see :meth:`_consume_prefetched`.
+
         Args:
             timeout_ms: Poll timeout in milliseconds
             max_messages: Maximum messages to consume (None for infinite)
@@ -160,6 +255,10 @@ class KafkaConsumerService:
         Raises:
             ConsumerError: If consumption fails
         """
+        if self.config.prefetch_batches > 0:
+            yield from self._consume_prefetched(timeout_ms, max_messages)
+            return
+
         message_count = 0
 
         try:
@@ -176,10 +275,11 @@ class KafkaConsumerService:
 
                 try:
                     # Poll for messages
-                    messages = self._consumer.poll(timeout_ms=timeout_ms)
+                    messages = self._poll(timeout_ms)
 
                     if not messages:
                         self.logger.debug("No messages received in poll")
+                        self._maybe_commit()
                         continue
 
                     # Process each partition
@@ -191,23 +291,117 @@ class KafkaConsumerService:
                                 "offset": record.offset,
                                 "timestamp": record.timestamp,
                                 "key": record.key,
-                                "value": record.value,
+                                "value": self._decode_value(record),
                                 "headers": record.headers or [],
                             }
 
                             self.logger.debug(
-                                f"Received message from {record.topic}:"
-                                f"{record.partition}:{record.offset}"
+                                "Received message from %s:%s:%s",
+                                record.topic,
+                                record.partition,
+                                record.offset,
                             )
 
                             message_count += 1
                             yield message_dict
 
+                            self._mark_consumed(topic_partition, record.offset)
+
+                except LibKafkaError as e:
+                    error_msg = f"Error during consumption: {str(e)}"
+                    self.logger.error(error_msg)
+                    raise ConsumerError(error_msg)
+
+        except GeneratorExit:
+            self.logger.info(f"Consumer stopped, received {message_count} messages")
+        except ConsumerError:
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error during consumption: {str(e)}"
+            self.logger.error(error_msg)
+            raise ConsumerError(error_msg)
+
+    def _consume_prefetched(
+        self,
+        timeout_ms: int,
+        max_messages: Optional[int],
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Consume messages polled ahead by a background thread.
+
+        Up to ``prefetch_batches`` poll results are buffered, so broker round
+        trips overlap with message handling. When the generator finishes,
+        fetch positions are rewound to the first message that was not
+        yielded, and :meth:`commit` commits yielded messages rather than the
+        fetch position, which runs ahead of processing.
+
+        Args:
+            timeout_ms: Time to wait for prefetched data per iteration
+            max_messages: Maximum messages to consume (None for infinite)
+
+        Yields:
+            Message dictionaries with metadata
+
+        Raises:
+            ConsumerError: If auto-commit is enabled or consumption fails
+        """
+        if self.config.enable_auto_commit:
+            raise ConsumerError(
+                "Prefetching requires enable_auto_commit=False, otherwise "
+                "buffered messages would be committed before they are handled"
+            )
+
+        poller = self._prefetcher or self._start_prefetch()
+        message_count = 0
+
+        try:
+            while max_messages is None or message_count < max_messages:
+                try:
+                    item = poller.get(timeout_ms)
                 except LibKafkaError as e:
                     error_msg = f"Error during consumption: {str(e)}"
                     self.logger.error(error_msg)
                     raise ConsumerError(error_msg)
 
+                if item is None:
+                    if poller.stopped:
+                        break
+                    if self._commit_manager:
+                        with poller.lock:
+                            self._commit_manager.maybe_commit()
+                    continue
+
+                generation, messages = item
+                with poller.lock:
+                    self._record_poll(messages)
+                for topic_partition, records in messages.items():
+                    batch = PartitionBatch(
+                        topic_partition.topic,
+                        topic_partition.partition,
+                        records,
+                        self._decode_value,
+                    )
+                    for message in batch.messages():
+                        if (
+                            generation != poller.generation
+                            or max_messages is not None
+                            and message_count >= max_messages
+                        ):
+                            break
+
+                        message_count += 1
+                        with poller.lock:
+                            self._prefetch_offsets[topic_partition] = (
+                                message["offset"] + 1
+                            )
+                        yield message
+
+                        if self._commit_manager:
+                            with poller.lock:
+                                self._commit_manager.track(
+                                    topic_partition, message["offset"]
+                                )
+                                self._commit_manager.maybe_commit()
+
         except GeneratorExit:
             self.logger.info(f"Consumer stopped, received {message_count} messages")
         except ConsumerError:
@@ -216,6 +410,443 @@ class KafkaConsumerService:
             error_msg = f"Unexpected error during consumption: {str(e)}"
             self.logger.error(error_msg)
             raise ConsumerError(error_msg)
+        finally:
+            self._stop_prefetch()
+
+    def _start_prefetch(self) -> PrefetchPoller:
+        """Start the background poll thread.
+
+        Returns:
+            Running PrefetchPoller
+        """
+        self._prefetch_offsets = {}
+        self._prefetcher = PrefetchPoller(
+            self._consumer,
+            [self.topic],
+            max_batches=self.config.prefetch_batches,
+            on_revoked=self._on_prefetch_revoked,
+        )
+        return self._prefetcher
+
+    def _stop_prefetch(self) -> None:
+        """Stop the poll thread and rewind positions to unhandled messages."""
+        poller, self._prefetcher = self._prefetcher, None
+        if poller is None:
+            return
+
+        rewind = {}
+        for records in poller.stop():
+            for topic_partition, partition_records in records.items():
+                rewind.setdefault(topic_partition, partition_records[0].offset)
+
+        with poller.lock:
+            rewind.update(self._prefetch_offsets)
+            self._prefetch_offsets = {}
+            if not self._consumer or not rewind:
+                return
+            assigned = self._consumer.assignment()
+            for topic_partition, offset in rewind.items():
+                if topic_partition in assigned:
+                    self._consumer.seek(topic_partition, offset)
+
+    def _on_prefetch_revoked(self, revoked: Set[TopicPartition]) -> None:
+        """Commit handled messages of partitions about to be revoked.
+
+        Runs on the prefetch thread while it holds the consumer lock.
+        """
+        offsets = {
+            tp: self._prefetch_offsets.pop(tp)
+            for tp in list(self._prefetch_offsets)
+            if tp in revoked
+        }
+        try:
+            if self._commit_manager:
+                self._commit_manager.flush()
+            else:
+                self._commit_offsets(offsets)
+        except ConsumerError as e:
+            self.logger.warning("Commit before rebalance failed: %s", e)
+
+    def consume_batches(
+        self,
+        timeout_ms: int = 1000,
+        max_batches: Optional[int] = None,
+        max_records: Optional[int] = None,
+    ) -> Generator[MessageBatch, None, None]:
+        """Consume poll results as columnar batches.
+
+        Each non-empty ``poll()`` is yielded as one MessageBatch holding a
+        PartitionBatch per partition. Offsets, timestamps, keys and values
+        are exposed as parallel columns built on first access, so no
+        per-message dictionary is allocated unless requested.
+
+        Args:
+            timeout_ms: Poll timeout in milliseconds
+            max_batches: Maximum batches to yield (None for infinite)
+            max_records: Maximum records per poll (defaults to max_poll_records)
+
+        Yields:
+            MessageBatch for each non-empty poll
+
+        Raises:
+            ConsumerError: If consumption fails
+        """
+        batch_count = 0
+
+        try:
+            self.logger.info(
+                "Starting to consume batches from topic: %s, timeout: %dms",
+                self.topic,
+                timeout_ms,
+            )
+
+            while max_batches is None or batch_count < max_batches:
+                try:
+                    messages = self._poll(timeout_ms, max_records)
+                except LibKafkaError as e:
+                    error_msg = f"Error during consumption: {str(e)}"
+                    self.logger.error(error_msg)
+                    raise ConsumerError(error_msg)
+
+                if not messages:
+                    if self._commit_manager:
+                        self._commit_manager.maybe_commit()
+                    continue
+
+                batch = MessageBatch(
+                    {
+                        topic_partition: PartitionBatch(
+                            topic_partition.topic,
+                            topic_partition.partition,
+                            records,
+                            self._decode_value,
+                        )
+                        for topic_partition, records in messages.items()
+                        if records
+                    }
+                )
+                batch_count += 1
+                yield batch
+
+                if self._commit_manager:
+                    for topic_partition, partition_batch in batch.partitions.items():
+                        self._commit_manager.track(
+                            topic_partition,
+                            partition_batch.next_offset - 1,
+                            count=len(partition_batch),
+                        )
+                    self._commit_manager.maybe_commit()
+
+        except GeneratorExit:
+            self.logger.info("Consumer stopped, received %d batches", batch_count)
+        except ConsumerError:
+            raise
+        except Exception as e:
+            error_msg = f"Unexpected error during consumption: {str(e)}"
+            self.logger.error(error_msg)
+            raise ConsumerError(error_msg)
+
+    def process_parallel(
+        self,
+        handler: Callable[[Dict[str, Any]], Any],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+        timeout_ms: int = 1000,
+        max_messages: Optional[int] = None,
+        max_pending_per_partition: int = 10000,
+        before_commit: Optional[Callable[[], Dict[TopicPartition, int]]] = None,
+    ) -> int:
+        """Process messages with a worker pool, one ordered lane per partition.
+
+        Partitions are processed in parallel while records of a partition
+        are handled strictly in offset order. After every poll the highest
+        contiguous processed offset of each partition is committed, so a
+        crash only redelivers unprocessed records (at-least-once). Partitions
+        whose backlog exceeds ``max_pending_per_partition`` are paused until
+        their lane catches up.
+
+        ``before_commit`` is called before every commit and returns offsets
+        that must not be committed yet, e.g. ``DeadLetterRouter.flush`` with
+        the messages it failed to forward. Commits of those partitions stay
+        at the returned offset for the rest of the run, so the messages are
+        redelivered after a restart or rebalance.
+
+        Args:
+            handler: Callable invoked with each message dictionary; must be
+                a module-level function when use_processes is set
+            max_workers: Number of worker threads or processes
+            use_processes: Use a process pool instead of a thread pool
+            timeout_ms: Poll timeout in milliseconds
+            max_messages: Stop after this many messages (None for infinite)
+            max_pending_per_partition: Backlog size that pauses a partition
+            before_commit: Callable returning the lowest offset per partition
+                that must be redelivered
+
+        Returns:
+            Number of messages handed to the pool
+
+        Raises:
+            ConsumerError: If auto-commit is enabled, a handler fails, or
+                consumption fails
+        """
+        if self.config.enable_auto_commit:
+            raise ConsumerError(
+                "process_parallel requires enable_auto_commit=False to keep "
+                "at-least-once semantics"
+            )
+
+        pool = PartitionWorkerPool(handler, max_workers, use_processes)
+        paused = set()
+        held: Dict[TopicPartition, int] = {}
+        message_count = 0
+
+        self.logger.info(
+            "Starting parallel processing of topic: %s, workers: %s",
+            self.topic,
+            max_workers,
+        )
+
+        try:
+            while max_messages is None or message_count < max_messages:
+                try:
+                    messages = self._poll(timeout_ms)
+                except LibKafkaError as e:
+                    error_msg = f"Error during consumption: {str(e)}"
+                    self.logger.error(error_msg)
+                    raise ConsumerError(error_msg)
+
+                for topic_partition, records in messages.items():
+                    if max_messages is not None:
+                        remaining = max_messages - message_count
+                        if len(records) > remaining:
+                            # Rewind so records past the limit are polled again
+                            self._consumer.seek(
+                                topic_partition, records[remaining].offset
+                            )
+                            records = records[:remaining]
+                        if not records:
+                            continue
+                    batch = PartitionBatch(
+                        topic_partition.topic,
+                        topic_partition.partition,
+                        records,
+                        self._decode_value,
+                    )
+                    pool.submit(topic_partition, list(batch.messages()))
+                    message_count += len(records)
+
+                for topic_partition in set(messages) | paused:
+                    backlog = pool.pending(topic_partition)
+                    if topic_partition not in paused:
+                        if backlog > max_pending_per_partition:
+                            self._consumer.pause(topic_partition)
+                            paused.add(topic_partition)
+                    elif backlog <= max_pending_per_partition // 2:
+                        self._consumer.resume(topic_partition)
+                        paused.discard(topic_partition)
+
+                self._commit_processed(pool, before_commit, held)
+                self._raise_on_worker_errors(pool)
+
+            pool.wait_idle()
+            self._commit_processed(pool, before_commit, held)
+            self._raise_on_worker_errors(pool)
+
+        finally:
+            pool.shutdown(wait=True)
+            if paused and self._consumer:
+                self._consumer.resume(*paused)
+
+        self.logger.info("Parallel processing finished, %d messages", message_count)
+        return message_count
+
+    def _commit_processed(
+        self,
+        pool: PartitionWorkerPool,
+        before_commit: Optional[Callable[[], Dict[TopicPartition, int]]],
+        held: Dict[TopicPartition, int],
+    ) -> None:
+        """Commit processed offsets of the pool, capped at held-back offsets.
+
+        Args:
+            pool: Worker pool of process_parallel
+            before_commit: Callable returning offsets to hold back, or None
+            held: Held-back offset per partition; updated in place
+
+        Raises:
+            ConsumerError: If committing fails
+        """
+        offsets = pool.committable_offsets()
+        if before_commit is not None:
+            for topic_partition, offset in before_commit().items():
+                held[topic_partition] = min(offset, held.get(topic_partition, offset))
+        for topic_partition, offset in held.items():
+            if topic_partition in offsets:
+                offsets[topic_partition] = min(offsets[topic_partition], offset)
+        self._commit_offsets(offsets)
+
+    def _poll(
+        self, timeout_ms: int, max_records: Optional[int] = None
+    ) -> Dict[TopicPartition, List[Any]]:
+        """Poll the consumer, recording latency, throughput and lag.
+
+        With ``adaptive_poll`` enabled and no explicit ``max_records``, the
+        record limit and timeout are chosen from the tracked lag.
+
+        Args:
+            timeout_ms: Poll timeout in milliseconds
+            max_records: Maximum records to return (None for config default)
+
+        Returns:
+            Mapping of TopicPartition to records
+
+        Raises:
+            KafkaError: If the underlying poll fails
+            ConsumerError: If lag cannot be refreshed
+        """
+        if self._poll_sizer is not None and max_records is None:
+            self._lag_tracker.maybe_refresh()
+            max_records, timeout_ms = self._poll_sizer.next(
+                self._lag_tracker.total(), timeout_ms
+            )
+
+        started = time.perf_counter()
+        if max_records is None:
+            messages = self._consumer.poll(timeout_ms=timeout_ms)
+        else:
+            messages = self._consumer.poll(
+                timeout_ms=timeout_ms, max_records=max_records
+            )
+        self._metrics.poll_latency.labels(self.topic).observe(
+            time.perf_counter() - started
+        )
+        self._record_poll(messages)
+        if self._poll_sizer is not None:
+            self._lag_tracker.advance(messages)
+        return messages
+
+    def _mark_consumed(self, topic_partition: TopicPartition, offset: int) -> None:
+        """Track a handled record for the commit manager and commit if due.
+
+        Caller must own the consumer.
+
+        Args:
+            topic_partition: Partition of the record
+            offset: Offset of the record
+
+        Raises:
+            ConsumerError: If a synchronous commit fails
+        """
+        if self._commit_manager:
+            self._commit_manager.track(topic_partition, offset)
+            self._commit_manager.maybe_commit()
+
+    def _maybe_commit(self) -> None:
+        """Commit pending offsets if the commit manager's interval elapsed.
+
+        Raises:
+            ConsumerError: If a synchronous commit fails
+        """
+        if self._commit_manager:
+            self._commit_manager.maybe_commit()
+
+    def _record_poll(self, messages: Dict[TopicPartition, List[Any]]) -> None:
+        """Record message counts and per-partition lag of a poll result.
+
+        Lag is the distance from the high watermark of the last fetch to the
+        offset after the newest polled record. Caller must own the consumer.
+        """
+        if not messages:
+            return
+
+        total = 0
+        for topic_partition, records in messages.items():
+            if not records:
+                continue
+            total += len(records)
+            self._metrics.messages.labels(topic_partition.topic).inc(len(records))
+            highwater = self._consumer.highwater(topic_partition)
+            if isinstance(highwater, int):
+                self._metrics.lag.labels(
+                    topic_partition.topic, topic_partition.partition
+                ).set(max(0, highwater - records[-1].offset - 1))
+        self._metrics.poll_records.labels(self.topic).observe(total)
+
+    def _commit_offsets(self, offsets: Dict[TopicPartition, int]) -> None:
+        """Synchronously commit explicit offsets for assigned partitions.
+
+        Args:
+            offsets: Mapping of TopicPartition to next offset to consume
+
+        Raises:
+            ConsumerError: If commit fails
+        """
+        if not offsets:
+            return
+
+        assigned = self._consumer.assignment()
+        commit = {
+            tp: offset_and_metadata(offset)
+            for tp, offset in offsets.items()
+            if tp in assigned
+        }
+        if not commit:
+            return
+
+        try:
+            started = time.perf_counter()
+            self._consumer.commit(offsets=commit)
+            self._commit_latency.observe(time.perf_counter() - started)
+        except LibKafkaError as e:
+            error_msg = f"Failed to commit offsets: {str(e)}"
+            self.logger.error(error_msg)
+            raise ConsumerError(error_msg)
+
+    @staticmethod
+    def _raise_on_worker_errors(pool: PartitionWorkerPool) -> None:
+        """Raise ConsumerError if any partition lane failed.
+
+        Args:
+            pool: Worker pool to check
+
+        Raises:
+            ConsumerError: If a handler failed
+        """
+        errors = pool.errors()
+        if errors:
+            details = ", ".join(
+                f"{tp.topic}:{tp.partition}: {error}" for tp, error in errors.items()
+            )
+            raise ConsumerError(f"Message handler failed: {details}")
+
+    def lag(self, refresh: bool = True) -> Dict[TopicPartition, int]:
+        """Get how many records each assigned partition is behind.
+
+        Args:
+            refresh: Fetch end offsets now instead of returning the values
+                of the last refresh
+
+        Returns:
+            Mapping of TopicPartition to number of unconsumed records
+
+        Raises:
+            ConsumerError: If end offsets cannot be fetched
+        """
+        if not refresh:
+            return self._lag_tracker.lag()
+        if self._prefetcher:
+            with self._prefetcher.lock:
+                return self._lag_tracker.refresh()
+        return self._lag_tracker.refresh()
+
+    def group_metadata(self) -> Any:
+        """Get consumer group metadata for transactional offset commits.
+
+        Returns:
+            ConsumerGroupMetadata when the client supports it, else group_id
+        """
+        group_metadata = getattr(self._consumer, "group_metadata", None)
+        return group_metadata() if group_metadata else self.group_id
 
     def seek_to_beginning(self) -> None:
         """Seek to beginning of all partitions.
@@ -252,12 +883,22 @@ class KafkaConsumerService:
     def commit(self) -> None:
         """Commit current offset.
 
+        While prefetching, the offsets of messages already yielded are
+        committed instead of the fetch position.
+
         Raises:
             ConsumerError: If commit fails
         """
+        if self._prefetcher:
+            with self._prefetcher.lock:
+                self._commit_offsets(dict(self._prefetch_offsets))
+            return
+
         try:
             self.logger.debug("Committing current offset")
+            started = time.perf_counter()
             self._consumer.commit()
+            self._commit_latency.observe(time.perf_counter() - started)
             self.logger.info("Offset committed successfully")
 
         except LibKafkaError as e:
@@ -269,7 +910,11 @@ class KafkaConsumerService:
         """Close consumer connection."""
         try:
             self.logger.info("Closing KafkaConsumer")
+            self._stop_prefetch()
             if self._consumer:
+                if self._commit_manager:
+                    self._commit_manager.flush()
+                    self._commit_manager = None
                 self._consumer.close()
                 self._consumer = None
             self.logger.info("KafkaConsumer closed successfully")
@@ -284,4 +929,3 @@ class KafkaConsumerService:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
-
@@ -0,0 +1,244 @@
+"""Bounded delivery buffer for fire-and-forget producer sends."""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from .exceptions import ProducerError
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_RAISE = "raise"
+
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_RAISE)
+
+
+class PendingRecord(NamedTuple):
+    """Record waiting in the delivery buffer."""
+
+    topic: str
+    value: Any
+    key: Optional[Any]
+    on_success: Optional[Callable[[Dict[str, Any]], None]]
+    on_error: Optional[Callable[[Exception], None]]
+    headers: Optional[List[Tuple[str, bytes]]] = None
+
+
+class DeliveryBuffer:
+    """Queue records in memory and hand them to the producer in the background.
+
+    Callers never wait for broker acknowledgements. The backlog of records
+    not yet handed to the producer is bounded by ``max_pending``; when it is
+    full, ``overflow_policy`` decides whether the caller blocks, the oldest
+    queued record is dropped, or ``ProducerError`` is raised. A dispatcher
+    thread keeps at most ``max_in_flight`` records unacknowledged.
+
+    Delivery callbacks run on the producer I/O thread and should return
+    quickly.
+    """
+
+    def __init__(
+        self,
+        send: Callable[..., Any],
+        to_result: Callable[[Any], Dict[str, Any]],
+        max_pending: int = 10000,
+        max_in_flight: int = 1000,
+        overflow_policy: str = OVERFLOW_BLOCK,
+        block_timeout_ms: int = 10000,
+    ):
+        """Initialize delivery buffer.
+
+        Args:
+            send: Producer send callable returning a future
+            to_result: Converts record metadata to the result passed to on_success
+            max_pending: Maximum records queued but not yet handed to the producer
+            max_in_flight: Maximum records handed over but not yet acknowledged
+            overflow_policy: One of 'block', 'drop_oldest' or 'raise'
+            block_timeout_ms: How long 'block' waits for space before raising
+
+        Raises:
+            ProducerError: If the configuration is invalid
+        """
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ProducerError(
+                f"Unknown overflow policy '{overflow_policy}', "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+        if max_pending < 1 or max_in_flight < 1:
+            raise ProducerError("max_pending and max_in_flight must be at least 1")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._send = send
+        self._to_result = to_result
+        self.max_pending = max_pending
+        self.max_in_flight = max_in_flight
+        self.overflow_policy = overflow_policy
+        self.block_timeout_ms = block_timeout_ms
+
+        self._backlog: Deque[PendingRecord] = deque()
+        self._in_flight = 0
+        self._dispatching = 0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._stats = {"queued": 0, "delivered": 0, "failed": 0, "dropped": 0}
+
+        self._thread = threading.Thread(
+            target=self._dispatch_loop, name="kafka-delivery", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, record: PendingRecord) -> None:
+        """Queue a record for delivery.
+
+        Args:
+            record: Record to deliver
+
+        Raises:
+            ProducerError: If the buffer is closed, full under the 'raise'
+                policy, or still full after the 'block' timeout
+        """
+        dropped = None
+
+        with self._cond:
+            if self._closed:
+                raise ProducerError("Delivery buffer is closed")
+
+            if len(self._backlog) >= self.max_pending:
+                if self.overflow_policy == OVERFLOW_RAISE:
+                    raise ProducerError(
+                        f"Delivery backlog full ({self.max_pending} records)"
+                    )
+                if self.overflow_policy == OVERFLOW_DROP_OLDEST:
+                    dropped = self._backlog.popleft()
+                    self._stats["dropped"] += 1
+                elif not self._cond.wait_for(
+                    lambda: len(self._backlog) < self.max_pending or self._closed,
+                    timeout=self.block_timeout_ms / 1000,
+                ):
+                    raise ProducerError(
+                        f"Delivery backlog still full after "
+                        f"{self.block_timeout_ms}ms"
+                    )
+                elif self._closed:
+                    raise ProducerError("Delivery buffer is closed")
+
+            self._backlog.append(record)
+            self._stats["queued"] += 1
+            self._cond.notify_all()
+
+        if dropped is not None:
+            self._notify_error(
+                dropped,
+                ProducerError(f"Record for {dropped.topic} dropped from full backlog"),
+            )
+
+    def stats(self) -> Dict[str, int]:
+        """Get delivery counters without flushing.
+
+        Returns:
+            Dictionary with queued, delivered, failed, dropped, backlog
+            and in_flight counts
+        """
+        with self._cond:
+            stats = dict(self._stats)
+            stats["backlog"] = len(self._backlog)
+            stats["in_flight"] = self._in_flight
+        return stats
+
+    def wait_until_dispatched(self, timeout_ms: int) -> bool:
+        """Wait until every queued record has been handed to the producer.
+
+        Args:
+            timeout_ms: Maximum time to wait
+
+        Returns:
+            True if the backlog drained and no record is still being handed
+            over in time
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._backlog and not self._dispatching,
+                timeout=timeout_ms / 1000,
+            )
+
+    def close(self, timeout_ms: int = 10000) -> None:
+        """Stop accepting records and dispatch what is left in the backlog.
+
+        Args:
+            timeout_ms: Maximum time to wait for the dispatcher thread
+
+        Raises:
+            ProducerError: If the dispatcher thread is still sending after
+                the timeout
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._thread.join(timeout=timeout_ms / 1000)
+        if self._thread.is_alive():
+            error_msg = f"Delivery dispatcher still running after {timeout_ms}ms"
+            self.logger.error(error_msg)
+            raise ProducerError(error_msg)
+
+    def _dispatch_loop(self) -> None:
+        """Hand queued records to the producer while the in-flight window allows."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._closed
+                    or (self._backlog and self._in_flight < self.max_in_flight)
+                )
+                if not self._backlog:
+                    return
+                record = self._backlog.popleft()
+                self._in_flight += 1
+                self._dispatching += 1
+                self._cond.notify_all()
+
+            try:
+                future = self._send(
+                    record.topic,
+                    value=record.value,
+                    key=record.key,
+                    headers=record.headers,
+                )
+                future.add_callback(self._on_delivered, record)
+                future.add_errback(self._on_failed, record)
+            except Exception as e:
+                self._on_failed(record, e)
+            finally:
+                with self._cond:
+                    self._dispatching -= 1
+                    self._cond.notify_all()
+
+    def _on_delivered(self, record: PendingRecord, record_metadata: Any) -> None:
+        """Record a successful delivery and invoke the success callback."""
+        with self._cond:
+            self._in_flight -= 1
+            self._stats["delivered"] += 1
+            self._cond.notify_all()
+
+        if record.on_success is not None:
+            try:
+                record.on_success(self._to_result(record_metadata))
+            except Exception:
+                self.logger.exception("Delivery success callback raised")
+
+    def _on_failed(self, record: PendingRecord, error: Exception) -> None:
+        """Record a failed delivery and invoke the error callback."""
+        with self._cond:
+            self._in_flight -= 1
+            self._stats["failed"] += 1
+            self._cond.notify_all()
+
+        self.logger.error("Failed to deliver message to %s: %s", record.topic, error)
+        self._notify_error(record, error)
+
+    def _notify_error(self, record: PendingRecord, error: Exception) -> None:
+        """Invoke the error callback of a record, if any."""
+        if record.on_error is not None:
+            try:
+                record.on_error(error)
+            except Exception:
+                self.logger.exception("Delivery error callback raised")
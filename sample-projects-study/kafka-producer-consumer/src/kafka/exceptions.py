@@ -19,6 +19,12 @@ class ConsumerError(KafkaError):
     pass
 
 
+class SerializationError(KafkaError):
+    """Exception raised when a value cannot be serialized or deserialized."""
+
+    pass
+
+
 class MessageValidationError(KafkaError):
     """Exception raised when message validation fails."""
 
@@ -0,0 +1,995 @@
+"""In-process stand-in for a Kafka cluster, for benchmarks and tests.
+
+``FakeKafkaProducer`` mirrors the parts of the kafka-python producer API the
+services use and models its batching: records accumulate per partition
+until ``batch_size`` bytes or ``linger_ms`` is reached, batches are
+compressed with ``compression_type`` and at most
+``max_in_flight_requests_per_connection`` produce requests are outstanding.
+Each request costs ``FakeBroker.request_latency_ms``, so tuning settings
+shows up in throughput the same way it does against a real cluster.
+
+``FakeKafkaConsumer`` covers the consumer API the services use: group
+subscription with rebalances, poll, positions, seeks, pause/resume and
+committed offsets stored per group on the broker.
+"""
+
+import gzip
+import itertools
+import random
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, NamedTuple, Optional, Tuple
+
+from kafka import TopicPartition
+from kafka.errors import IllegalStateError, KafkaTimeoutError
+
+from .commit import offset_and_metadata
+from .config import KafkaConfig
+from .consumer import KafkaConsumerService
+from .partitioner import murmur2, to_positive
+from .producer import KafkaProducerService
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # pragma: no cover - optional dependency
+    lz4_frame = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+try:
+    import snappy
+except ImportError:  # pragma: no cover - optional dependency
+    snappy = None
+
+
+class FakeConsumerRecord(NamedTuple):
+    """Record returned by FakeKafkaConsumer.poll."""
+
+    topic: str
+    partition: int
+    offset: int
+    timestamp: int
+    key: Any
+    value: Any
+    headers: List[Tuple[str, bytes]]
+
+
+class FakeRecordMetadata(NamedTuple):
+    """Acknowledgement of a produced record."""
+
+    topic: str
+    partition: int
+    offset: int
+    timestamp: int
+
+
+class StoredRecord(NamedTuple):
+    """Record appended to a partition log."""
+
+    offset: int
+    timestamp: int
+    key: Optional[bytes]
+    value: Optional[bytes]
+    headers: List[Tuple[str, bytes]]
+
+
+def _compressor(
+    compression_type: Optional[str],
+) -> Optional[Callable[[bytes], bytes]]:
+    """Get the compression function for a codec name.
+
+    Args:
+        compression_type: None, 'gzip', 'lz4', 'zstd' or 'snappy'
+
+    Returns:
+        Compression function, or None for no compression
+
+    Raises:
+        ValueError: If the codec is unknown or its library is missing
+    """
+    if compression_type in (None, "none"):
+        return None
+    if compression_type == "gzip":
+        return gzip.compress
+    if compression_type == "lz4" and lz4_frame is not None:
+        return lz4_frame.compress
+    if compression_type == "zstd" and zstandard is not None:
+        return zstandard.ZstdCompressor().compress
+    if compression_type == "snappy" and snappy is not None:
+        return snappy.compress
+    raise ValueError(f"Compression codec '{compression_type}' is not available")
+
+
+class FakeBroker:
+    """In-memory cluster holding partitioned topic logs and group offsets.
+
+    Consumer groups get a range assignment of partitions across their
+    members; every join or leave bumps the group generation, which members
+    notice on their next poll and treat as a rebalance.
+    """
+
+    def __init__(
+        self,
+        num_partitions: int = 3,
+        request_latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+    ):
+        """Initialize fake broker.
+
+        Args:
+            num_partitions: Partition count for auto-created topics
+            request_latency_ms: Simulated round trip of every produce,
+                fetch and commit request
+            latency_jitter_ms: Uniform random jitter added to each round trip
+        """
+        self.num_partitions = num_partitions
+        self.request_latency_ms = request_latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self._topics: Dict[str, List[List[StoredRecord]]] = {}
+        self._groups: Dict[str, Dict[str, Any]] = {}
+        self._aborted: set = set()
+        self._cond = threading.Condition()
+        self.stats = {
+            "produce_requests": 0,
+            "fetch_requests": 0,
+            "records": 0,
+            "bytes_in": 0,
+            "compressed_bytes_in": 0,
+            "bytes_out": 0,
+        }
+
+    def simulate_latency(self) -> None:
+        """Sleep for one simulated request round trip."""
+        delay = self.request_latency_ms
+        if self.latency_jitter_ms:
+            delay += random.uniform(0, self.latency_jitter_ms)
+        if delay:
+            time.sleep(delay / 1000)
+
+    def create_topic(self, topic: str, num_partitions: Optional[int] = None) -> None:
+        """Create a topic if it does not exist yet.
+
+        Args:
+            topic: Topic name
+            num_partitions: Partition count (defaults to broker setting)
+        """
+        with self._cond:
+            if topic not in self._topics:
+                self._topics[topic] = [
+                    [] for _ in range(num_partitions or self.num_partitions)
+                ]
+
+    def partitions_for(self, topic: str) -> set:
+        """Get partition ids of a topic, creating it if needed.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Set of partition ids
+        """
+        self.create_topic(topic)
+        return set(range(len(self._topics[topic])))
+
+    def append(
+        self,
+        topic: str,
+        partition: int,
+        records: List[Tuple[Optional[bytes], Optional[bytes], List, int]],
+        raw_bytes: int,
+        compressed_bytes: int,
+    ) -> int:
+        """Append a batch to a partition log.
+
+        Args:
+            topic: Topic name
+            partition: Partition id
+            records: (key, value, headers, timestamp) tuples
+            raw_bytes: Uncompressed batch size
+            compressed_bytes: Batch size on the wire
+
+        Returns:
+            Offset of the first appended record
+        """
+        self.create_topic(topic)
+        with self._cond:
+            log = self._topics[topic][partition]
+            base_offset = len(log)
+            for delta, (key, value, headers, timestamp) in enumerate(records):
+                log.append(
+                    StoredRecord(base_offset + delta, timestamp, key, value, headers)
+                )
+            self.stats["produce_requests"] += 1
+            self.stats["records"] += len(records)
+            self.stats["bytes_in"] += raw_bytes
+            self.stats["compressed_bytes_in"] += compressed_bytes
+            self._cond.notify_all()
+        return base_offset
+
+    def fetch(
+        self, topic: str, partition: int, offset: int, max_records: int
+    ) -> List[StoredRecord]:
+        """Read records from a partition log starting at an offset.
+
+        Args:
+            topic: Topic name
+            partition: Partition id
+            offset: First offset to read
+            max_records: Maximum records to return
+
+        Returns:
+            Stored records in offset order
+        """
+        with self._cond:
+            records = self._topics[topic][partition][offset : offset + max_records]
+            self.stats["fetch_requests"] += 1
+            self.stats["bytes_out"] += sum(
+                len(r.key or b"") + len(r.value or b"") for r in records
+            )
+        return records
+
+    def end_offset(self, topic: str, partition: int) -> int:
+        """Get the offset the next appended record will receive."""
+        self.create_topic(topic)
+        with self._cond:
+            return len(self._topics[topic][partition])
+
+    def wait_for_data(self, timeout: float) -> None:
+        """Block until a record is appended anywhere or timeout expires."""
+        with self._cond:
+            self._cond.wait(timeout)
+
+    def abort(self, records: List[Tuple[str, int, int]]) -> None:
+        """Mark records of an aborted transaction.
+
+        Args:
+            records: (topic, partition, offset) tuples
+        """
+        with self._cond:
+            self._aborted.update(records)
+
+    def is_aborted(self, topic: str, partition: int, offset: int) -> bool:
+        """Whether a record belongs to an aborted transaction."""
+        return (topic, partition, offset) in self._aborted
+
+    def log(self, topic: str, partition: int) -> List[StoredRecord]:
+        """Get a copy of a partition log.
+
+        Args:
+            topic: Topic name
+            partition: Partition id
+
+        Returns:
+            Stored records in offset order
+        """
+        with self._cond:
+            partitions = self._topics.get(topic)
+            return list(partitions[partition]) if partitions else []
+
+    def join_group(self, group_id: str, member_id: str, topics: List[str]) -> None:
+        """Add a member to a consumer group and trigger a rebalance."""
+        for topic in topics:
+            self.create_topic(topic)
+        with self._cond:
+            group = self._group(group_id)
+            group["members"][member_id] = list(topics)
+            group["generation"] += 1
+
+    def leave_group(self, group_id: str, member_id: str) -> None:
+        """Remove a member from a consumer group and trigger a rebalance."""
+        with self._cond:
+            group = self._group(group_id)
+            if group["members"].pop(member_id, None) is not None:
+                group["generation"] += 1
+
+    def assignment(
+        self, group_id: str, member_id: str
+    ) -> Tuple[int, List[Tuple[str, int]]]:
+        """Get the range assignment of a group member.
+
+        Returns:
+            Tuple of group generation and assigned (topic, partition) pairs
+        """
+        with self._cond:
+            group = self._group(group_id)
+            members = sorted(group["members"])
+            assigned = []
+            if member_id in group["members"]:
+                topics = sorted(
+                    {t for member in members for t in group["members"][member]}
+                )
+                for topic in topics:
+                    subscribers = [m for m in members if topic in group["members"][m]]
+                    if member_id not in subscribers:
+                        continue
+                    partitions = len(self._topics[topic])
+                    index = subscribers.index(member_id)
+                    share, extra = divmod(partitions, len(subscribers))
+                    start = index * share + min(index, extra)
+                    count = share + (1 if index < extra else 0)
+                    assigned.extend(
+                        (topic, partition) for partition in range(start, start + count)
+                    )
+            return group["generation"], assigned
+
+    def commit_offsets(
+        self, group_id: str, offsets: Dict[Tuple[str, int], int]
+    ) -> None:
+        """Store committed offsets of a consumer group."""
+        with self._cond:
+            self._group(group_id)["offsets"].update(offsets)
+
+    def committed(self, group_id: str, topic: str, partition: int) -> Optional[int]:
+        """Get the committed offset of a group for a partition."""
+        with self._cond:
+            return self._group(group_id)["offsets"].get((topic, partition))
+
+    def _group(self, group_id: str) -> Dict[str, Any]:
+        """Get or create group state. Caller must hold the lock."""
+        group = self._groups.get(group_id)
+        if group is None:
+            group = self._groups[group_id] = {
+                "members": {},
+                "generation": 0,
+                "offsets": {},
+            }
+        return group
+
+
+class FakeFuture:
+    """Minimal stand-in for kafka-python's FutureRecordMetadata."""
+
+    def __init__(self):
+        """Initialize unresolved future."""
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Tuple[Callable, tuple]] = []
+        self._errbacks: List[Tuple[Callable, tuple]] = []
+        self.value: Any = None
+        self.exception: Optional[Exception] = None
+
+    def is_done(self) -> bool:
+        """Whether the future is resolved."""
+        return self._event.is_set()
+
+    def success(self, value: Any) -> None:
+        """Resolve with a value and run callbacks."""
+        with self._lock:
+            self.value = value
+            self._event.set()
+            callbacks = self._callbacks
+        for fn, args in callbacks:
+            fn(*args, value)
+
+    def failure(self, error: Exception) -> None:
+        """Resolve with an error and run errbacks."""
+        with self._lock:
+            self.exception = error
+            self._event.set()
+            errbacks = self._errbacks
+        for fn, args in errbacks:
+            fn(*args, error)
+
+    def add_callback(self, fn: Callable, *args) -> "FakeFuture":
+        """Register a success callback."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append((fn, args))
+                return self
+        if self.exception is None:
+            fn(*args, self.value)
+        return self
+
+    def add_errback(self, fn: Callable, *args) -> "FakeFuture":
+        """Register a failure callback."""
+        with self._lock:
+            if not self._event.is_set():
+                self._errbacks.append((fn, args))
+                return self
+        if self.exception is not None:
+            fn(*args, self.exception)
+        return self
+
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the result.
+
+        Raises:
+            KafkaTimeoutError: If the future is not resolved in time
+        """
+        if not self._event.wait(timeout):
+            raise KafkaTimeoutError(f"Timeout after waiting for {timeout} secs.")
+        if self.exception is not None:
+            raise self.exception
+        return self.value
+
+
+class _ProducerBatch:
+    """Records accumulated for one partition."""
+
+    def __init__(self, topic: str, partition: int):
+        self.topic = topic
+        self.partition = partition
+        self.records: List[Tuple[Optional[bytes], Optional[bytes], List, int]] = []
+        self.futures: List[FakeFuture] = []
+        self.sent_at: List[float] = []
+        self.size = 0
+        self.created = time.monotonic()
+
+
+class FakeKafkaProducer:
+    """Producer client writing to a FakeBroker with kafka-python style batching."""
+
+    def __init__(self, broker: FakeBroker, **configs: Any):
+        """Initialize fake producer.
+
+        Args:
+            broker: Broker to write to
+            **configs: KafkaProducer keyword arguments; key_serializer,
+                value_serializer, linger_ms, batch_size, buffer_memory,
+                compression_type, max_in_flight_requests_per_connection,
+                max_block_ms and transactional_id are honoured, the rest is
+                ignored
+        """
+        self.broker = broker
+        self._transactional_id = configs.get("transactional_id")
+        self._transaction: Optional[Dict[str, Any]] = None
+        self._key_serializer = configs.get("key_serializer")
+        self._value_serializer = configs.get("value_serializer")
+        self._linger = (configs.get("linger_ms") or 0) / 1000
+        self._batch_size = configs.get("batch_size") or 16384
+        self._buffer_memory = configs.get("buffer_memory") or 33554432
+        self._max_block = configs.get("max_block_ms", 60000) / 1000
+        self._compress = _compressor(configs.get("compression_type"))
+
+        self._batches: Dict[Tuple[str, int], _ProducerBatch] = {}
+        self._ready: Deque[_ProducerBatch] = deque()
+        self._buffered = 0
+        self._unacked = 0
+        self._flushing = 0
+        self._closed = False
+        self._round_robin = itertools.count()
+        self._cond = threading.Condition()
+        self.ack_latencies: List[float] = []
+
+        self._requests = ThreadPoolExecutor(
+            max_workers=configs.get("max_in_flight_requests_per_connection") or 5,
+            thread_name_prefix="fake-kafka-request",
+        )
+        self._sender = threading.Thread(
+            target=self._sender_loop, name="fake-kafka-sender", daemon=True
+        )
+        self._sender.start()
+
+    def partitions_for(self, topic: str) -> set:
+        """Get partition ids of a topic."""
+        return self.broker.partitions_for(topic)
+
+    def send(
+        self,
+        topic: str,
+        value: Any = None,
+        key: Any = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+        partition: Optional[int] = None,
+        timestamp_ms: Optional[int] = None,
+    ) -> FakeFuture:
+        """Append a record to the partition batch.
+
+        Returns:
+            Future resolving to FakeRecordMetadata
+
+        Raises:
+            KafkaTimeoutError: If buffer_memory stays exhausted for max_block_ms
+            IllegalStateError: If transactional and no transaction is open
+        """
+        if self._transactional_id and self._transaction is None:
+            raise IllegalStateError("Cannot send without an open transaction")
+
+        key_bytes = self._key_serializer(key) if self._key_serializer else key
+        value_bytes = self._value_serializer(value) if self._value_serializer else value
+        headers = headers or []
+        size = (
+            len(key_bytes or b"")
+            + len(value_bytes or b"")
+            + sum(len(k) + len(v) for k, v in headers)
+        )
+
+        if partition is None:
+            partition = self._default_partition(topic, key_bytes)
+
+        future = FakeFuture()
+        timestamp = timestamp_ms or int(time.time() * 1000)
+
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._buffered + size <= self._buffer_memory or self._closed,
+                timeout=self._max_block,
+            ):
+                raise KafkaTimeoutError(
+                    f"Failed to allocate memory within {self._max_block * 1000}ms"
+                )
+
+            batch = self._batches.get((topic, partition))
+            if batch is None:
+                batch = self._batches[(topic, partition)] = _ProducerBatch(
+                    topic, partition
+                )
+            batch.records.append((key_bytes, value_bytes, headers, timestamp))
+            batch.futures.append(future)
+            batch.sent_at.append(time.perf_counter())
+            batch.size += size
+            self._buffered += size
+            self._unacked += 1
+
+            if batch.size >= self._batch_size:
+                self._ready.append(self._batches.pop((topic, partition)))
+            self._cond.notify_all()
+
+        if self._transaction is not None:
+            self._transaction["futures"].append(future)
+        return future
+
+    def init_transactions(self) -> None:
+        """Check that a transactional_id is configured."""
+        if not self._transactional_id:
+            raise IllegalStateError(
+                "Cannot call init_transactions without setting a transactional_id."
+            )
+
+    def begin_transaction(self) -> None:
+        """Open a transaction."""
+        if self._transaction is not None:
+            raise IllegalStateError("Transaction already in progress")
+        self._transaction = {"futures": [], "offsets": {}, "group_id": None}
+
+    def send_offsets_to_transaction(
+        self, offsets: Dict[TopicPartition, Any], group_metadata: Any
+    ) -> None:
+        """Add consumer offsets to the open transaction."""
+        if self._transaction is None:
+            raise IllegalStateError("No transaction in progress")
+        self._transaction["group_id"] = getattr(
+            group_metadata, "group_id", group_metadata
+        )
+        self._transaction["offsets"].update(offsets)
+
+    def commit_transaction(self) -> None:
+        """Flush the transaction's records and commit its offsets."""
+        if self._transaction is None:
+            raise IllegalStateError("No transaction in progress")
+        self.flush()
+        transaction, self._transaction = self._transaction, None
+        self.broker.simulate_latency()
+        if transaction["offsets"]:
+            self.broker.commit_offsets(
+                transaction["group_id"],
+                {
+                    (tp.topic, tp.partition): getattr(offset, "offset", offset)
+                    for tp, offset in transaction["offsets"].items()
+                },
+            )
+
+    def abort_transaction(self) -> None:
+        """Flush the transaction's records and mark them aborted."""
+        if self._transaction is None:
+            raise IllegalStateError("No transaction in progress")
+        self.flush()
+        transaction, self._transaction = self._transaction, None
+        self.broker.abort(
+            [
+                (future.value.topic, future.value.partition, future.value.offset)
+                for future in transaction["futures"]
+                if future.exception is None
+            ]
+        )
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Send all buffered records and wait for their acknowledgements.
+
+        Raises:
+            KafkaTimeoutError: If records are still unacknowledged after timeout
+        """
+        with self._cond:
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                if not self._cond.wait_for(lambda: self._unacked == 0, timeout):
+                    raise KafkaTimeoutError(
+                        f"Failed to flush buffered records within {timeout} secs"
+                    )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Flush outstanding records and stop background threads."""
+        self.flush(timeout)
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._sender.join(timeout)
+        self._requests.shutdown(wait=True)
+
+    def _default_partition(self, topic: str, key_bytes: Optional[bytes]) -> int:
+        """Pick a partition: key hash for keyed records, round robin otherwise."""
+        partitions = sorted(self.broker.partitions_for(topic))
+        if key_bytes is None:
+            return partitions[next(self._round_robin) % len(partitions)]
+        return partitions[to_positive(murmur2(key_bytes)) % len(partitions)]
+
+    def _sender_loop(self) -> None:
+        """Move batches whose linger expired to the request pool."""
+        while True:
+            with self._cond:
+                while not self._has_sendable():
+                    self._cond.wait(timeout=self._next_wakeup())
+                if self._closed and not self._batches and not self._ready:
+                    return
+                self._collect_expired()
+                batches = list(self._ready)
+                self._ready.clear()
+
+            for batch in batches:
+                self._requests.submit(self._send_request, batch)
+
+    def _has_sendable(self) -> bool:
+        """Whether a batch can be sent now. Caller must hold the lock."""
+        if self._ready or self._closed:
+            return True
+        if self._flushing and self._batches:
+            return True
+        now = time.monotonic()
+        return any(now - b.created >= self._linger for b in self._batches.values())
+
+    def _next_wakeup(self) -> Optional[float]:
+        """Seconds until the oldest batch lingers out. Caller must hold the lock."""
+        if not self._batches:
+            return None
+        oldest = min(b.created for b in self._batches.values())
+        return max(0.0, oldest + self._linger - time.monotonic())
+
+    def _collect_expired(self) -> None:
+        """Move lingered-out batches to the ready queue. Caller must hold the lock."""
+        now = time.monotonic()
+        for key, batch in list(self._batches.items()):
+            if self._flushing or self._closed or now - batch.created >= self._linger:
+                self._ready.append(self._batches.pop(key))
+
+    def _send_request(self, batch: _ProducerBatch) -> None:
+        """Compress a batch, wait out the request latency and append it."""
+        payload = b"".join(
+            (key or b"")
+            + (value or b"")
+            + b"".join(k.encode("utf-8") + v for k, v in headers)
+            for key, value, headers, _ in batch.records
+        )
+        compressed = len(self._compress(payload)) if self._compress else len(payload)
+
+        self.broker.simulate_latency()
+
+        base_offset = self.broker.append(
+            batch.topic, batch.partition, batch.records, batch.size, compressed
+        )
+
+        for delta, (future, record) in enumerate(zip(batch.futures, batch.records)):
+            future.success(
+                FakeRecordMetadata(
+                    batch.topic, batch.partition, base_offset + delta, record[3]
+                )
+            )
+
+        acked = time.perf_counter()
+        with self._cond:
+            self.ack_latencies.extend(acked - sent for sent in batch.sent_at)
+            self._buffered -= batch.size
+            self._unacked -= len(batch.records)
+            self._cond.notify_all()
+
+
+class FakeKafkaConsumer:
+    """Consumer client reading from a FakeBroker."""
+
+    def __init__(self, *topics: str, broker: FakeBroker, **configs: Any):
+        """Initialize fake consumer.
+
+        Args:
+            *topics: Topics to subscribe to
+            broker: Broker to read from
+            **configs: KafkaConsumer keyword arguments; group_id,
+                auto_offset_reset, enable_auto_commit, max_poll_records,
+                isolation_level, key_deserializer and value_deserializer are
+                honoured
+        """
+        self.broker = broker
+        self.group_id = configs.get("group_id") or f"fake-group-{uuid.uuid4()}"
+        self._auto_offset_reset = configs.get("auto_offset_reset", "latest")
+        self._enable_auto_commit = configs.get("enable_auto_commit", True)
+        self._max_poll_records = configs.get("max_poll_records") or 500
+        self._read_committed = configs.get("isolation_level") == "read_committed"
+        self._key_deserializer = configs.get("key_deserializer")
+        self._value_deserializer = configs.get("value_deserializer")
+
+        self._member_id = str(uuid.uuid4())
+        self._listener = None
+        self._generation: Optional[int] = None
+        self._assignment: set = set()
+        self._positions: Dict[TopicPartition, int] = {}
+        self._paused: set = set()
+        self._rotation = itertools.count()
+        self._closed = False
+
+        if topics:
+            self.subscribe(list(topics))
+
+    def subscribe(self, topics: List[str], listener: Any = None) -> None:
+        """Join the consumer group for the given topics.
+
+        Args:
+            topics: Topic names
+            listener: Optional ConsumerRebalanceListener
+        """
+        self._listener = listener
+        self.broker.join_group(self.group_id, self._member_id, topics)
+
+    def assignment(self) -> set:
+        """Get partitions currently assigned to this consumer."""
+        return set(self._assignment)
+
+    def poll(
+        self,
+        timeout_ms: int = 0,
+        max_records: Optional[int] = None,
+        update_offsets: bool = True,
+    ) -> Dict[TopicPartition, List[FakeConsumerRecord]]:
+        """Fetch records from assigned, non-paused partitions.
+
+        Returns:
+            Mapping of TopicPartition to records
+        """
+        self._ensure_open()
+        deadline = time.monotonic() + timeout_ms / 1000
+
+        while True:
+            self._maybe_rebalance()
+            records = self._fetch(max_records or self._max_poll_records)
+            remaining = deadline - time.monotonic()
+            if records or remaining <= 0:
+                break
+            self.broker.wait_for_data(min(remaining, 0.05))
+
+        if records:
+            self.broker.simulate_latency()
+            if self._enable_auto_commit:
+                self._store_offsets({tp: self._positions[tp] for tp in records})
+        return records
+
+    def position(self, partition: TopicPartition) -> int:
+        """Get the offset of the next record to fetch."""
+        self._maybe_rebalance()
+        if partition not in self._assignment:
+            raise IllegalStateError(f"Partition {partition} is not assigned")
+        return self._positions[partition]
+
+    def committed(self, partition: TopicPartition, metadata: bool = False) -> Any:
+        """Get the committed offset of the group for a partition."""
+        offset = self.broker.committed(
+            self.group_id, partition.topic, partition.partition
+        )
+        if offset is None or not metadata:
+            return offset
+        return offset_and_metadata(offset)
+
+    def end_offsets(
+        self, partitions: List[TopicPartition]
+    ) -> Dict[TopicPartition, int]:
+        """Get log end offsets of partitions."""
+        return {tp: self.broker.end_offset(tp.topic, tp.partition) for tp in partitions}
+
+    def highwater(self, partition: TopicPartition) -> Optional[int]:
+        """Get the high watermark seen by the last fetch of a partition."""
+        if partition not in self._assignment:
+            return None
+        return self.broker.end_offset(partition.topic, partition.partition)
+
+    def beginning_offsets(
+        self, partitions: List[TopicPartition]
+    ) -> Dict[TopicPartition, int]:
+        """Get log start offsets of partitions."""
+        return {tp: 0 for tp in partitions}
+
+    def seek(self, partition: TopicPartition, offset: int) -> None:
+        """Set the fetch position of a partition."""
+        self._positions[partition] = offset
+
+    def seek_to_beginning(self, *partitions: TopicPartition) -> None:
+        """Move fetch positions to the start of the logs."""
+        self._maybe_rebalance()
+        for tp in partitions or self._assignment:
+            self._positions[tp] = 0
+
+    def seek_to_end(self, *partitions: TopicPartition) -> None:
+        """Move fetch positions to the end of the logs."""
+        self._maybe_rebalance()
+        for tp in partitions or self._assignment:
+            self._positions[tp] = self.broker.end_offset(tp.topic, tp.partition)
+
+    def pause(self, *partitions: TopicPartition) -> None:
+        """Stop fetching from partitions."""
+        self._paused.update(partitions)
+
+    def resume(self, *partitions: TopicPartition) -> None:
+        """Resume fetching from partitions."""
+        self._paused.difference_update(partitions)
+
+    def paused(self) -> set:
+        """Get paused partitions."""
+        return set(self._paused)
+
+    def commit(self, offsets: Optional[Dict[TopicPartition, Any]] = None) -> None:
+        """Commit offsets, defaulting to current positions."""
+        self._ensure_open()
+        self.broker.simulate_latency()
+        self._store_offsets(offsets if offsets is not None else dict(self._positions))
+
+    def commit_async(
+        self,
+        offsets: Optional[Dict[TopicPartition, Any]] = None,
+        callback: Optional[Callable[[Dict, Any], None]] = None,
+    ) -> FakeFuture:
+        """Commit offsets without simulating a round trip."""
+        self._ensure_open()
+        offsets = offsets if offsets is not None else dict(self._positions)
+        self._store_offsets(offsets)
+        future = FakeFuture()
+        future.success(None)
+        if callback is not None:
+            callback(offsets, None)
+        return future
+
+    def close(self, autocommit: bool = True, timeout_ms: Optional[int] = None) -> None:
+        """Leave the group, committing positions if auto-commit is enabled."""
+        if self._closed:
+            return
+        if autocommit and self._enable_auto_commit:
+            self._store_offsets(dict(self._positions))
+        self.broker.leave_group(self.group_id, self._member_id)
+        self._closed = True
+
+    def _ensure_open(self) -> None:
+        """Raise if the consumer was closed."""
+        if self._closed:
+            raise IllegalStateError("Consumer is closed")
+
+    def _maybe_rebalance(self) -> None:
+        """Apply a new group assignment, invoking the rebalance listener."""
+        generation, assigned = self.broker.assignment(self.group_id, self._member_id)
+        if generation == self._generation:
+            return
+
+        if self._generation is not None and self._listener is not None:
+            self._listener.on_partitions_revoked(set(self._assignment))
+        if self._enable_auto_commit and self._assignment:
+            self._store_offsets({tp: self._positions[tp] for tp in self._assignment})
+
+        self._generation = generation
+        self._assignment = {TopicPartition(t, p) for t, p in assigned}
+        self._positions = {tp: self._reset_offset(tp) for tp in self._assignment}
+        self._paused &= self._assignment
+
+        if self._listener is not None:
+            self._listener.on_partitions_assigned(set(self._assignment))
+
+    def _reset_offset(self, partition: TopicPartition) -> int:
+        """Starting position: committed offset or auto_offset_reset policy."""
+        committed = self.broker.committed(
+            self.group_id, partition.topic, partition.partition
+        )
+        if committed is not None:
+            return committed
+        if self._auto_offset_reset == "earliest":
+            return 0
+        return self.broker.end_offset(partition.topic, partition.partition)
+
+    def _fetch(self, budget: int) -> Dict[TopicPartition, List[FakeConsumerRecord]]:
+        """Read up to budget records, rotating the starting partition."""
+        partitions = sorted(self._assignment - self._paused)
+        if not partitions:
+            return {}
+
+        start = next(self._rotation) % len(partitions)
+        result = {}
+        for tp in partitions[start:] + partitions[:start]:
+            if budget <= 0:
+                break
+            stored = self.broker.fetch(
+                tp.topic, tp.partition, self._positions[tp], budget
+            )
+            if not stored:
+                continue
+            self._positions[tp] += len(stored)
+            if self._read_committed:
+                stored = [
+                    record
+                    for record in stored
+                    if not self.broker.is_aborted(tp.topic, tp.partition, record.offset)
+                ]
+                if not stored:
+                    continue
+            result[tp] = [self._to_record(tp, record) for record in stored]
+            budget -= len(stored)
+        return result
+
+    def _to_record(
+        self, partition: TopicPartition, record: StoredRecord
+    ) -> FakeConsumerRecord:
+        """Convert a stored record, applying the configured deserializers."""
+        key, value = record.key, record.value
+        if self._key_deserializer is not None:
+            key = self._key_deserializer(key)
+        if self._value_deserializer is not None:
+            value = self._value_deserializer(value)
+        return FakeConsumerRecord(
+            partition.topic,
+            partition.partition,
+            record.offset,
+            record.timestamp,
+            key,
+            value,
+            record.headers,
+        )
+
+    def _store_offsets(self, offsets: Dict[TopicPartition, Any]) -> None:
+        """Write offsets (ints or OffsetAndMetadata) to the broker."""
+        self.broker.commit_offsets(
+            self.group_id,
+            {
+                (tp.topic, tp.partition): getattr(offset, "offset", offset)
+                for tp, offset in offsets.items()
+            },
+        )
+
+
+class FakeBrokerProducerService(KafkaProducerService):
+    """KafkaProducerService writing to a FakeBroker instead of a cluster."""
+
+    def __init__(self, broker: FakeBroker, config: KafkaConfig):
+        """Initialize service bound to a fake broker.
+
+        Args:
+            broker: Broker to write to
+            config: KafkaConfig instance
+        """
+        self.broker = broker
+        super().__init__(config=config)
+
+    def _create_producer(self) -> FakeKafkaProducer:
+        """Create a fake producer using the service's producer settings."""
+        producer = FakeKafkaProducer(self.broker, **self._producer_configs())
+        if self.config.transactional_id:
+            producer.init_transactions()
+        return producer
+
+
+class FakeBrokerConsumerService(KafkaConsumerService):
+    """KafkaConsumerService reading from a FakeBroker instead of a cluster."""
+
+    def __init__(self, broker: FakeBroker, config: KafkaConfig):
+        """Initialize service bound to a fake broker.
+
+        Args:
+            broker: Broker to read from
+            config: KafkaConfig instance
+        """
+        self.broker = broker
+        super().__init__(config=config)
+
+    def _create_consumer(self) -> FakeKafkaConsumer:
+        """Create a fake consumer using the service's consumer settings."""
+        return FakeKafkaConsumer(
+            self.topic, broker=self.broker, **self._consumer_configs()
+        )
@@ -0,0 +1,166 @@
+"""Consumer lag tracking and lag-driven poll sizing."""
+
+import logging
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from kafka import TopicPartition
+from kafka.errors import KafkaError as LibKafkaError
+
+from .exceptions import ConsumerError
+from .metrics import NOOP
+
+
+class LagTracker:
+    """Track how far a consumer is behind the log end of each partition.
+
+    Lag is ``end_offsets() - position()`` for every assigned partition.
+    ``end_offsets`` is a broker round trip, so :meth:`maybe_refresh` only
+    asks again once ``refresh_interval_ms`` passed; between refreshes the
+    last values are returned.
+    """
+
+    def __init__(
+        self,
+        consumer: Any,
+        refresh_interval_ms: int = 1000,
+        gauge: Any = NOOP,
+    ):
+        """Initialize lag tracker.
+
+        Args:
+            consumer: KafkaConsumer instance
+            refresh_interval_ms: Minimum time between end offset requests
+            gauge: Gauge labelled by topic and partition to publish lag to
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.refresh_interval_ms = refresh_interval_ms
+        self._consumer = consumer
+        self._gauge = gauge
+        self._lag: Dict[TopicPartition, int] = {}
+        self._refreshed_at: Optional[float] = None
+
+    def refresh(self) -> Dict[TopicPartition, int]:
+        """Fetch end offsets and positions now.
+
+        Returns:
+            Lag per assigned partition
+
+        Raises:
+            ConsumerError: If end offsets or positions cannot be fetched
+        """
+        self._refreshed_at = time.monotonic()
+        assigned = list(self._consumer.assignment())
+        if not assigned:
+            self._lag = {}
+            return {}
+
+        try:
+            end_offsets = self._consumer.end_offsets(assigned)
+            lag = {
+                tp: max(0, end_offsets[tp] - self._consumer.position(tp))
+                for tp in assigned
+                if end_offsets.get(tp) is not None
+            }
+        except LibKafkaError as e:
+            error_msg = f"Failed to fetch consumer lag: {str(e)}"
+            self.logger.error(error_msg)
+            raise ConsumerError(error_msg)
+
+        for tp, value in lag.items():
+            self._gauge.labels(tp.topic, tp.partition).set(value)
+        self._lag = lag
+        return dict(lag)
+
+    def maybe_refresh(self) -> bool:
+        """Refresh if the refresh interval elapsed.
+
+        Returns:
+            True if lag was refreshed
+
+        Raises:
+            ConsumerError: If end offsets or positions cannot be fetched
+        """
+        if self._refreshed_at is not None:
+            elapsed_ms = (time.monotonic() - self._refreshed_at) * 1000
+            if elapsed_ms < self.refresh_interval_ms:
+                return False
+        self.refresh()
+        return True
+
+    def advance(self, messages: Dict[TopicPartition, Any]) -> None:
+        """Account for polled records until the next refresh.
+
+        Args:
+            messages: Poll result mapping TopicPartition to records
+        """
+        for tp, records in messages.items():
+            if tp in self._lag:
+                self._lag[tp] = max(0, self._lag[tp] - len(records))
+
+    def lag(self) -> Dict[TopicPartition, int]:
+        """Get lag per partition from the last refresh."""
+        return dict(self._lag)
+
+    def total(self) -> int:
+        """Get the summed lag of all partitions from the last refresh."""
+        return sum(self._lag.values())
+
+
+class AdaptivePollSizer:
+    """Choose poll size and timeout from the current lag.
+
+    The record limit moves towards the lag, doubling or halving per poll
+    within ``[min_records, max_records]``, so a backlog is drained with
+    large polls while a caught-up consumer hands out small ones. The poll
+    timeout shrinks from the caller's timeout towards ``min_timeout_ms`` as
+    the backlog grows: a lagging consumer always finds data, and a short
+    timeout keeps commits and rebalances responsive.
+    """
+
+    def __init__(
+        self,
+        min_records: int,
+        max_records: int,
+        min_timeout_ms: int = 10,
+    ):
+        """Initialize poll sizer.
+
+        Args:
+            min_records: Smallest record limit
+            max_records: Largest record limit
+            min_timeout_ms: Timeout used once the lag reaches max_records
+
+        Raises:
+            ConsumerError: If the bounds are invalid
+        """
+        if min_records < 1 or max_records < min_records:
+            raise ConsumerError(
+                "Adaptive poll needs 1 <= min_records <= max_records"
+            )
+
+        self.min_records = min_records
+        self.max_records = max_records
+        self.min_timeout_ms = min_timeout_ms
+        self.records = min_records
+
+    def next(self, lag: int, timeout_ms: int) -> Tuple[int, int]:
+        """Get the record limit and timeout of the next poll.
+
+        Args:
+            lag: Total lag of the assigned partitions
+            timeout_ms: Timeout requested by the caller
+
+        Returns:
+            Tuple of max_records and timeout_ms
+        """
+        target = min(self.max_records, max(self.min_records, lag))
+        if target > self.records:
+            self.records = min(target, self.records * 2)
+        elif target < self.records:
+            self.records = max(target, self.records // 2)
+
+        fill = min(1.0, lag / self.max_records)
+        floor = min(self.min_timeout_ms, timeout_ms)
+        timeout = int(timeout_ms - (timeout_ms - floor) * fill)
+        return self.records, timeout
@@ -0,0 +1,495 @@
+"""Counters, gauges and histograms with Prometheus text exposition.
+
+Services record into the module-level :data:`REGISTRY`; expose it with
+:func:`start_metrics_server` or render it with
+:meth:`MetricsRegistry.render`.
+"""
+
+import bisect
+import threading
+from abc import ABC, abstractmethod
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .exceptions import KafkaError
+
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SIZE_BUCKETS = (1, 5, 10, 50, 100, 500, 1000, 5000, 10000, 50000)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, using integers where exact."""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterChild:
+    """Counter value for one label set."""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter."""
+        with self._lock:
+            self._value += amount
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Get (suffix, extra labels, value) samples."""
+        return [("_total", {}, self._value)]
+
+
+class _GaugeChild:
+    """Gauge value for one label set."""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        """Set the gauge."""
+        self._value = value
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the gauge."""
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the gauge."""
+        with self._lock:
+            self._value -= amount
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Get (suffix, extra labels, value) samples."""
+        return [("", {}, self._value)]
+
+
+class _HistogramChild:
+    """Bucketed observations for one label set."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self._bounds = list(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        index = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Get cumulative bucket, sum and count samples."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        samples = []
+        cumulative = 0
+        for bound, count in zip(self._bounds + [float("inf")], counts):
+            cumulative += count
+            samples.append(("_bucket", {"le": _format_value(bound)}, cumulative))
+        samples.append(("_sum", {}, total))
+        samples.append(("_count", {}, cumulative))
+        return samples
+
+
+class Metric(ABC):
+    """A named metric family with optional labels."""
+
+    kind = ""
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        **options: Any,
+    ):
+        """Initialize metric.
+
+        Args:
+            name: Metric name
+            documentation: Help text
+            labelnames: Names of the labels
+            **options: Child options, e.g. histogram buckets
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._options = options
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: Any) -> Any:
+        """Get the child for a label set, creating it on first use.
+
+        Args:
+            *values: Label values in ``labelnames`` order
+
+        Returns:
+            Child with inc/set/observe methods
+
+        Raises:
+            KafkaError: If the number of values does not match the labels
+        """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+        if len(key) != len(self.labelnames):
+            raise KafkaError(
+                f"Metric {self.name} expects labels {self.labelnames}, got {key}"
+            )
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = self._new_child()
+        return child
+
+    @abstractmethod
+    def _new_child(self) -> Any:
+        """Create the value holder of one label set."""
+        pass
+
+    def render(self) -> List[str]:
+        """Render the family in Prometheus text format.
+
+        Returns:
+            Lines of the exposition
+        """
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        with self._lock:
+            children = sorted(self._children.items())
+        for values, child in children:
+            base = dict(zip(self.labelnames, values))
+            for suffix, extra, value in child.samples():
+                labels = dict(base, **extra)
+                label_text = ",".join(
+                    f'{key}="{_escape(str(val))}"' for key, val in labels.items()
+                )
+                selector = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{self.name}{suffix}{selector} {_format_value(value)}")
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing count."""
+
+    kind = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase an unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """Value that can go up and down."""
+
+    kind = "gauge"
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge."""
+        self.labels().set(value)
+
+
+class Histogram(Metric):
+    """Distribution of observations over fixed buckets."""
+
+    kind = "histogram"
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self._options.get("buckets", LATENCY_BUCKETS))
+
+    def observe(self, value: float) -> None:
+        """Record an observation on an unlabelled histogram."""
+        self.labels().observe(value)
+
+
+class _NoopMetric:
+    """Metric that discards everything; used when metrics are disabled."""
+
+    def labels(self, *values: Any) -> "_NoopMetric":
+        return self
+
+    def inc(self, amount: float = 1) -> None:
+        pass
+
+    def dec(self, amount: float = 1) -> None:
+        pass
+
+    def set(self, value: float) -> None:
+        pass
+
+    def observe(self, value: float) -> None:
+        pass
+
+
+NOOP = _NoopMetric()
+
+
+class MetricsRegistry:
+    """Collection of metric families."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """Get or create a gauge."""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets=buckets
+        )
+
+    def get(self, name: str) -> Optional[Metric]:
+        """Get a registered metric by name."""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render every metric in Prometheus text format.
+
+        Returns:
+            Exposition text
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(
+        self,
+        cls: type,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        **options: Any,
+    ) -> Any:
+        """Return the registered metric, creating it if needed.
+
+        Raises:
+            KafkaError: If the name is registered with another type or labels
+        """
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(
+                    name, documentation, labelnames, **options
+                )
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise KafkaError(f"Metric {name} already registered differently")
+            return metric
+
+
+REGISTRY = MetricsRegistry()
+
+
+class ProducerMetrics:
+    """Instruments recorded by the producer service."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = REGISTRY):
+        """Initialize producer instruments.
+
+        Args:
+            registry: Registry to record into, or None to disable metrics
+        """
+        if registry is None:
+            self.messages = self.send_latency = self.batch_size = NOOP
+            self.serialization = NOOP
+            return
+
+        self.messages = registry.counter(
+            "kafka_producer_messages",
+            "Messages sent, by topic and result",
+            ("topic", "result"),
+        )
+        self.send_latency = registry.histogram(
+            "kafka_producer_send_latency_seconds",
+            "Time from send to broker acknowledgement",
+            ("topic",),
+        )
+        self.batch_size = registry.histogram(
+            "kafka_producer_batch_size",
+            "Messages per send_batch call",
+            ("topic",),
+            buckets=SIZE_BUCKETS,
+        )
+        self.serialization = registry.histogram(
+            "kafka_producer_serialization_seconds",
+            "Time spent encoding message values",
+            ("topic",),
+        )
+
+
+class ConsumerMetrics:
+    """Instruments recorded by the consumer service."""
+
+    def __init__(self, registry: Optional[MetricsRegistry] = REGISTRY):
+        """Initialize consumer instruments.
+
+        Args:
+            registry: Registry to record into, or None to disable metrics
+        """
+        if registry is None:
+            self.messages = self.poll_latency = self.poll_records = NOOP
+            self.lag = self.end_offset_lag = self.commit_latency = NOOP
+            return
+
+        self.messages = registry.counter(
+            "kafka_consumer_messages",
+            "Messages received, by topic",
+            ("topic",),
+        )
+        self.poll_latency = registry.histogram(
+            "kafka_consumer_poll_latency_seconds",
+            "Time spent in poll()",
+            ("topic",),
+        )
+        self.poll_records = registry.histogram(
+            "kafka_consumer_poll_records",
+            "Records returned per non-empty poll",
+            ("topic",),
+            buckets=SIZE_BUCKETS,
+        )
+        self.lag = registry.gauge(
+            "kafka_consumer_lag",
+            "Records between the consumed offset and the high watermark",
+            ("topic", "partition"),
+        )
+        self.end_offset_lag = registry.gauge(
+            "kafka_consumer_end_offset_lag",
+            "Records between the position and the log end offset at the last "
+            "lag refresh",
+            ("topic", "partition"),
+        )
+        self.commit_latency = registry.histogram(
+            "kafka_consumer_commit_latency_seconds",
+            "Time spent committing offsets",
+            ("topic",),
+        )
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """Serve the registry at /metrics."""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self) -> None:
+        """Write the exposition text."""
+        if self.path.split("?", 1)[0] not in ("/", "/metrics"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+        pass
+
+
+class MetricsServer:
+    """HTTP server exposing a registry on a daemon thread."""
+
+    def __init__(
+        self,
+        port: int = 9102,
+        addr: str = "0.0.0.0",
+        registry: MetricsRegistry = REGISTRY,
+    ):
+        """Start serving.
+
+        Args:
+            port: Port to listen on (0 picks a free one)
+            addr: Address to bind
+            registry: Registry to expose
+        """
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((addr, port), handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="kafka-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stop serving."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def start_metrics_server(
+    port: int = 9102, addr: str = "0.0.0.0", registry: MetricsRegistry = REGISTRY
+) -> MetricsServer:
+    """Expose a registry over HTTP at /metrics.
+
+    Args:
+        port: Port to listen on (0 picks a free one)
+        addr: Address to bind
+        registry: Registry to expose
+
+    Returns:
+        Running MetricsServer
+    """
+    return MetricsServer(port, addr, registry)
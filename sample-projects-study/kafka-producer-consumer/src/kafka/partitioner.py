@@ -0,0 +1,212 @@
+"""Pluggable partitioners for the Kafka producer service.
+
+Keyed records are placed with the murmur2 hash used by the Java client, so
+Python and JVM producers agree on the partition of a key. Keyless records
+stick to one partition until a batch worth of bytes was sent to it, which
+lets the producer fill larger batches than per-record round robin.
+"""
+
+import random
+import threading
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from .exceptions import ProducerError
+
+PARTITIONER_CLIENT = "client"
+PARTITIONER_DEFAULT = "default"
+PARTITIONER_STICKY = "sticky"
+
+_SEED = 0x9747B28C
+_M = 0x5BD1E995
+_MASK = 0xFFFFFFFF
+
+
+def murmur2(data: bytes) -> int:
+    """Compute the 32-bit murmur2 hash of the Java client.
+
+    Matches ``org.apache.kafka.common.utils.Utils.murmur2``, including its
+    signed result.
+
+    Args:
+        data: Bytes to hash
+
+    Returns:
+        Signed 32-bit hash
+    """
+    length = len(data)
+    h = (_SEED ^ length) & _MASK
+    tail = length & ~3
+
+    for i in range(0, tail, 4):
+        k = int.from_bytes(data[i : i + 4], "little")
+        k = (k * _M) & _MASK
+        k ^= k >> 24
+        k = (k * _M) & _MASK
+        h = (h * _M) & _MASK
+        h ^= k
+
+    remaining = length & 3
+    if remaining == 3:
+        h ^= data[tail + 2] << 16
+    if remaining >= 2:
+        h ^= data[tail + 1] << 8
+    if remaining >= 1:
+        h ^= data[tail]
+        h = (h * _M) & _MASK
+
+    h ^= h >> 13
+    h = (h * _M) & _MASK
+    h ^= h >> 15
+
+    return h - (1 << 32) if h & 0x80000000 else h
+
+
+def to_positive(number: int) -> int:
+    """Clear the sign bit like ``Utils.toPositive`` of the Java client."""
+    return number & 0x7FFFFFFF
+
+
+class Partitioner(ABC):
+    """Abstract base class for partitioners."""
+
+    @abstractmethod
+    def partition(
+        self,
+        topic: str,
+        key_bytes: Optional[bytes],
+        partitions: Sequence[int],
+        record_size: int,
+    ) -> int:
+        """Choose the partition of a record.
+
+        Args:
+            topic: Target topic
+            key_bytes: Serialized key, or None for keyless records
+            partitions: Sorted partition ids of the topic
+            record_size: Serialized key and value size in bytes
+
+        Returns:
+            Partition id
+        """
+        pass
+
+
+class StickyPartitioner(Partitioner):
+    """Send every record of a topic to one partition until a batch is full.
+
+    After ``batch_size`` bytes went to the current partition, a different
+    partition is picked at random, so load still spreads evenly over time.
+    Keys are ignored.
+    """
+
+    def __init__(self, batch_size: int = 16384):
+        """Initialize sticky partitioner.
+
+        Args:
+            batch_size: Bytes to send to a partition before switching
+        """
+        self.batch_size = batch_size
+        self._current: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    def partition(
+        self,
+        topic: str,
+        key_bytes: Optional[bytes],
+        partitions: Sequence[int],
+        record_size: int,
+    ) -> int:
+        """Return the sticky partition of the topic, switching when full."""
+        with self._lock:
+            state = self._current.get(topic)
+            if (
+                state is None
+                or state[1] >= self.batch_size
+                or state[0] not in partitions
+            ):
+                previous = state[0] if state else None
+                choices = [p for p in partitions if p != previous] or list(partitions)
+                state = self._current[topic] = [random.choice(choices), 0]
+            state[1] += record_size
+            return state[0]
+
+
+class DefaultPartitioner(Partitioner):
+    """Hash keyed records with murmur2 and stick keyless ones."""
+
+    def __init__(self, batch_size: int = 16384):
+        """Initialize default partitioner.
+
+        Args:
+            batch_size: Bytes of keyless records sent to a partition
+                before switching
+        """
+        self._sticky = StickyPartitioner(batch_size)
+
+    def partition(
+        self,
+        topic: str,
+        key_bytes: Optional[bytes],
+        partitions: Sequence[int],
+        record_size: int,
+    ) -> int:
+        """Return murmur2 partition for keys, sticky partition otherwise."""
+        if key_bytes is None:
+            return self._sticky.partition(topic, None, partitions, record_size)
+        return partitions[to_positive(murmur2(key_bytes)) % len(partitions)]
+
+
+class CallablePartitioner(Partitioner):
+    """Adapt a plain function to the Partitioner interface."""
+
+    def __init__(
+        self, func: Callable[[str, Optional[bytes], Sequence[int]], int]
+    ):
+        """Initialize callable partitioner.
+
+        Args:
+            func: Function called with topic, key bytes and partition ids
+        """
+        self.func = func
+
+    def partition(
+        self,
+        topic: str,
+        key_bytes: Optional[bytes],
+        partitions: Sequence[int],
+        record_size: int,
+    ) -> int:
+        """Delegate to the wrapped function."""
+        return self.func(topic, key_bytes, partitions)
+
+
+def create_partitioner(
+    spec: Union[str, Partitioner, Callable[..., int], None],
+    batch_size: int = 16384,
+) -> Optional[Partitioner]:
+    """Build a partitioner from a name, instance or function.
+
+    Args:
+        spec: ``"client"`` to leave partitioning to the client library,
+            ``"default"`` for murmur2 keys and sticky keyless records,
+            ``"sticky"`` to ignore keys, a Partitioner, or a function
+        batch_size: Sticky switch threshold in bytes
+
+    Returns:
+        Partitioner, or None when the client library decides
+
+    Raises:
+        ProducerError: If the name is unknown
+    """
+    if spec is None or spec == PARTITIONER_CLIENT:
+        return None
+    if isinstance(spec, Partitioner):
+        return spec
+    if spec == PARTITIONER_DEFAULT:
+        return DefaultPartitioner(batch_size)
+    if spec == PARTITIONER_STICKY:
+        return StickyPartitioner(batch_size)
+    if callable(spec):
+        return CallablePartitioner(spec)
+    raise ProducerError(f"Unknown partitioner: {spec!r}")
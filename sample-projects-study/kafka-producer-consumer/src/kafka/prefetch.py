@@ -0,0 +1,190 @@
+"""Background polling into a bounded queue for the consumer service."""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from kafka import ConsumerRebalanceListener
+
+
+class _PrefetchRebalanceListener(ConsumerRebalanceListener):
+    """Forward partition revocations to the prefetch poller."""
+
+    def __init__(self, poller: "PrefetchPoller"):
+        self._poller = poller
+
+    def on_partitions_revoked(self, revoked: Set[Any]) -> None:
+        """Purge queued records of revoked partitions."""
+        self._poller._on_revoked(revoked)
+
+    def on_partitions_assigned(self, assigned: Set[Any]) -> None:
+        """Nothing to do; positions are reset by the client."""
+        pass
+
+
+class PrefetchPoller:
+    """Poll a KafkaConsumer on a background thread into a bounded queue.
+
+    KafkaConsumer is not thread-safe, so every call into it, from the poll
+    thread or the caller, must hold :attr:`lock`. When ``max_batches`` polls
+    are queued, assigned partitions are paused and the thread keeps polling
+    with nothing to fetch, so the group membership stays alive while the
+    caller catches up.
+
+    kafka-python rebalances eagerly: every partition is revoked before the
+    new assignment. Revocation drops all queued records and bumps
+    :attr:`generation`, so records the caller already took out of the queue
+    can be discarded too; they are fetched again from the committed offset.
+    """
+
+    def __init__(
+        self,
+        consumer: Any,
+        topics: List[str],
+        max_batches: int,
+        poll_timeout_ms: int = 100,
+        on_revoked: Optional[Callable[[Set[Any]], None]] = None,
+    ):
+        """Initialize prefetch poller.
+
+        Args:
+            consumer: KafkaConsumer instance
+            topics: Topics to (re)subscribe with the rebalance listener
+            max_batches: Maximum number of queued polls
+            poll_timeout_ms: Timeout of each background poll
+            on_revoked: Called on the poll thread, holding the lock, before
+                partitions are revoked
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.lock = threading.RLock()
+        self.max_batches = max_batches
+        self.poll_timeout_ms = poll_timeout_ms
+        self.generation = 0
+
+        self._consumer = consumer
+        self._on_revoked_callback = on_revoked
+        self._queue: Deque[Tuple[int, Dict[Any, List[Any]]]] = deque()
+        self._cond = threading.Condition()
+        self._paused: Set[Any] = set()
+        self._error: Optional[Exception] = None
+        self._stopped = threading.Event()
+
+        with self.lock:
+            consumer.subscribe(topics, listener=_PrefetchRebalanceListener(self))
+
+        self._thread = threading.Thread(
+            target=self._run, name="kafka-prefetch", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def stopped(self) -> bool:
+        """Whether the poller was stopped."""
+        return self._stopped.is_set()
+
+    def get(self, timeout_ms: int) -> Optional[Tuple[int, Dict[Any, List[Any]]]]:
+        """Take the oldest queued poll result.
+
+        Args:
+            timeout_ms: Maximum time to wait for data
+
+        Returns:
+            Tuple of generation and records per TopicPartition, or None if
+            nothing arrived in time or the poller stopped
+
+        Raises:
+            Exception: The error that ended the poll thread, if any
+        """
+        with self._cond:
+            if not self._queue and self._error is None and not self.stopped:
+                self._cond.wait(timeout_ms / 1000)
+            if self._error is not None:
+                error, self._error = self._error, None
+                raise error
+            if not self._queue:
+                return None
+            item = self._queue.popleft()
+            self._cond.notify_all()
+            return item
+
+    def stop(self) -> List[Dict[Any, List[Any]]]:
+        """Stop the poll thread and resume partitions it paused.
+
+        Returns:
+            Queued records of the current generation that were never taken
+        """
+        self._stopped.set()
+        with self._cond:
+            self._cond.notify_all()
+        if threading.current_thread() is not self._thread:
+            self._thread.join()
+
+        with self.lock:
+            self._resume_paused()
+
+        with self._cond:
+            leftovers = [
+                records
+                for generation, records in self._queue
+                if generation == self.generation
+            ]
+            self._queue.clear()
+        return leftovers
+
+    def _run(self) -> None:
+        """Poll until stopped, pausing partitions while the queue is full."""
+        while not self.stopped:
+            with self._cond:
+                full = len(self._queue) >= self.max_batches
+
+            try:
+                with self.lock:
+                    if full:
+                        self._pause_assigned()
+                    else:
+                        self._resume_paused()
+                    records = self._consumer.poll(timeout_ms=self.poll_timeout_ms)
+            except Exception as e:
+                self.logger.error("Prefetch poll failed: %s", e)
+                with self._cond:
+                    self._error = e
+                    self._cond.notify_all()
+                return
+
+            if records:
+                with self._cond:
+                    self._queue.append((self.generation, records))
+                    self._cond.notify_all()
+            elif full:
+                with self._cond:
+                    self._cond.wait_for(
+                        lambda: len(self._queue) < self.max_batches or self.stopped,
+                        timeout=self.poll_timeout_ms / 1000,
+                    )
+
+    def _pause_assigned(self) -> None:
+        """Pause every assigned partition. Caller must hold the lock."""
+        assigned = set(self._consumer.assignment())
+        to_pause = assigned - self._paused
+        if to_pause:
+            self._consumer.pause(*to_pause)
+        self._paused = assigned
+
+    def _resume_paused(self) -> None:
+        """Resume partitions paused for backpressure. Caller must hold the lock."""
+        if self._paused:
+            assigned = self._consumer.assignment()
+            self._consumer.resume(*(tp for tp in self._paused if tp in assigned))
+            self._paused = set()
+
+    def _on_revoked(self, revoked: Set[Any]) -> None:
+        """Drop queued records and invalidate ones already handed out."""
+        with self._cond:
+            self._queue.clear()
+            self.generation += 1
+            self._cond.notify_all()
+        self._paused -= set(revoked)
+
+        if self._on_revoked_callback is not None:
+            self._on_revoked_callback(revoked)
@@ -3,13 +3,30 @@
 import json
 import logging
 import time
-from typing import Any, Dict, Optional
-
-from kafka import KafkaProducer
+from collections import deque
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from kafka import KafkaProducer, TopicPartition
 from kafka.errors import KafkaError as LibKafkaError
 
+from .commit import offset_and_metadata
 from .config import KafkaConfig
-from .exceptions import ProducerError
+from .delivery import DeliveryBuffer, PendingRecord
+from .exceptions import ProducerError, SerializationError
+from .metrics import REGISTRY, ProducerMetrics
+from .partitioner import Partitioner, create_partitioner
+from .serializers import CODEC_HEADER, Serializer
 
 
 class KafkaProducerService:
@@ -20,6 +37,7 @@ class KafkaProducerService:
         config: Optional[KafkaConfig] = None,
         bootstrap_servers: Optional[list] = None,
         topic: Optional[str] = None,
+        partitioner: Union[str, Partitioner, Callable[..., int], None] = None,
     ):
         """Initialize Kafka producer service.
 
@@ -27,6 +45,8 @@ class KafkaProducerService:
             config: KafkaConfig instance
             bootstrap_servers: List of bootstrap servers (overrides config)
             topic: Kafka topic (overrides config)
+            partitioner: Partitioner name, instance or function called with
+                (topic, key_bytes, partitions) (overrides config)
 
         Raises:
             ProducerError: If initialization fails
@@ -49,7 +69,14 @@ class KafkaProducerService:
         if not self.topic:
             raise ProducerError("Topic must be specified")
 
+        self._partitioner = create_partitioner(
+            partitioner if partitioner is not None else config.partitioner,
+            config.batch_size,
+        )
         self._producer = self._create_producer()
+        self._delivery: Optional[DeliveryBuffer] = None
+        self._topic_serializers: Dict[str, Serializer] = {}
+        self._metrics = ProducerMetrics(REGISTRY if config.metrics_enabled else None)
         self.logger.info(f"KafkaProducerService initialized for topic: {self.topic}")
 
     def _create_producer(self) -> KafkaProducer:
@@ -62,14 +89,9 @@ class KafkaProducerService:
             ProducerError: If producer creation fails
         """
         try:
-            producer = KafkaProducer(
-                bootstrap_servers=self.config.bootstrap_servers,
-                value_serializer=self._serialize_value,
-                key_serializer=self._serialize_key,
-                retries=self.config.retries,
-                retry_backoff_ms=self.config.retry_backoff_ms,
-                request_timeout_ms=self.config.request_timeout_ms,
-            )
+            producer = KafkaProducer(**self._producer_configs())
+            if self.config.transactional_id:
+                producer.init_transactions()
             self.logger.debug("KafkaProducer instance created successfully")
             return producer
 
@@ -78,6 +100,30 @@ class KafkaProducerService:
             self.logger.error(error_msg)
             raise ProducerError(error_msg)
 
+    def _producer_configs(self) -> Dict[str, Any]:
+        """Build keyword arguments for the underlying producer client.
+
+        Returns:
+            Dictionary of KafkaProducer configuration
+        """
+        configs = {
+            "bootstrap_servers": self.config.bootstrap_servers,
+            "key_serializer": self._serialize_key,
+            "retries": self.config.retries,
+            "retry_backoff_ms": self.config.retry_backoff_ms,
+            "request_timeout_ms": self.config.request_timeout_ms,
+            "compression_type": self.config.compression_type,
+            "linger_ms": self.config.linger_ms,
+            "batch_size": self.config.batch_size,
+            "buffer_memory": self.config.buffer_memory,
+            "max_in_flight_requests_per_connection": (
+                self.config.max_in_flight_requests_per_connection
+            ),
+        }
+        if self.config.transactional_id:
+            configs["transactional_id"] = self.config.transactional_id
+        return configs
+
     @staticmethod
     def _serialize_key(key: Optional[Any]) -> Optional[bytes]:
         """Serialize message key.
@@ -127,6 +173,100 @@ class KafkaProducerService:
         except (TypeError, ValueError) as e:
             raise ProducerError(f"Failed to serialize value: {str(e)}")
 
+    def _serializer_for(self, topic: str) -> Serializer:
+        """Get the cached value serializer for a topic.
+
+        Args:
+            topic: Target topic
+
+        Returns:
+            Serializer configured for the topic
+
+        Raises:
+            ProducerError: If the configured codec is not registered
+        """
+        serializer = self._topic_serializers.get(topic)
+        if serializer is None:
+            try:
+                serializer = self.config.serializer_for(topic)
+            except SerializationError as e:
+                raise ProducerError(str(e))
+            self._topic_serializers[topic] = serializer
+        return serializer
+
+    def _encode(
+        self, topic: str, value: Any
+    ) -> Tuple[bytes, Optional[List[Tuple[str, bytes]]]]:
+        """Serialize a value with the codec configured for its topic.
+
+        Raw ``bytes`` and ``str`` values are sent as-is without a codec
+        header; everything else goes through the topic serializer and is
+        tagged with the codec header.
+
+        Args:
+            topic: Target topic
+            value: Message value
+
+        Returns:
+            Tuple of serialized value and record headers
+
+        Raises:
+            ProducerError: If serialization fails
+        """
+        if isinstance(value, (bytes, str)):
+            return self._serialize_value(value), None
+
+        serializer = self._serializer_for(topic)
+        started = time.perf_counter()
+        try:
+            data = serializer.serialize(value)
+        except SerializationError as e:
+            raise ProducerError(str(e))
+        self._metrics.serialization.labels(topic).observe(
+            time.perf_counter() - started
+        )
+        return data, [(CODEC_HEADER, serializer.header_value)]
+
+    def _send_record(
+        self,
+        topic: str,
+        value: Any,
+        key: Optional[Any] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> Any:
+        """Encode a record and hand it to the producer.
+
+        Args:
+            topic: Target topic
+            value: Message value
+            key: Message key (optional)
+            headers: Extra record headers (optional)
+
+        Returns:
+            Future resolving to the record metadata
+
+        Raises:
+            ProducerError: If serialization fails
+        """
+        data, codec_headers = self._encode(topic, value)
+        if headers:
+            headers = list(headers) + (codec_headers or [])
+        else:
+            headers = codec_headers
+        if self._partitioner is None:
+            return self._producer.send(topic, value=data, key=key, headers=headers)
+
+        key_bytes = self._serialize_key(key)
+        partition = self._partitioner.partition(
+            topic,
+            key_bytes,
+            sorted(self._producer.partitions_for(topic)),
+            len(data or b"") + len(key_bytes or b""),
+        )
+        return self._producer.send(
+            topic, value=data, key=key_bytes, headers=headers, partition=partition
+        )
+
     def send_message(
         self,
         value: Any,
@@ -154,54 +294,144 @@ class KafkaProducerService:
             raise ProducerError("Topic must be specified")
 
         try:
-            self.logger.debug(f"Sending message to topic: {target_topic}")
+            started = time.perf_counter()
 
             # Send message asynchronously
-            future = self._producer.send(
-                target_topic,
-                value=value,
-                key=key,
-            )
+            future = self._send_record(target_topic, value, key)
 
             # Wait for send to complete
-            record_metadata = future.get(timeout_secs=timeout_ms / 1000)
-
-            metadata = {
-                "topic": record_metadata.topic,
-                "partition": record_metadata.partition,
-                "offset": record_metadata.offset,
-                "timestamp": record_metadata.timestamp,
-                "success": True,
-            }
+            record_metadata = future.get(timeout=timeout_ms / 1000)
 
-            self.logger.info(
-                f"Message sent successfully to topic {target_topic}, "
-                f"partition {record_metadata.partition}, "
-                f"offset {record_metadata.offset}"
+            self._record_send(target_topic, started, success=True)
+            metadata = self._metadata_to_dict(record_metadata)
+
+            self.logger.debug(
+                "Message sent to topic %s, partition %s, offset %s",
+                target_topic,
+                record_metadata.partition,
+                record_metadata.offset,
             )
 
             return metadata
 
         except LibKafkaError as e:
+            self._record_send(target_topic, started, success=False)
             error_msg = f"Failed to send message to {target_topic}: {str(e)}"
             self.logger.error(error_msg)
             raise ProducerError(error_msg)
 
+    def _record_send(self, topic: str, started: float, success: bool) -> None:
+        """Record the outcome of a single acknowledged send.
+
+        Args:
+            topic: Target topic
+            started: perf_counter() value taken before the send
+            success: Whether the broker acknowledged the record
+        """
+        if success:
+            self._metrics.send_latency.labels(topic).observe(
+                time.perf_counter() - started
+            )
+            self._metrics.messages.labels(topic, "success").inc()
+        else:
+            self._metrics.messages.labels(topic, "error").inc()
+
+    def send_async(
+        self,
+        value: Any,
+        key: Optional[Any] = None,
+        topic: Optional[str] = None,
+        on_success: Optional[Callable[[Dict[str, Any]], None]] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        headers: Optional[List[Tuple[str, bytes]]] = None,
+    ) -> None:
+        """Queue a message without waiting for the broker acknowledgement.
+
+        The record goes into a bounded in-memory backlog that a background
+        thread hands to the producer. When the backlog is full the
+        configured ``overflow_policy`` applies: 'block' waits up to
+        ``overflow_timeout_ms``, 'drop_oldest' evicts the oldest queued
+        record (its ``on_error`` receives a ProducerError) and 'raise'
+        fails immediately.
+
+        Args:
+            value: Message value (will be JSON serialized if dict)
+            key: Message key (optional)
+            topic: Topic to send to (overrides default)
+            on_success: Called with the send metadata once acknowledged
+            on_error: Called with the exception if delivery fails
+            headers: Extra record headers (optional)
+
+        Raises:
+            ProducerError: If the record cannot be queued
+        """
+        target_topic = topic or self.topic
+
+        if not target_topic:
+            raise ProducerError("Topic must be specified")
+
+        self._get_delivery_buffer().submit(
+            PendingRecord(target_topic, value, key, on_success, on_error, headers)
+        )
+
+    def get_delivery_stats(self) -> Dict[str, int]:
+        """Get fire-and-forget delivery counters without flushing.
+
+        Returns:
+            Dictionary with queued, delivered, failed, dropped, backlog
+            and in_flight counts
+        """
+        if self._delivery is None:
+            return {
+                "queued": 0,
+                "delivered": 0,
+                "failed": 0,
+                "dropped": 0,
+                "backlog": 0,
+                "in_flight": 0,
+            }
+        return self._delivery.stats()
+
+    def _get_delivery_buffer(self) -> DeliveryBuffer:
+        """Get the delivery buffer, creating it on first use.
+
+        Returns:
+            DeliveryBuffer bound to this producer
+        """
+        if self._delivery is None:
+            self._delivery = DeliveryBuffer(
+                send=self._send_record,
+                to_result=self._metadata_to_dict,
+                max_pending=self.config.max_pending_messages,
+                max_in_flight=self.config.batch_max_in_flight,
+                overflow_policy=self.config.overflow_policy,
+                block_timeout_ms=self.config.overflow_timeout_ms,
+            )
+        return self._delivery
+
     def send_batch(
         self,
         messages: list[Dict[str, Any]],
         topic: Optional[str] = None,
         timeout_ms: int = 10000,
+        max_in_flight: Optional[int] = None,
     ) -> list[Dict[str, Any]]:
         """Send multiple messages to Kafka topic.
 
+        Records are handed to the producer without waiting for each
+        acknowledgement, so serialization of the next record overlaps with
+        the network I/O of the previous ones. At most ``max_in_flight``
+        futures are outstanding at a time; the oldest one is resolved before
+        another record is queued.
+
         Args:
             messages: List of message dictionaries with 'value' and optional 'key'
             topic: Topic to send to (overrides default)
             timeout_ms: Timeout per message
+            max_in_flight: Maximum unacknowledged records (overrides config)
 
         Returns:
-            List of send results
+            List of send results, one per message in input order
 
         Raises:
             ProducerError: If batch send fails
@@ -210,44 +440,197 @@ class KafkaProducerService:
             self.logger.warning("Empty message batch provided")
             return []
 
-        results = []
         target_topic = topic or self.topic
+        window = max_in_flight or self.config.batch_max_in_flight
+        if window < 1:
+            raise ProducerError("max_in_flight must be at least 1")
+
+        timeout_secs = timeout_ms / 1000
+        results: list[Optional[Dict[str, Any]]] = [None] * len(messages)
+        pending: Deque[Tuple[int, Any, float]] = deque()
+        send = self._send_record
+        latency = self._metrics.send_latency.labels(target_topic)
+        clock = time.perf_counter
 
-        self.logger.info(f"Sending batch of {len(messages)} messages")
+        self.logger.info("Sending batch of %d messages", len(messages))
+        self._metrics.batch_size.labels(target_topic).observe(len(messages))
 
         for index, message in enumerate(messages):
-            try:
-                if not isinstance(message, dict):
-                    raise ProducerError(
-                        f"Message {index} must be dict, got {type(message)}"
-                    )
+            if not isinstance(message, dict):
+                results[index] = self._batch_failure(
+                    index, f"Message {index} must be dict, got {type(message)}"
+                )
+                continue
 
-                if "value" not in message:
-                    raise ProducerError(f"Message {index} missing 'value' field")
+            if "value" not in message:
+                results[index] = self._batch_failure(
+                    index, f"Message {index} missing 'value' field"
+                )
+                continue
 
-                result = self.send_message(
+            try:
+                started = clock()
+                future = send(
+                    target_topic,
                     value=message["value"],
                     key=message.get("key"),
-                    topic=target_topic,
-                    timeout_ms=timeout_ms,
                 )
-                results.append(result)
+            except (LibKafkaError, ProducerError) as e:
+                results[index] = self._batch_failure(index, str(e))
+                continue
+
+            pending.append((index, future, started))
+            if len(pending) >= window:
+                done_index, done_future, started = pending.popleft()
+                results[done_index] = self._resolve_batch_future(
+                    done_index, done_future, timeout_secs
+                )
+                latency.observe(clock() - started)
 
-            except ProducerError as e:
-                self.logger.error(f"Failed to send message {index}: {str(e)}")
-                results.append({
-                    "index": index,
-                    "success": False,
-                    "error": str(e),
-                })
+        while pending:
+            done_index, done_future, started = pending.popleft()
+            results[done_index] = self._resolve_batch_future(
+                done_index, done_future, timeout_secs
+            )
+            latency.observe(clock() - started)
 
+        succeeded = sum(1 for r in results if r["success"])
+        self._metrics.messages.labels(target_topic, "success").inc(succeeded)
+        self._metrics.messages.labels(target_topic, "error").inc(
+            len(results) - succeeded
+        )
         self.logger.info(
-            f"Batch send complete: {len([r for r in results if r.get('success')])} "
-            f"successful, {len([r for r in results if not r.get('success')])} failed"
+            "Batch send complete: %d successful, %d failed",
+            succeeded,
+            len(results) - succeeded,
         )
 
         return results
 
+    def _resolve_batch_future(
+        self, index: int, future: Any, timeout_secs: float
+    ) -> Dict[str, Any]:
+        """Wait for a queued batch record and convert the outcome to a result.
+
+        Args:
+            index: Position of the record in the batch
+            future: Future returned by the underlying producer
+            timeout_secs: Maximum time to wait for the acknowledgement
+
+        Returns:
+            Send metadata on success, failure entry otherwise
+        """
+        try:
+            return self._metadata_to_dict(future.get(timeout=timeout_secs))
+        except LibKafkaError as e:
+            return self._batch_failure(index, str(e))
+
+    def _batch_failure(self, index: int, error: str) -> Dict[str, Any]:
+        """Build the result entry for a batch record that was not delivered.
+
+        Args:
+            index: Position of the record in the batch
+            error: Error description
+
+        Returns:
+            Failure result dictionary
+        """
+        self.logger.error("Failed to send message %d: %s", index, error)
+        return {"index": index, "success": False, "error": error}
+
+    @staticmethod
+    def _metadata_to_dict(record_metadata: Any) -> Dict[str, Any]:
+        """Convert producer record metadata to a result dictionary.
+
+        Args:
+            record_metadata: RecordMetadata returned by the producer
+
+        Returns:
+            Dictionary with send metadata
+        """
+        return {
+            "topic": record_metadata.topic,
+            "partition": record_metadata.partition,
+            "offset": record_metadata.offset,
+            "timestamp": record_metadata.timestamp,
+            "success": True,
+        }
+
+    def begin_transaction(self) -> None:
+        """Start a transaction; requires ``transactional_id``.
+
+        Raises:
+            ProducerError: If the transaction cannot be started
+        """
+        self._transaction_call("begin", self._producer.begin_transaction)
+
+    def send_offsets_to_transaction(
+        self, offsets: Dict[TopicPartition, int], group_metadata: Any
+    ) -> None:
+        """Commit consumer offsets as part of the current transaction.
+
+        Args:
+            offsets: Mapping of TopicPartition to next offset to consume
+            group_metadata: KafkaConsumerService.group_metadata() of the
+                consumer that read the input records
+
+        Raises:
+            ProducerError: If the offsets cannot be added
+        """
+        self._transaction_call(
+            "send offsets to",
+            self._producer.send_offsets_to_transaction,
+            {tp: offset_and_metadata(offset) for tp, offset in offsets.items()},
+            group_metadata,
+        )
+
+    def commit_transaction(self) -> None:
+        """Flush and commit the current transaction.
+
+        Raises:
+            ProducerError: If the commit fails
+        """
+        self._transaction_call("commit", self._producer.commit_transaction)
+
+    def abort_transaction(self) -> None:
+        """Abort the current transaction.
+
+        Raises:
+            ProducerError: If the abort fails
+        """
+        self._transaction_call("abort", self._producer.abort_transaction)
+
+    @contextmanager
+    def transaction(self) -> Generator[None, None, None]:
+        """Run a block in a transaction, aborting it if the block raises.
+
+        Raises:
+            ProducerError: If the transaction cannot be started or committed
+        """
+        self.begin_transaction()
+        try:
+            yield
+        except BaseException:
+            self.abort_transaction()
+            raise
+        self.commit_transaction()
+
+    def _transaction_call(self, action: str, func: Callable, *args: Any) -> None:
+        """Call a transaction method, converting client errors.
+
+        Raises:
+            ProducerError: If the call fails
+        """
+        if not self.config.transactional_id:
+            raise ProducerError("Transactions require transactional_id to be set")
+
+        try:
+            func(*args)
+        except LibKafkaError as e:
+            error_msg = f"Failed to {action} transaction: {str(e)}"
+            self.logger.error(error_msg)
+            raise ProducerError(error_msg)
+
     def flush(self, timeout_ms: int = 10000) -> None:
         """Flush pending messages.
 
@@ -259,7 +642,12 @@ class KafkaProducerService:
         """
         try:
             self.logger.debug("Flushing pending messages")
-            self._producer.flush(timeout_secs=timeout_ms / 1000)
+            if self._delivery is not None:
+                if not self._delivery.wait_until_dispatched(timeout_ms):
+                    raise ProducerError(
+                        f"Delivery backlog not drained within {timeout_ms}ms"
+                    )
+            self._producer.flush(timeout=timeout_ms / 1000)
             self.logger.info("Messages flushed successfully")
 
         except LibKafkaError as e:
@@ -271,6 +659,9 @@ class KafkaProducerService:
         """Close producer connection."""
         try:
             self.logger.info("Closing KafkaProducer")
+            if self._delivery is not None:
+                self._delivery.close()
+                self._delivery = None
             if self._producer:
                 self._producer.close()
                 self._producer = None
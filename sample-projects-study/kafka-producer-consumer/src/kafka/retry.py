@@ -0,0 +1,421 @@
+"""Retry topics and dead-letter queue for failed messages.
+
+A message whose handler fails is re-produced to ``<topic>.retry.1`` with a
+header holding the earliest time it may be retried. Each retry topic has
+a fixed delay, so its records are ordered by that time and a retry
+consumer only has to pause a partition until its head record is due.
+After the last retry topic the message goes to ``<topic>.dlq``. The main
+consume loop never waits for any of this.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from kafka import TopicPartition
+from kafka.errors import KafkaError as LibKafkaError
+
+from .batch import PartitionBatch
+from .consumer import KafkaConsumerService
+from .exceptions import ConsumerError
+from .producer import KafkaProducerService
+from .serializers import CODEC_HEADER
+
+ATTEMPT_HEADER = "x-retry-attempt"
+ORIGINAL_TOPIC_HEADER = "x-original-topic"
+NOT_BEFORE_HEADER = "x-retry-not-before"
+ERROR_HEADER = "x-error"
+
+_ROUTING_HEADERS = {
+    ATTEMPT_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+    NOT_BEFORE_HEADER,
+    ERROR_HEADER,
+}
+
+
+def retry_topic(topic: str, attempt: int) -> str:
+    """Name of the retry topic for an attempt (1-based)."""
+    return f"{topic}.retry.{attempt}"
+
+
+def dlq_topic(topic: str) -> str:
+    """Name of the dead-letter topic."""
+    return f"{topic}.dlq"
+
+
+def header_value(headers: Sequence[Tuple[str, bytes]], name: str) -> Optional[str]:
+    """Get a header as a string.
+
+    Args:
+        headers: Record headers
+        name: Header name
+
+    Returns:
+        Decoded header value, or None if absent
+    """
+    for key, value in headers or ():
+        if key == name:
+            return value.decode("utf-8")
+    return None
+
+
+def _now_ms() -> int:
+    """Current wall-clock time in milliseconds."""
+    return int(time.time() * 1000)
+
+
+class DeadLetterRouter:
+    """Re-produce failed messages to the next retry topic or the DLQ.
+
+    Given the raw record value, a message is forwarded byte for byte with
+    its codec header, so retry topics and the DLQ hold exactly what was
+    consumed.
+    """
+
+    def __init__(
+        self,
+        producer: KafkaProducerService,
+        delays_ms: Optional[Sequence[int]] = None,
+    ):
+        """Initialize router.
+
+        Args:
+            producer: Producer used to forward failed messages
+            delays_ms: Delay of each retry topic; its length is the number
+                of retries (defaults to config ``retry_delays_ms``)
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.producer = producer
+        self.delays_ms = list(
+            producer.config.retry_delays_ms if delays_ms is None else delays_ms
+        )
+        self._stats = {"retried": 0, "dead_lettered": 0, "route_failures": 0}
+        self._undelivered: Dict[TopicPartition, int] = {}
+        self._lock = threading.Lock()
+
+    def route(
+        self,
+        message: Dict[str, Any],
+        error: BaseException,
+        raw_value: Optional[bytes] = None,
+    ) -> str:
+        """Forward a failed message without waiting for the acknowledgement.
+
+        Args:
+            message: Message dictionary as yielded by the consumer service
+            error: Exception raised by the handler
+            raw_value: Undecoded record value; forwarded as-is when given,
+                otherwise the decoded value is re-encoded
+
+        Returns:
+            Topic the message was sent to
+
+        Raises:
+            ProducerError: If the message cannot be queued
+        """
+        headers = message.get("headers") or []
+        attempt = int(header_value(headers, ATTEMPT_HEADER) or 0) + 1
+        original = header_value(headers, ORIGINAL_TOPIC_HEADER) or message["topic"]
+
+        routing = [
+            (ATTEMPT_HEADER, str(attempt).encode("utf-8")),
+            (ORIGINAL_TOPIC_HEADER, original.encode("utf-8")),
+            (ERROR_HEADER, f"{type(error).__name__}: {error}".encode("utf-8")),
+        ]
+        if attempt <= len(self.delays_ms):
+            target = retry_topic(original, attempt)
+            not_before = _now_ms() + self.delays_ms[attempt - 1]
+            routing.append((NOT_BEFORE_HEADER, str(not_before).encode("utf-8")))
+            counter = "retried"
+        else:
+            target = dlq_topic(original)
+            counter = "dead_lettered"
+
+        forwarded = [h for h in headers if h[0] not in _ROUTING_HEADERS]
+        if raw_value is None:
+            value = message["value"]
+            forwarded = [h for h in forwarded if h[0] != CODEC_HEADER]
+        else:
+            value = raw_value
+            codec = self.producer.config.topic_serializers.get(message["topic"])
+            if codec and header_value(headers, CODEC_HEADER) is None:
+                # The codec was implied by the source topic; make it explicit
+                forwarded.append((CODEC_HEADER, codec.encode("utf-8")))
+
+        topic_partition = TopicPartition(message["topic"], message["partition"])
+        offset = message["offset"]
+        self.producer.send_async(
+            value,
+            key=message.get("key"),
+            topic=target,
+            on_error=lambda e: self._on_route_error(
+                topic_partition, offset, counter, e
+            ),
+            headers=forwarded + routing,
+        )
+        with self._lock:
+            self._stats[counter] += 1
+        self.logger.debug(
+            "Routed %s:%s:%s to %s",
+            message["topic"],
+            message["partition"],
+            message["offset"],
+            target,
+        )
+        return target
+
+    def wrap(self, handler: Callable[[Dict[str, Any]], Any]) -> "RoutingHandler":
+        """Make a handler route its failures instead of raising.
+
+        The wrapped handler can be used in a ``consume()`` loop or with a
+        thread-based ``process_parallel``, and optionally takes the raw
+        record value as a second argument. Offsets of failed messages can be
+        committed once :meth:`flush` returned without undelivered messages;
+        pass ``before_commit=router.flush`` to ``process_parallel`` for that.
+
+        Args:
+            handler: Message handler
+
+        Returns:
+            Handler returning True on success and False if the message was
+            routed to a retry topic or the DLQ
+        """
+        return RoutingHandler(self, handler)
+
+    def flush(self, timeout_ms: int = 10000) -> Dict[TopicPartition, int]:
+        """Wait until routed messages are acknowledged or failed.
+
+        Returns:
+            Lowest offset per source partition of messages routed since the
+            previous flush whose delivery failed; empty if all arrived
+
+        Raises:
+            ProducerError: If flushing fails
+        """
+        self.producer.flush(timeout_ms)
+        with self._lock:
+            undelivered, self._undelivered = self._undelivered, {}
+        return undelivered
+
+    def stats(self) -> Dict[str, int]:
+        """Get routing counters.
+
+        ``retried`` and ``dead_lettered`` count messages queued for a retry
+        topic or the DLQ whose delivery has not failed; a message that could
+        not be forwarded moves from its counter to ``route_failures``.
+
+        Returns:
+            Dictionary with retried, dead_lettered and route_failures counts
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _on_route_error(
+        self,
+        topic_partition: TopicPartition,
+        offset: int,
+        counter: str,
+        error: Exception,
+    ) -> None:
+        """Record a message that could not be forwarded."""
+        with self._lock:
+            self._stats[counter] -= 1
+            self._stats["route_failures"] += 1
+            previous = self._undelivered.get(topic_partition, offset)
+            self._undelivered[topic_partition] = min(previous, offset)
+        self.logger.error(
+            "Failed to route %s:%s:%s: %s",
+            topic_partition.topic,
+            topic_partition.partition,
+            offset,
+            error,
+        )
+
+
+class RoutingHandler:
+    """Message handler that routes its failures through a DeadLetterRouter.
+
+    The router's producer only lives in the process that created it, so a
+    routing handler cannot be sent to a process pool; use it with threads.
+    """
+
+    def __init__(
+        self,
+        router: DeadLetterRouter,
+        handler: Callable[[Dict[str, Any]], Any],
+    ):
+        """Initialize routing handler.
+
+        Args:
+            router: Router for failed messages
+            handler: Message handler
+        """
+        self.router = router
+        self.handler = handler
+
+    def __call__(
+        self, message: Dict[str, Any], raw_value: Optional[bytes] = None
+    ) -> bool:
+        """Handle a message, routing it if the handler raises.
+
+        Args:
+            message: Message dictionary as yielded by the consumer service
+            raw_value: Undecoded record value to forward on failure
+
+        Returns:
+            True on success, False if the message was routed
+
+        Raises:
+            ProducerError: If a failed message cannot be queued
+        """
+        try:
+            self.handler(message)
+            return True
+        except Exception as e:
+            self.router.route(message, e, raw_value)
+            return False
+
+    def __reduce__(self):
+        """Refuse pickling with a clear error instead of a lock error."""
+        raise TypeError(
+            "RoutingHandler cannot be sent to another process; "
+            "use process_parallel without use_processes"
+        )
+
+
+class RetryConsumer:
+    """Consume a retry topic, handling each message once it is due.
+
+    When the head record of a partition is not due yet, the partition is
+    paused and rewound to that record, so polling continues for the other
+    partitions and nothing sleeps. Messages failing again are routed to the
+    next retry topic or the DLQ. Offsets are committed after every poll,
+    once routed messages were acknowledged; a partition whose routing
+    failed is not committed but rewound to the undelivered message.
+    """
+
+    def __init__(
+        self,
+        consumer: KafkaConsumerService,
+        handler: Callable[[Dict[str, Any]], Any],
+        router: DeadLetterRouter,
+    ):
+        """Initialize retry consumer.
+
+        Args:
+            consumer: Consumer service subscribed to one retry topic, with
+                ``enable_auto_commit=False``
+            handler: Message handler
+            router: Router for messages failing again
+
+        Raises:
+            ConsumerError: If the consumer auto-commits offsets
+        """
+        if consumer.config.enable_auto_commit:
+            raise ConsumerError("RetryConsumer requires enable_auto_commit=False")
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.consumer = consumer
+        self.handler = router.wrap(handler)
+        self.router = router
+        self._paused: Dict[TopicPartition, int] = {}
+        self._stats = {"processed": 0, "failed": 0, "deferred": 0}
+
+    def run(self, timeout_ms: int = 1000, max_messages: Optional[int] = None) -> int:
+        """Process due messages until max_messages were handled.
+
+        Args:
+            timeout_ms: Longest time to wait in one poll
+            max_messages: Stop after this many messages (None for infinite)
+
+        Returns:
+            Number of messages handled
+
+        Raises:
+            ConsumerError: If consumption or committing fails
+        """
+        consumer = self.consumer._consumer
+        handled = 0
+
+        while max_messages is None or handled < max_messages:
+            self._resume_due()
+            try:
+                records = consumer.poll(timeout_ms=self._poll_timeout(timeout_ms))
+            except LibKafkaError as e:
+                raise ConsumerError(f"Error during consumption: {str(e)}")
+
+            offsets = {}
+            failed = 0
+            for topic_partition, partition_records in records.items():
+                due = self._due_records(topic_partition, partition_records)
+                if not due:
+                    continue
+
+                batch = PartitionBatch(
+                    topic_partition.topic,
+                    topic_partition.partition,
+                    due,
+                    self.consumer._decode_value,
+                )
+                for message, raw_value in zip(batch.messages(), batch.raw_values):
+                    if self.handler(message, raw_value):
+                        self._stats["processed"] += 1
+                    else:
+                        failed += 1
+                handled += len(due)
+                offsets[topic_partition] = batch.next_offset
+
+            self._stats["failed"] += failed
+            if offsets:
+                if failed:
+                    for topic_partition, offset in self.router.flush().items():
+                        # Redeliver from the message that never left
+                        offsets.pop(topic_partition, None)
+                        consumer.seek(topic_partition, offset)
+                self.consumer._commit_offsets(offsets)
+
+        return handled
+
+    def stats(self) -> Dict[str, int]:
+        """Get retry counters.
+
+        Returns:
+            Dictionary with processed, failed and deferred counts
+        """
+        return dict(self._stats, paused=len(self._paused))
+
+    def _due_records(
+        self, topic_partition: TopicPartition, records: List[Any]
+    ) -> List[Any]:
+        """Return the due prefix of records, pausing at the first pending one."""
+        now = _now_ms()
+        for index, record in enumerate(records):
+            not_before = int(header_value(record.headers, NOT_BEFORE_HEADER) or 0)
+            if not_before > now:
+                consumer = self.consumer._consumer
+                consumer.seek(topic_partition, record.offset)
+                consumer.pause(topic_partition)
+                self._paused[topic_partition] = not_before
+                self._stats["deferred"] += 1
+                return records[:index]
+        return records
+
+    def _resume_due(self) -> None:
+        """Resume partitions whose head record became due."""
+        now = _now_ms()
+        due = [tp for tp, not_before in self._paused.items() if not_before <= now]
+        if due:
+            consumer = self.consumer._consumer
+            assigned = consumer.assignment()
+            consumer.resume(*(tp for tp in due if tp in assigned))
+            for topic_partition in due:
+                del self._paused[topic_partition]
+
+    def _poll_timeout(self, timeout_ms: int) -> int:
+        """Shorten the poll so the next paused partition resumes on time."""
+        if not self._paused:
+            return timeout_ms
+        until_due = min(self._paused.values()) - _now_ms()
+        return max(0, min(timeout_ms, until_due))
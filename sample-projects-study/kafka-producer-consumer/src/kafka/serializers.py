@@ -0,0 +1,270 @@
+"""Pluggable value serializers for Kafka services.
+
+Every encoded record carries a ``x-codec`` header naming the serializer
+that produced it, so consumers select the decoder directly instead of
+trying JSON first and falling back.
+"""
+
+import json
+import struct
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Sequence, Tuple
+
+from .exceptions import SerializationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None
+
+CODEC_HEADER = "x-codec"
+
+
+class Serializer(ABC):
+    """Abstract base class for value serializers."""
+
+    name: str = ""
+
+    @property
+    def header_value(self) -> bytes:
+        """Value of the codec header identifying this serializer."""
+        return self.name.encode("utf-8")
+
+    @abstractmethod
+    def serialize(self, value: Any) -> bytes:
+        """Serialize a value.
+
+        Args:
+            value: Value to serialize
+
+        Returns:
+            Serialized bytes
+
+        Raises:
+            SerializationError: If the value cannot be serialized
+        """
+        pass
+
+    @abstractmethod
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize bytes produced by :meth:`serialize`.
+
+        Args:
+            data: Serialized bytes
+
+        Returns:
+            Deserialized value
+
+        Raises:
+            SerializationError: If the bytes cannot be decoded
+        """
+        pass
+
+
+class JsonSerializer(Serializer):
+    """Serializer backed by the standard library json module."""
+
+    name = "json"
+
+    def serialize(self, value: Any) -> bytes:
+        """Serialize value as UTF-8 JSON."""
+        try:
+            return json.dumps(value).encode("utf-8")
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"Failed to serialize value as json: {e}")
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize UTF-8 JSON bytes."""
+        try:
+            return json.loads(data)
+        except (UnicodeDecodeError, ValueError) as e:
+            raise SerializationError(f"Failed to deserialize json value: {e}")
+
+
+class OrjsonSerializer(Serializer):
+    """Fast JSON serializer backed by orjson (optional dependency)."""
+
+    name = "orjson"
+
+    def __init__(self):
+        """Initialize orjson serializer.
+
+        Raises:
+            SerializationError: If orjson is not installed
+        """
+        if orjson is None:
+            raise SerializationError("orjson is not installed")
+
+    def serialize(self, value: Any) -> bytes:
+        """Serialize value as JSON using orjson."""
+        try:
+            return orjson.dumps(value)
+        except TypeError as e:
+            raise SerializationError(f"Failed to serialize value as orjson: {e}")
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize JSON bytes using orjson."""
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(f"Failed to deserialize orjson value: {e}")
+
+
+class MsgpackSerializer(Serializer):
+    """Binary serializer backed by msgpack (optional dependency)."""
+
+    name = "msgpack"
+
+    def __init__(self):
+        """Initialize msgpack serializer.
+
+        Raises:
+            SerializationError: If msgpack is not installed
+        """
+        if msgpack is None:
+            raise SerializationError("msgpack is not installed")
+
+    def serialize(self, value: Any) -> bytes:
+        """Serialize value with msgpack."""
+        try:
+            return msgpack.packb(value, use_bin_type=True)
+        except (TypeError, ValueError) as e:
+            raise SerializationError(f"Failed to serialize value as msgpack: {e}")
+
+    def deserialize(self, data: bytes) -> Any:
+        """Deserialize msgpack bytes."""
+        try:
+            return msgpack.unpackb(data, raw=False)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise SerializationError(f"Failed to deserialize msgpack value: {e}")
+
+
+class StructSerializer(Serializer):
+    """Fixed-schema serializer using a precompiled ``struct.Struct``.
+
+    Values are dictionaries whose fields are packed in schema order, so a
+    record costs one ``pack``/``unpack`` call and no per-field parsing.
+
+    Example:
+        >>> reading = StructSerializer(
+        ...     "sensor-reading", [("sensor_id", "I"), ("value", "d")]
+        ... )
+        >>> reading.deserialize(reading.serialize({"sensor_id": 7, "value": 1.5}))
+        {'sensor_id': 7, 'value': 1.5}
+    """
+
+    def __init__(
+        self,
+        name: str,
+        fields: Sequence[Tuple[str, str]],
+        byte_order: str = "<",
+    ):
+        """Initialize struct serializer.
+
+        Args:
+            name: Codec name written to the codec header
+            fields: Ordered (field name, struct format character) pairs
+            byte_order: struct byte order prefix
+
+        Raises:
+            SerializationError: If the schema is invalid
+        """
+        if not name:
+            raise SerializationError("Struct serializer name must be specified")
+        if not fields:
+            raise SerializationError("Struct serializer needs at least one field")
+
+        self.name = name
+        self.field_names: List[str] = [field for field, _ in fields]
+        try:
+            self._struct = struct.Struct(
+                byte_order + "".join(fmt for _, fmt in fields)
+            )
+        except struct.error as e:
+            raise SerializationError(f"Invalid struct schema for '{name}': {e}")
+
+    def serialize(self, value: Dict[str, Any]) -> bytes:
+        """Pack dictionary fields in schema order."""
+        try:
+            return self._struct.pack(*[value[field] for field in self.field_names])
+        except (KeyError, TypeError, struct.error) as e:
+            raise SerializationError(f"Failed to pack value as '{self.name}': {e}")
+
+    def deserialize(self, data: bytes) -> Dict[str, Any]:
+        """Unpack bytes into a dictionary keyed by field name."""
+        try:
+            return dict(zip(self.field_names, self._struct.unpack(data)))
+        except struct.error as e:
+            raise SerializationError(f"Failed to unpack '{self.name}' value: {e}")
+
+
+class SerializerRegistry:
+    """Registry of serializers addressable by codec name."""
+
+    def __init__(self):
+        """Initialize empty registry."""
+        self._serializers: Dict[str, Serializer] = {}
+
+    def register(self, serializer: Serializer) -> None:
+        """Register a serializer under its codec name.
+
+        Args:
+            serializer: Serializer instance
+
+        Raises:
+            SerializationError: If the serializer has no name
+        """
+        if not serializer.name:
+            raise SerializationError("Serializer must define a name")
+        self._serializers[serializer.name] = serializer
+
+    def get(self, name: str) -> Serializer:
+        """Get serializer by codec name.
+
+        Args:
+            name: Codec name
+
+        Returns:
+            Registered serializer
+
+        Raises:
+            SerializationError: If no serializer is registered under name
+        """
+        try:
+            return self._serializers[name]
+        except KeyError:
+            raise SerializationError(
+                f"Unknown serializer '{name}', registered: {self.names()}"
+            )
+
+    def names(self) -> List[str]:
+        """Get registered codec names.
+
+        Returns:
+            List of codec names
+        """
+        return list(self._serializers)
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a codec name is registered."""
+        return name in self._serializers
+
+
+def default_registry() -> SerializerRegistry:
+    """Create a registry with every built-in serializer that is available.
+
+    Returns:
+        Registry containing json, plus orjson and msgpack when installed
+    """
+    registry = SerializerRegistry()
+    registry.register(JsonSerializer())
+    if orjson is not None:
+        registry.register(OrjsonSerializer())
+    if msgpack is not None:
+        registry.register(MsgpackSerializer())
+    return registry
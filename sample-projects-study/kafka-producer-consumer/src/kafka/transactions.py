@@ -0,0 +1,250 @@
+"""Exactly-once consume-transform-produce with batched transactions."""
+
+import logging
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from kafka import TopicPartition
+from kafka.errors import KafkaError as LibKafkaError
+
+from .batch import PartitionBatch
+from .consumer import KafkaConsumerService
+from .exceptions import ConsumerError, ProducerError
+from .producer import KafkaProducerService
+
+TransformResult = Union[None, Dict[str, Any], List[Dict[str, Any]]]
+
+
+class TransactionalProcessor:
+    """Transform consumed messages and produce the results transactionally.
+
+    Output records and the input offsets are committed in one producer
+    transaction, so downstream ``read_committed`` consumers see every input
+    reflected exactly once. A transaction covers up to ``max_messages``
+    input messages or ``max_bytes`` input value bytes, whichever is reached
+    first, and is also committed whenever a poll returns nothing, which
+    bounds latency on a quiet topic.
+
+    If producing or committing fails, the transaction is aborted and the
+    consumer is rewound to the last committed offsets, so every message of
+    the aborted transaction is processed again.
+    """
+
+    def __init__(
+        self,
+        producer: KafkaProducerService,
+        consumer: KafkaConsumerService,
+        transform: Callable[[Dict[str, Any]], TransformResult],
+        output_topic: Optional[str] = None,
+        max_messages: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        """Initialize transactional processor.
+
+        Args:
+            producer: Producer configured with ``transactional_id``
+            consumer: Consumer with ``enable_auto_commit=False``
+            transform: Called with each consumed message dictionary; returns
+                None, one output message or a list of output messages, each
+                a dict with 'value' and optional 'key'
+            output_topic: Topic to produce to (defaults to the producer topic)
+            max_messages: Input messages per transaction (overrides config)
+            max_bytes: Input bytes per transaction (overrides config)
+
+        Raises:
+            ProducerError: If the producer is not transactional
+            ConsumerError: If the consumer auto-commits offsets
+        """
+        if not producer.config.transactional_id:
+            raise ProducerError("TransactionalProcessor requires transactional_id")
+        if consumer.config.enable_auto_commit:
+            raise ConsumerError(
+                "TransactionalProcessor requires enable_auto_commit=False"
+            )
+
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.producer = producer
+        self.consumer = consumer
+        self.transform = transform
+        self.output_topic = output_topic or producer.topic
+        self.max_messages = max_messages or producer.config.transaction_max_messages
+        self.max_bytes = max_bytes or producer.config.transaction_max_bytes
+
+        self._outputs: List[Dict[str, Any]] = []
+        self._first_offsets: Dict[TopicPartition, int] = {}
+        self._offsets: Dict[TopicPartition, int] = {}
+        self._messages = 0
+        self._bytes = 0
+        self._stats = {"transactions": 0, "aborted": 0, "messages": 0, "outputs": 0}
+
+    def run(
+        self,
+        timeout_ms: int = 1000,
+        max_messages: Optional[int] = None,
+    ) -> int:
+        """Consume, transform and produce until max_messages were committed.
+
+        Args:
+            timeout_ms: Poll timeout in milliseconds
+            max_messages: Stop after this many input messages (None for
+                infinite)
+
+        Returns:
+            Number of input messages committed
+
+        Raises:
+            ProducerError: If a transaction fails; it was aborted and the
+                consumer rewound, so run() may be called again
+            ConsumerError: If consumption fails
+            Exception: Whatever transform raised, after rewinding the
+                consumer to the first uncommitted message
+        """
+        committed = 0
+
+        while max_messages is None or committed < max_messages:
+            try:
+                records = self.consumer._poll(timeout_ms)
+            except LibKafkaError as e:
+                raise ConsumerError(f"Error during consumption: {str(e)}")
+
+            if not records:
+                committed += self.commit()
+                continue
+
+            for topic_partition, partition_records in records.items():
+                self._first_offsets.setdefault(
+                    topic_partition, partition_records[0].offset
+                )
+
+            for topic_partition, partition_records in records.items():
+                batch = PartitionBatch(
+                    topic_partition.topic,
+                    topic_partition.partition,
+                    partition_records,
+                    self.consumer._decode_value,
+                )
+                for message, raw_value in zip(batch.messages(), batch.raw_values):
+                    try:
+                        self._add(topic_partition, message, len(raw_value or b""))
+                    except Exception:
+                        self._rewind()
+                        raise
+                    if (
+                        self._messages >= self.max_messages
+                        or self._bytes >= self.max_bytes
+                    ):
+                        committed += self.commit()
+
+        committed += self.commit()
+        return committed
+
+    def commit(self) -> int:
+        """Produce buffered outputs and commit them with the input offsets.
+
+        Returns:
+            Number of input messages committed
+
+        Raises:
+            ProducerError: If the transaction failed and was aborted
+        """
+        if not self._offsets:
+            return 0
+
+        messages = self._messages
+        try:
+            self.producer.begin_transaction()
+            if self._outputs:
+                results = self.producer.send_batch(self._outputs, self.output_topic)
+                failures = [r for r in results if not r.get("success")]
+                if failures:
+                    raise ProducerError(
+                        f"{len(failures)} output messages failed: "
+                        f"{failures[0].get('error')}"
+                    )
+            self.producer.send_offsets_to_transaction(
+                self._offsets, self.consumer.group_metadata()
+            )
+            self.producer.commit_transaction()
+        except ProducerError:
+            self._abort()
+            raise
+
+        self._stats["transactions"] += 1
+        self._stats["messages"] += messages
+        self._stats["outputs"] += len(self._outputs)
+        self.logger.debug(
+            "Committed transaction of %d messages, %d outputs",
+            messages,
+            len(self._outputs),
+        )
+        self._forget_first_offsets(self._offsets)
+        self._reset()
+        return messages
+
+    def stats(self) -> Dict[str, int]:
+        """Get transaction counters.
+
+        Returns:
+            Dictionary with transactions, aborted, messages and outputs counts
+        """
+        return dict(self._stats)
+
+    def _add(
+        self, topic_partition: TopicPartition, message: Dict[str, Any], size: int
+    ) -> None:
+        """Transform one message and add it to the open transaction."""
+        result = self.transform(message)
+        if isinstance(result, dict):
+            self._outputs.append(result)
+        elif result:
+            self._outputs.extend(result)
+
+        self._offsets[topic_partition] = message["offset"] + 1
+        self._messages += 1
+        self._bytes += size
+
+    def _abort(self) -> None:
+        """Abort the open transaction and rewind the consumer."""
+        self._stats["aborted"] += 1
+        try:
+            self.producer.abort_transaction()
+        except ProducerError as e:
+            self.logger.error("Abort failed: %s", e)
+        self._rewind()
+
+    def _rewind(self) -> None:
+        """Seek assigned partitions back to their committed offsets.
+
+        Partitions without a committed offset go back to the first offset
+        this processor saw, so no polled message is skipped.
+        """
+        consumer = self.consumer._consumer
+        assigned = consumer.assignment()
+        for topic_partition, first_offset in self._first_offsets.items():
+            if topic_partition not in assigned:
+                continue
+            committed = consumer.committed(topic_partition)
+            consumer.seek(
+                topic_partition, first_offset if committed is None else committed
+            )
+        self._first_offsets = {}
+        self._reset()
+
+    def _forget_first_offsets(self, committed: Dict[TopicPartition, int]) -> None:
+        """Drop first offsets no longer needed for rewinding.
+
+        Partitions with a committed offset rewind to it, and revoked
+        partitions are not rewound at all.
+        """
+        assigned = self.consumer._consumer.assignment()
+        self._first_offsets = {
+            tp: offset
+            for tp, offset in self._first_offsets.items()
+            if tp not in committed and tp in assigned
+        }
+
+    def _reset(self) -> None:
+        """Clear the state of the open transaction."""
+        self._outputs = []
+        self._offsets = {}
+        self._messages = 0
+        self._bytes = 0
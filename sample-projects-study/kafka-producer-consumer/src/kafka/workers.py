@@ -0,0 +1,232 @@
+"""Partition-ordered worker pool for parallel message processing."""
+
+import logging
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+
+def _process_chunk(
+    handler: Callable[[Dict[str, Any]], Any],
+    messages: List[Dict[str, Any]],
+) -> Tuple[int, Optional[str]]:
+    """Run handler over messages in order, stopping at the first failure.
+
+    Defined at module level so it can be shipped to a process pool.
+
+    Args:
+        handler: Message handler
+        messages: Messages from one partition in offset order
+
+    Returns:
+        Tuple of number of messages processed and error description, if any
+    """
+    for index, message in enumerate(messages):
+        try:
+            handler(message)
+        except Exception as e:
+            return index, f"{type(e).__name__}: {e}"
+    return len(messages), None
+
+
+class PartitionLane:
+    """Ordered queue of message chunks for one partition."""
+
+    def __init__(self, topic_partition: Any):
+        """Initialize lane.
+
+        Args:
+            topic_partition: TopicPartition served by this lane
+        """
+        self.topic_partition = topic_partition
+        self.chunks: Deque[List[Dict[str, Any]]] = deque()
+        self.pending = 0
+        self.running = False
+        self.next_offset: Optional[int] = None
+        self.committed_offset: Optional[int] = None
+        self.error: Optional[str] = None
+
+
+class PartitionWorkerPool:
+    """Process messages in parallel across partitions and in order within one.
+
+    Each partition gets a lane. Only one chunk per lane is executing at any
+    time and the next chunk is submitted when the previous one finishes, so
+    the last processed offset of a lane is always the highest contiguous
+    one. A failing handler stops its lane; earlier offsets stay committable
+    and the failed record is redelivered after a restart (at-least-once).
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Dict[str, Any]], Any],
+        max_workers: Optional[int] = None,
+        use_processes: bool = False,
+    ):
+        """Initialize worker pool.
+
+        Args:
+            handler: Callable invoked with each message dictionary; must be
+                picklable (a module-level function) when use_processes is set
+            max_workers: Number of worker threads or processes
+            use_processes: Use a process pool instead of a thread pool
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.handler = handler
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers=max_workers)
+            if use_processes
+            else ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="kafka-worker"
+            )
+        )
+        self._lanes: Dict[Any, PartitionLane] = {}
+        self._cond = threading.Condition()
+
+    def submit(self, topic_partition: Any, messages: List[Dict[str, Any]]) -> None:
+        """Queue messages of one partition for processing.
+
+        Messages submitted to a lane after it failed are discarded.
+
+        Args:
+            topic_partition: TopicPartition the messages belong to
+            messages: Messages in offset order
+        """
+        if not messages:
+            return
+
+        with self._cond:
+            lane = self._lanes.get(topic_partition)
+            if lane is None:
+                lane = self._lanes[topic_partition] = PartitionLane(topic_partition)
+            if lane.error is not None:
+                return
+            lane.chunks.append(messages)
+            lane.pending += len(messages)
+            if not lane.running:
+                self._start_next(lane)
+
+    def pending(self, topic_partition: Any) -> int:
+        """Get number of queued or running messages for a partition.
+
+        Args:
+            topic_partition: TopicPartition
+
+        Returns:
+            Number of messages not yet processed
+        """
+        with self._cond:
+            lane = self._lanes.get(topic_partition)
+            return lane.pending if lane else 0
+
+    def errors(self) -> Dict[Any, str]:
+        """Get handler failures per partition.
+
+        Returns:
+            Mapping of TopicPartition to error description
+        """
+        with self._cond:
+            return {
+                tp: lane.error for tp, lane in self._lanes.items() if lane.error
+            }
+
+    def committable_offsets(self) -> Dict[Any, int]:
+        """Get offsets that advanced since the previous call.
+
+        Returns:
+            Mapping of TopicPartition to the next offset to commit
+        """
+        offsets = {}
+        with self._cond:
+            for tp, lane in self._lanes.items():
+                if (
+                    lane.next_offset is not None
+                    and lane.next_offset != lane.committed_offset
+                ):
+                    offsets[tp] = lane.next_offset
+                    lane.committed_offset = lane.next_offset
+        return offsets
+
+    def wait_idle(self, timeout_ms: Optional[int] = None) -> bool:
+        """Wait until every lane has drained.
+
+        Args:
+            timeout_ms: Maximum time to wait (None for no limit)
+
+        Returns:
+            True if all lanes are idle
+        """
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not any(lane.running for lane in self._lanes.values()),
+                timeout=None if timeout_ms is None else timeout_ms / 1000,
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the underlying executor.
+
+        Args:
+            wait: Wait for running chunks to finish
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _start_next(self, lane: PartitionLane) -> None:
+        """Submit the next chunk of a lane. Caller must hold the lock."""
+        chunk = lane.chunks.popleft()
+        lane.running = True
+        try:
+            future = self._executor.submit(_process_chunk, self.handler, chunk)
+        except RuntimeError as e:
+            self._fail_lane(lane, chunk, 0, f"Executor unavailable: {e}")
+            return
+        future.add_done_callback(
+            lambda done, lane=lane, chunk=chunk: self._on_chunk_done(lane, chunk, done)
+        )
+
+    def _on_chunk_done(
+        self, lane: PartitionLane, chunk: List[Dict[str, Any]], future: Future
+    ) -> None:
+        """Advance lane position and schedule the next chunk."""
+        try:
+            processed, error = future.result()
+        except Exception as e:
+            processed, error = 0, f"{type(e).__name__}: {e}"
+
+        with self._cond:
+            if error is not None:
+                self._fail_lane(lane, chunk, processed, error)
+                return
+
+            lane.pending -= len(chunk)
+            lane.next_offset = chunk[-1]["offset"] + 1
+            if lane.chunks:
+                self._start_next(lane)
+            else:
+                lane.running = False
+            self._cond.notify_all()
+
+    def _fail_lane(
+        self,
+        lane: PartitionLane,
+        chunk: List[Dict[str, Any]],
+        processed: int,
+        error: str,
+    ) -> None:
+        """Stop a lane after a handler failure. Caller must hold the lock."""
+        if processed:
+            lane.next_offset = chunk[processed - 1]["offset"] + 1
+        lane.error = error
+        lane.chunks.clear()
+        lane.pending = 0
+        lane.running = False
+        self._cond.notify_all()
+
+        failed = chunk[processed]
+        self.logger.error(
+            "Handler failed for %s:%s:%s: %s",
+            failed["topic"],
+            failed["partition"],
+            failed["offset"],
+            error,
+        )
@@ -0,0 +1,191 @@
+"""Tests for asyncio Kafka services."""
+
+import asyncio
+import threading
+from collections import namedtuple
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.kafka.aio import AsyncKafkaConsumerService, AsyncKafkaProducerService
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import ProducerError
+from src.kafka.metrics import REGISTRY
+
+
+def _sample(selector):
+    """Get a sample value from the default metrics registry."""
+    for line in REGISTRY.render().splitlines():
+        if line.startswith(selector + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{selector} not found in exposition")
+
+
+class ThreadedFuture:
+    """Future stand-in that resolves from another thread like kafka-python."""
+
+    def __init__(self, metadata=None, error=None):
+        self.metadata = metadata
+        self.error = error
+
+    def add_callback(self, fn):
+        if self.error is None:
+            threading.Timer(0.01, fn, args=(self.metadata,)).start()
+
+    def add_errback(self, fn):
+        if self.error is not None:
+            threading.Timer(0.01, fn, args=(self.error,)).start()
+
+
+class TestAsyncKafkaProducerService:
+    """Test cases for AsyncKafkaProducerService."""
+
+    @pytest.fixture
+    def config(self):
+        """Create test configuration."""
+        return KafkaConfig(bootstrap_servers=["localhost:9092"], topic="test-topic")
+
+    def test_send_message(self, config):
+        """Test awaiting an acknowledgement resolved on another thread."""
+        metadata = MagicMock(topic="test-topic", partition=0, offset=42)
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka.return_value.send.return_value = ThreadedFuture(metadata)
+
+            async def run():
+                async with AsyncKafkaProducerService(config=config) as producer:
+                    return await producer.send_message({"test": "data"})
+
+            result = asyncio.run(run())
+
+            assert result["success"] is True
+            assert result["offset"] == 42
+            mock_kafka.return_value.close.assert_called_once()
+
+    def test_send_message_failure(self, config):
+        """Test broker errors surface as ProducerError."""
+        from kafka.errors import KafkaTimeoutError
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka.return_value.send.return_value = ThreadedFuture(
+                error=KafkaTimeoutError("timed out")
+            )
+
+            async def run():
+                producer = AsyncKafkaProducerService(config=config)
+                await producer.send_message({"test": "data"})
+
+            with pytest.raises(ProducerError):
+                asyncio.run(run())
+
+    def test_send_message_records_metrics(self):
+        """Test async sends are counted like sync sends."""
+        config = KafkaConfig(
+            bootstrap_servers=["localhost:9092"], topic="async-producer-topic"
+        )
+        metadata = MagicMock(topic="async-producer-topic", partition=0, offset=1)
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka.return_value.send.side_effect = (
+                lambda *args, **kwargs: ThreadedFuture(metadata)
+            )
+
+            async def run():
+                producer = AsyncKafkaProducerService(config=config)
+                await producer.send_batch([{"value": 1}, {"value": 2}])
+
+            asyncio.run(run())
+
+        topic = 'topic="async-producer-topic"'
+        success = f'kafka_producer_messages_total{{{topic},result="success"}}'
+        assert _sample(success) == 2
+        assert _sample(f"kafka_producer_send_latency_seconds_count{{{topic}}}") == 2
+        assert _sample(f"kafka_producer_batch_size_count{{{topic}}}") == 1
+
+    def test_send_batch(self, config):
+        """Test concurrent batch send keeps per-index results."""
+        metadata = MagicMock(topic="test-topic", partition=0, offset=1)
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka.return_value.send.side_effect = (
+                lambda *args, **kwargs: ThreadedFuture(metadata)
+            )
+
+            async def run():
+                producer = AsyncKafkaProducerService(config=config)
+                return await producer.send_batch([{"value": 1}, "bad", {"value": 2}])
+
+            results = asyncio.run(run())
+
+            assert [r["success"] for r in results] == [True, False, True]
+
+
+class TestAsyncKafkaConsumerService:
+    """Test cases for AsyncKafkaConsumerService."""
+
+    def test_consume(self):
+        """Test async iteration over polled messages."""
+        config = KafkaConfig(
+            bootstrap_servers=["localhost:9092"],
+            topic="test-topic",
+            group_id="test-group",
+        )
+        ConsumerRecord = namedtuple(
+            "ConsumerRecord",
+            ["topic", "partition", "offset", "timestamp", "key", "value", "headers"],
+        )
+        from kafka import TopicPartition
+
+        tp = TopicPartition("test-topic", 0)
+        records = [
+            ConsumerRecord("test-topic", 0, offset, 0, None, b'{"n": 1}', [])
+            for offset in range(2)
+        ]
+
+        with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
+            mock_kafka.return_value.poll.side_effect = [{}, {tp: records}]
+
+            async def run():
+                async with AsyncKafkaConsumerService(config=config) as consumer:
+                    return [m async for m in consumer.consume(max_messages=2)]
+
+            messages = asyncio.run(run())
+
+            assert [m["offset"] for m in messages] == [0, 1]
+            assert messages[0]["value"] == {"n": 1}
+            mock_kafka.return_value.close.assert_called_once()
+
+    def test_consume_commits_and_records_metrics(self):
+        """Test async consumption drives the commit manager and poll metrics."""
+        config = KafkaConfig(
+            bootstrap_servers=["localhost:9092"],
+            topic="async-consumer-topic",
+            group_id="test-group",
+            commit_every_messages=2,
+        )
+        ConsumerRecord = namedtuple(
+            "ConsumerRecord",
+            ["topic", "partition", "offset", "timestamp", "key", "value", "headers"],
+        )
+        from kafka import TopicPartition
+
+        tp = TopicPartition("async-consumer-topic", 0)
+        records = [
+            ConsumerRecord("async-consumer-topic", 0, offset, 0, None, b"1", [])
+            for offset in range(3)
+        ]
+
+        with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
+            mock_kafka.return_value.poll.return_value = {tp: records}
+            mock_kafka.return_value.highwater.return_value = 10
+
+            async def run():
+                async with AsyncKafkaConsumerService(config=config) as consumer:
+                    return [m async for m in consumer.consume(max_messages=3)]
+
+            asyncio.run(run())
+
+            kafka = mock_kafka.return_value
+            assert kafka.commit_async.call_args.kwargs["offsets"][tp].offset == 2
+            assert kafka.commit.call_args.kwargs["offsets"][tp].offset == 3
+
+        topic = 'topic="async-consumer-topic"'
+        assert _sample(f"kafka_consumer_messages_total{{{topic}}}") == 3
+        assert _sample(f'kafka_consumer_lag{{{topic},partition="0"}}') == 7
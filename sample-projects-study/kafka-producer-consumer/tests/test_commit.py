@@ -0,0 +1,79 @@
+"""Tests for the offset commit manager."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.kafka.commit import OffsetCommitManager
+from src.kafka.exceptions import ConsumerError
+
+
+class TestOffsetCommitManager:
+    """Test cases for OffsetCommitManager."""
+
+    def test_requires_trigger(self):
+        """Test a manager without any trigger is rejected."""
+        with pytest.raises(ConsumerError):
+            OffsetCommitManager(MagicMock())
+
+    def test_commits_every_n_messages(self):
+        """Test offsets are committed once the message threshold is reached."""
+        consumer = MagicMock()
+        manager = OffsetCommitManager(consumer, every_messages=3)
+
+        for offset in range(2):
+            manager.track("tp", offset)
+            assert manager.maybe_commit() is False
+
+        manager.track("tp", 2)
+        assert manager.maybe_commit() is True
+
+        offsets = consumer.commit_async.call_args.kwargs["offsets"]
+        assert offsets["tp"].offset == 3
+
+    def test_commits_after_interval(self):
+        """Test offsets are committed once the interval elapsed."""
+        consumer = MagicMock()
+        clock = [0.0, 0.05, 0.2, 0.2]
+        with patch("src.kafka.commit.time.monotonic", side_effect=clock):
+            manager = OffsetCommitManager(
+                consumer, interval_ms=100, async_commit=False
+            )
+            manager.track("tp", 10)
+            assert manager.maybe_commit() is False
+            assert manager.maybe_commit() is True
+
+        assert consumer.commit.call_args.kwargs["offsets"]["tp"].offset == 11
+
+    def test_failed_async_commit_is_retried(self):
+        """Test offsets of a failed async commit are committed again on flush."""
+        consumer = MagicMock()
+        manager = OffsetCommitManager(consumer, every_messages=1)
+        manager.track("tp", 4)
+        manager.maybe_commit()
+
+        offsets, callback = (
+            consumer.commit_async.call_args.kwargs["offsets"],
+            consumer.commit_async.call_args.kwargs["callback"],
+        )
+        callback(offsets, Exception("rebalance"))
+        manager.flush()
+
+        assert consumer.commit.call_args.kwargs["offsets"]["tp"].offset == 5
+        assert manager.stats()["failed_commits"] == 1
+
+    def test_failed_sync_commit_is_retried(self):
+        """Test offsets of a failed sync commit are committed again on flush."""
+        from kafka.errors import CommitFailedError
+
+        consumer = MagicMock()
+        consumer.commit.side_effect = [CommitFailedError("rebalance"), None]
+        manager = OffsetCommitManager(consumer, every_messages=1, async_commit=False)
+        manager.track("tp", 4)
+
+        with pytest.raises(ConsumerError):
+            manager.maybe_commit()
+        manager.flush()
+
+        assert consumer.commit.call_count == 2
+        assert consumer.commit.call_args.kwargs["offsets"]["tp"].offset == 5
+        assert manager.stats()["failed_commits"] == 1
@@ -0,0 +1,174 @@
+"""Tests for the in-process fake broker."""
+
+from unittest.mock import Mock
+
+from kafka import TopicPartition
+
+from src.kafka.config import KafkaConfig
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+    FakeKafkaConsumer,
+    FakeKafkaProducer,
+)
+
+
+class TestFakeBroker:
+    """Test cases for FakeBroker and FakeKafkaProducer."""
+
+    def test_producer_service_round_trip(self):
+        """Test records sent through the service land in the partition log."""
+        broker = FakeBroker(num_partitions=1)
+        producer = FakeBrokerProducerService(
+            broker, KafkaConfig(topic="test-topic")
+        )
+
+        results = producer.send_batch([{"value": {"id": i}} for i in range(10)])
+        producer.close()
+
+        assert [r["offset"] for r in results] == list(range(10))
+        log = broker.log("test-topic", 0)
+        assert len(log) == 10
+        assert log[3].value == b'{"id": 3}'
+
+    def test_linger_and_batch_size_group_records(self):
+        """Test lingering producers send fewer, larger requests."""
+        broker = FakeBroker(num_partitions=1)
+        producer = FakeKafkaProducer(broker, linger_ms=1000, batch_size=10 * 1024)
+
+        futures = [producer.send("t", value=b"x" * 100) for _ in range(250)]
+        producer.flush(timeout=5)
+        producer.close()
+
+        assert all(future.is_done() for future in futures)
+        assert broker.stats["produce_requests"] == 3
+        assert broker.stats["records"] == 250
+
+    def test_compression_reduces_wire_bytes(self):
+        """Test gzip compression is applied per batch."""
+        broker = FakeBroker(num_partitions=1)
+        producer = FakeKafkaProducer(broker, compression_type="gzip", linger_ms=50)
+
+        for _ in range(100):
+            producer.send("t", value=b"repetitive payload " * 10)
+        producer.close()
+
+        assert broker.stats["compressed_bytes_in"] < broker.stats["bytes_in"] / 5
+
+    def test_consumer_service_round_trip(self):
+        """Test records produced through the fake broker are consumed in order."""
+        broker = FakeBroker(num_partitions=2)
+        config = KafkaConfig(
+            topic="test-topic", group_id="test-group", auto_offset_reset="earliest"
+        )
+        producer = FakeBrokerProducerService(broker, config)
+        producer.send_batch(
+            [{"key": str(i % 2), "value": {"id": i}} for i in range(20)]
+        )
+        producer.close()
+
+        consumer = FakeBrokerConsumerService(broker, config)
+        messages = list(consumer.consume(timeout_ms=100, max_messages=20))
+        consumer.close()
+
+        assert sorted(m["value"]["id"] for m in messages) == list(range(20))
+        for partition in (0, 1):
+            offsets = [m["offset"] for m in messages if m["partition"] == partition]
+            assert offsets == sorted(offsets)
+
+    def test_process_parallel_limit_keeps_unsubmitted_records(self):
+        """Test records polled past max_messages are consumed on the next run."""
+        broker = FakeBroker(num_partitions=2)
+        config = KafkaConfig(
+            topic="test-topic",
+            group_id="test-group",
+            auto_offset_reset="earliest",
+            enable_auto_commit=False,
+        )
+        producer = FakeBrokerProducerService(broker, config)
+        producer.send_batch(
+            [{"key": str(i % 2), "value": {"id": i}} for i in range(20)]
+        )
+        producer.close()
+
+        handled = []
+        consumer = FakeBrokerConsumerService(broker, config)
+        first = consumer.process_parallel(
+            handled.append, max_workers=2, timeout_ms=100, max_messages=7
+        )
+        for partition in (0, 1):
+            tp = TopicPartition("test-topic", partition)
+            committed = broker.committed("test-group", "test-topic", partition)
+            assert consumer._consumer.position(tp) == (committed or 0)
+        second = consumer.process_parallel(
+            handled.append, max_workers=2, timeout_ms=100, max_messages=13
+        )
+        consumer.close()
+
+        assert (first, second) == (7, 13)
+        assert sorted(m["value"]["id"] for m in handled) == list(range(20))
+
+    def test_group_members_split_partitions(self):
+        """Test a second member triggers a rebalance of the partitions."""
+        broker = FakeBroker(num_partitions=4)
+        broker.create_topic("t")
+        listener = Mock()
+        first = FakeKafkaConsumer("t", broker=broker, group_id="g")
+        first.subscribe(["t"], listener=listener)
+        first.poll(timeout_ms=0)
+        assert len(first.assignment()) == 4
+
+        second = FakeKafkaConsumer("t", broker=broker, group_id="g")
+        first.poll(timeout_ms=0)
+        second.poll(timeout_ms=0)
+
+        assert len(first.assignment()) == 2
+        assert first.assignment().isdisjoint(second.assignment())
+        listener.on_partitions_revoked.assert_called_once()
+
+        second.close()
+        first.poll(timeout_ms=0)
+        assert len(first.assignment()) == 4
+
+    def test_committed_offsets_resume_group(self):
+        """Test a new member resumes from the group's committed offsets."""
+        broker = FakeBroker(num_partitions=1)
+        for i in range(10):
+            broker.append("t", 0, [(None, b"%d" % i, [], 0)], 1, 1)
+        tp = TopicPartition("t", 0)
+
+        first = FakeKafkaConsumer(
+            "t",
+            broker=broker,
+            group_id="g",
+            auto_offset_reset="earliest",
+            enable_auto_commit=False,
+            max_poll_records=4,
+        )
+        assert len(first.poll(timeout_ms=0)[tp]) == 4
+        first.commit()
+        first.close()
+
+        second = FakeKafkaConsumer(
+            "t", broker=broker, group_id="g", enable_auto_commit=False
+        )
+        records = second.poll(timeout_ms=0)[tp]
+
+        assert second.committed(tp) == 4
+        assert [r.offset for r in records] == list(range(4, 10))
+        assert second.end_offsets([tp]) == {tp: 10}
+
+    def test_paused_partitions_are_not_fetched(self):
+        """Test pause and resume control fetching."""
+        broker = FakeBroker(num_partitions=1)
+        broker.append("t", 0, [(None, b"x", [], 0)], 1, 1)
+        tp = TopicPartition("t", 0)
+        consumer = FakeKafkaConsumer("t", broker=broker, auto_offset_reset="earliest")
+        consumer.poll(timeout_ms=0)
+        consumer.seek_to_beginning()
+
+        consumer.pause(tp)
+        assert consumer.poll(timeout_ms=0) == {}
+        consumer.resume(tp)
+        assert len(consumer.poll(timeout_ms=0)[tp]) == 1
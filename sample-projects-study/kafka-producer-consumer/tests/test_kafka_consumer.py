@@ -134,6 +134,137 @@ class TestKafkaConsumerService:
             assert messages[0]["topic"] == "test-topic"
             assert messages[0]["offset"] == 0
 
+    def test_decode_value_uses_codec_header(self, config):
+        """Test values tagged with a codec header skip JSON sniffing."""
+        from src.kafka.serializers import CODEC_HEADER, StructSerializer
+
+        reading = StructSerializer("reading", [("sensor_id", "I")])
+        config.serializers.register(reading)
+
+        with patch("src.kafka.consumer.KafkaConsumer"):
+            consumer = KafkaConsumerService(config=config)
+            record = MagicMock(
+                topic="test-topic",
+                value=reading.serialize({"sensor_id": 7}),
+                headers=[(CODEC_HEADER, b"reading")],
+            )
+
+            assert consumer._decode_value(record) == {"sensor_id": 7}
+
+    def test_consume_batches(self, config):
+        """Test consuming poll results as columnar batches."""
+        with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+
+            from collections import namedtuple
+            ConsumerRecord = namedtuple(
+                "ConsumerRecord",
+                ["topic", "partition", "offset", "timestamp", "key", "value", "headers"]
+            )
+
+            records = [
+                ConsumerRecord("test-topic", 0, offset, 1000 + offset, None,
+                               b'{"n": %d}' % offset, [])
+                for offset in range(3)
+            ]
+
+            from kafka import TopicPartition
+            tp = TopicPartition("test-topic", 0)
+            mock_kafka_instance.poll.side_effect = [{}, {tp: records}]
+            mock_kafka.return_value = mock_kafka_instance
+
+            consumer = KafkaConsumerService(config=config)
+            consumer._decode_value = MagicMock(wraps=consumer._decode_value)
+            batches = list(consumer.consume_batches(timeout_ms=100, max_batches=1))
+
+            assert len(batches) == 1
+            assert len(batches[0]) == 3
+            partition_batch = batches[0].partitions[tp]
+            assert list(partition_batch.offsets) == [0, 1, 2]
+            assert partition_batch.next_offset == 3
+            consumer._decode_value.assert_not_called()
+            assert partition_batch.values == [{"n": 0}, {"n": 1}, {"n": 2}]
+            assert next(partition_batch.messages())["offset"] == 0
+
+    def test_process_parallel_commits_processed_offsets(self, config):
+        """Test parallel processing commits offsets per partition."""
+        with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+
+            from collections import namedtuple
+            ConsumerRecord = namedtuple(
+                "ConsumerRecord",
+                ["topic", "partition", "offset", "timestamp", "key", "value", "headers"]
+            )
+
+            from kafka import TopicPartition
+            tp0 = TopicPartition("test-topic", 0)
+            tp1 = TopicPartition("test-topic", 1)
+            mock_kafka_instance.poll.side_effect = [
+                {
+                    tp: [
+                        ConsumerRecord("test-topic", tp.partition, offset, 0,
+                                       None, b"1", [])
+                        for offset in range(5)
+                    ]
+                    for tp in (tp0, tp1)
+                },
+            ]
+            mock_kafka_instance.assignment.return_value = {tp0, tp1}
+            mock_kafka.return_value = mock_kafka_instance
+
+            handled = []
+            consumer = KafkaConsumerService(config=config)
+            count = consumer.process_parallel(
+                handled.append, max_workers=2, max_messages=10
+            )
+
+            assert count == 10
+            assert len(handled) == 10
+            committed = {}
+            for call in mock_kafka_instance.commit.call_args_list:
+                committed.update(call.kwargs["offsets"])
+            assert committed[tp0].offset == 5
+            assert committed[tp1].offset == 5
+
+    def test_process_parallel_requires_manual_commit(self, config):
+        """Test parallel processing refuses auto-commit mode."""
+        config.enable_auto_commit = True
+        with patch("src.kafka.consumer.KafkaConsumer"):
+            consumer = KafkaConsumerService(config=config)
+            with pytest.raises(ConsumerError):
+                consumer.process_parallel(lambda message: None)
+
+    def test_consume_batched_commits(self, config):
+        """Test consumed messages are committed in batches and on close."""
+        config.commit_every_messages = 2
+        with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+
+            from collections import namedtuple
+            ConsumerRecord = namedtuple(
+                "ConsumerRecord",
+                ["topic", "partition", "offset", "timestamp", "key", "value", "headers"]
+            )
+
+            from kafka import TopicPartition
+            tp = TopicPartition("test-topic", 0)
+            mock_kafka_instance.poll.return_value = {
+                tp: [
+                    ConsumerRecord("test-topic", 0, offset, 0, None, b"1", [])
+                    for offset in range(3)
+                ]
+            }
+            mock_kafka.return_value = mock_kafka_instance
+
+            with KafkaConsumerService(config=config) as consumer:
+                list(consumer.consume(timeout_ms=100, max_messages=3))
+
+            async_offsets = mock_kafka_instance.commit_async.call_args.kwargs["offsets"]
+            assert async_offsets[tp].offset == 2
+            sync_offsets = mock_kafka_instance.commit.call_args.kwargs["offsets"]
+            assert sync_offsets[tp].offset == 3
+
     def test_seek_to_beginning(self, config):
         """Test seeking to beginning."""
         with patch("src.kafka.consumer.KafkaConsumer") as mock_kafka:
@@ -146,6 +146,42 @@ class TestKafkaProducerService:
 
             assert result["success"] is True
 
+    def test_send_message_uses_topic_codec(self, config):
+        """Test values are encoded with the topic codec and tagged."""
+        from src.kafka.serializers import CODEC_HEADER, StructSerializer
+
+        reading = StructSerializer("reading", [("sensor_id", "I")])
+        config.serializers.register(reading)
+        config.topic_serializers = {"test-topic": "reading"}
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            producer.send_message({"sensor_id": 7})
+
+            _, kwargs = mock_kafka_instance.send.call_args
+            assert kwargs["value"] == reading.serialize({"sensor_id": 7})
+            assert kwargs["headers"] == [(CODEC_HEADER, b"reading")]
+
+    def test_send_message_with_partitioner(self, config):
+        """Test the service picks the partition when a partitioner is set."""
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.partitions_for.return_value = {0, 1, 2}
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(
+                config=config,
+                partitioner=lambda topic, key, partitions: len(key) % len(partitions),
+            )
+            producer.send_message({"test": "data"}, key="abcd")
+
+            _, kwargs = mock_kafka_instance.send.call_args
+            assert kwargs["partition"] == 1
+            assert kwargs["key"] == b"abcd"
+
     def test_send_message_missing_topic(self, config):
         """Test sending message without topic."""
         with patch("src.kafka.producer.KafkaProducer"):
@@ -206,6 +242,167 @@ class TestKafkaProducerService:
             assert results[0]["success"] is True
             assert results[1]["success"] is False
 
+    def test_send_batch_pipelines_sends(self, config):
+        """Test batch queues records before waiting on acknowledgements."""
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            calls = []
+            mock_record_metadata = MagicMock()
+            mock_record_metadata.partition = 0
+            mock_record_metadata.offset = 100
+
+            def make_future(*args, **kwargs):
+                calls.append("send")
+                future = MagicMock()
+                future.get.side_effect = lambda timeout: (
+                    calls.append("get") or mock_record_metadata
+                )
+                return future
+
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.send.side_effect = make_future
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            messages = [{"value": {"id": i}} for i in range(5)]
+
+            results = producer.send_batch(messages, max_in_flight=2)
+
+            assert len(results) == 5
+            assert all(r["success"] for r in results)
+            assert calls[:3] == ["send", "send", "get"]
+            assert calls.count("send") == calls.count("get") == 5
+
+    def test_send_batch_failed_future(self, config):
+        """Test a failed acknowledgement is reported at its index."""
+        from kafka.errors import KafkaTimeoutError
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            ok_future = MagicMock()
+            failed_future = MagicMock()
+            failed_future.get.side_effect = KafkaTimeoutError("timed out")
+
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.send.side_effect = [
+                ok_future, failed_future, ok_future,
+            ]
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            messages = [{"value": {"id": i}} for i in range(3)]
+
+            results = producer.send_batch(messages)
+
+            assert [r["success"] for r in results] == [True, False, True]
+            assert results[1]["index"] == 1
+
+    def test_send_async_invokes_callbacks(self, config):
+        """Test fire-and-forget send reports delivery through callbacks."""
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_record_metadata = MagicMock()
+            mock_record_metadata.topic = "test-topic"
+            mock_record_metadata.partition = 1
+            mock_record_metadata.offset = 7
+
+            class ImmediateFuture:
+                def add_callback(self, fn, *args):
+                    fn(*args, mock_record_metadata)
+
+                def add_errback(self, fn, *args):
+                    pass
+
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.send.return_value = ImmediateFuture()
+            mock_kafka.return_value = mock_kafka_instance
+
+            delivered = []
+            producer = KafkaProducerService(config=config)
+            producer.send_async({"test": "data"}, on_success=delivered.append)
+            producer.flush()
+            producer.close()
+
+            assert delivered[0]["offset"] == 7
+            assert delivered[0]["success"] is True
+
+    def test_send_async_raise_policy(self, config):
+        """Test 'raise' overflow policy rejects records when backlog is full."""
+        import time
+
+        config.overflow_policy = "raise"
+        config.max_pending_messages = 1
+        config.batch_max_in_flight = 1
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka_instance = MagicMock()
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            producer.send_async({"id": 1})
+            while producer.get_delivery_stats()["in_flight"] < 1:
+                time.sleep(0.001)
+            producer.send_async({"id": 2})
+
+            with pytest.raises(ProducerError):
+                producer.send_async({"id": 3})
+
+            stats = producer.get_delivery_stats()
+            assert stats["queued"] == 2
+            assert stats["backlog"] == 1
+
+    def test_flush_waits_for_record_being_dispatched(self, config):
+        """Test flush does not treat a popped but unsent record as dispatched."""
+        import threading
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            sending = threading.Event()
+            release = threading.Event()
+
+            def send(*args, **kwargs):
+                sending.set()
+                release.wait()
+                return MagicMock()
+
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.send.side_effect = send
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            producer.send_async({"id": 1})
+            assert sending.wait(timeout=5)
+            assert producer.get_delivery_stats()["backlog"] == 0
+
+            with pytest.raises(ProducerError):
+                producer.flush(timeout_ms=50)
+            mock_kafka_instance.flush.assert_not_called()
+
+            release.set()
+            producer.flush()
+            mock_kafka_instance.flush.assert_called_once()
+            producer.close()
+
+    def test_delivery_close_times_out_while_dispatching(self, config):
+        """Test closing the buffer reports a dispatcher that is still sending."""
+        import threading
+
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            release = threading.Event()
+            mock_kafka_instance = MagicMock()
+            mock_kafka_instance.send.side_effect = (
+                lambda *args, **kwargs: release.wait() and MagicMock()
+            )
+            mock_kafka.return_value = mock_kafka_instance
+
+            producer = KafkaProducerService(config=config)
+            producer.send_async({"id": 1})
+            delivery = producer._delivery
+
+            with pytest.raises(ProducerError):
+                delivery.close(timeout_ms=50)
+
+            release.set()
+            delivery.close()
+            producer.close()
+            mock_kafka_instance.close.assert_called_once()
+
     def test_flush_success(self, config):
         """Test flushing pending messages."""
         with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
@@ -0,0 +1,153 @@
+"""Tests for lag tracking and adaptive poll sizing."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from kafka import TopicPartition
+
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import ConsumerError
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+)
+from src.kafka.lag import AdaptivePollSizer, LagTracker
+from src.kafka.metrics import REGISTRY
+
+
+def _produce(broker: FakeBroker, config: KafkaConfig, count: int) -> None:
+    """Send count messages through the fake broker."""
+    producer = FakeBrokerProducerService(broker, config)
+    producer.send_batch([{"key": str(i), "value": {"id": i}} for i in range(count)])
+    producer.close()
+
+
+class TestLagTracker:
+    """Test cases for LagTracker."""
+
+    def test_lag_is_end_offset_minus_position(self):
+        """Test lag per partition comes from end offsets and positions."""
+        tp0, tp1 = TopicPartition("t", 0), TopicPartition("t", 1)
+        consumer = MagicMock()
+        consumer.assignment.return_value = {tp0, tp1}
+        consumer.end_offsets.return_value = {tp0: 100, tp1: 5}
+        consumer.position.side_effect = lambda tp: {tp0: 40, tp1: 5}[tp]
+
+        tracker = LagTracker(consumer)
+
+        assert tracker.refresh() == {tp0: 60, tp1: 0}
+        assert tracker.total() == 60
+
+        tracker.advance({tp0: [object()] * 10})
+        assert tracker.lag() == {tp0: 50, tp1: 0}
+
+    def test_maybe_refresh_is_throttled(self):
+        """Test end offsets are requested once per refresh interval."""
+        consumer = MagicMock()
+        consumer.assignment.return_value = {TopicPartition("t", 0)}
+        consumer.end_offsets.return_value = {TopicPartition("t", 0): 1}
+        consumer.position.return_value = 0
+
+        tracker = LagTracker(consumer, refresh_interval_ms=60000)
+
+        assert tracker.maybe_refresh() is True
+        assert tracker.maybe_refresh() is False
+        assert consumer.end_offsets.call_count == 1
+
+
+class TestAdaptivePollSizer:
+    """Test cases for AdaptivePollSizer."""
+
+    def test_record_limit_grows_and_shrinks_within_bounds(self):
+        """Test the limit doubles towards a backlog and halves when caught up."""
+        sizer = AdaptivePollSizer(min_records=10, max_records=100)
+
+        grown = [sizer.next(10000, 1000)[0] for _ in range(5)]
+        shrunk = [sizer.next(0, 1000)[0] for _ in range(5)]
+
+        assert grown == [20, 40, 80, 100, 100]
+        assert shrunk == [50, 25, 12, 10, 10]
+
+    def test_timeout_shrinks_with_lag(self):
+        """Test a caught-up consumer waits longest, a lagging one shortest."""
+        sizer = AdaptivePollSizer(min_records=10, max_records=100, min_timeout_ms=10)
+
+        assert sizer.next(0, 1000)[1] == 1000
+        assert sizer.next(50, 1000)[1] == 505
+        assert sizer.next(500, 1000)[1] == 10
+
+    def test_invalid_bounds_raise(self):
+        """Test min_records must not exceed max_records."""
+        with pytest.raises(ConsumerError):
+            AdaptivePollSizer(min_records=10, max_records=5)
+
+
+class TestConsumerLag:
+    """Test cases for lag and adaptive polling in the consumer service."""
+
+    def test_service_reports_lag(self):
+        """Test lag() reflects unconsumed records per partition."""
+        broker = FakeBroker(num_partitions=1)
+        config = KafkaConfig(
+            topic="lag-topic",
+            group_id="lag-group",
+            auto_offset_reset="earliest",
+            max_poll_records=10,
+        )
+        _produce(broker, config, 30)
+
+        consumer = FakeBrokerConsumerService(broker, config)
+        list(consumer.consume(timeout_ms=100, max_messages=10))
+        lag = consumer.lag()
+        consumer.close()
+
+        assert sum(lag.values()) == 20
+
+    def test_tracker_and_poll_publish_separate_gauges(self):
+        """Test a lag refresh does not overwrite the per-poll lag gauge."""
+        broker = FakeBroker(num_partitions=1)
+        config = KafkaConfig(
+            topic="lag-gauge-topic",
+            group_id="lag-gauge-group",
+            auto_offset_reset="earliest",
+            max_poll_records=10,
+        )
+        _produce(broker, config, 30)
+
+        consumer = FakeBrokerConsumerService(broker, config)
+        list(consumer.consume(timeout_ms=100, max_messages=10))
+        _produce(broker, config, 10)
+        consumer.lag()
+        consumer.close()
+
+        labels = 'topic="lag-gauge-topic",partition="0"'
+        samples = dict(
+            line.rsplit(" ", 1)
+            for line in REGISTRY.render().splitlines()
+            if labels in line
+        )
+        assert float(samples[f"kafka_consumer_lag{{{labels}}}"]) == 20
+        assert float(samples[f"kafka_consumer_end_offset_lag{{{labels}}}"]) == 30
+
+    def test_adaptive_poll_grows_poll_size_under_backlog(self):
+        """Test polls get larger while a backlog is drained."""
+        broker = FakeBroker(num_partitions=1)
+        config = KafkaConfig(
+            topic="adaptive-topic",
+            group_id="adaptive-group",
+            auto_offset_reset="earliest",
+            adaptive_poll=True,
+            adaptive_poll_min_records=2,
+            adaptive_poll_max_records=16,
+            lag_refresh_interval_ms=0,
+        )
+        _produce(broker, config, 100)
+
+        consumer = FakeBrokerConsumerService(broker, config)
+        sizes = [len(batch) for batch in consumer.consume_batches(max_batches=6)]
+        consumer.close()
+
+        assert sizes[0] <= 4
+        assert max(sizes) == 16
+        assert sizes == sorted(sizes)
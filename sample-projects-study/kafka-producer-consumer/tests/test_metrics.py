@@ -0,0 +1,161 @@
+"""Tests for the metrics registry and service instrumentation."""
+
+import urllib.request
+
+import pytest
+
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import KafkaError
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+)
+from src.kafka.metrics import (
+    CONTENT_TYPE,
+    NOOP,
+    REGISTRY,
+    Metric,
+    MetricsRegistry,
+    start_metrics_server,
+)
+
+
+def _sample(text: str, selector: str) -> float:
+    """Get the value of the sample line starting with selector."""
+    for line in text.splitlines():
+        if line.startswith(selector + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{selector} not found in exposition")
+
+
+class TestMetricsRegistry:
+    """Test cases for MetricsRegistry."""
+
+    def test_counter_and_gauge_render(self):
+        """Test counters get a _total suffix and labels are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("requests", "Requests", ("path",)).labels('a"b').inc(2)
+        registry.gauge("depth", "Queue depth").set(7)
+
+        text = registry.render()
+
+        assert "# TYPE requests counter" in text
+        assert 'requests_total{path="a\\"b"} 2' in text
+        assert "# TYPE depth gauge" in text
+        assert "depth 7" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket counts include every smaller bucket."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("size", "Sizes", buckets=(1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        text = registry.render()
+
+        assert _sample(text, 'size_bucket{le="1"}') == 2
+        assert _sample(text, 'size_bucket{le="10"}') == 3
+        assert _sample(text, 'size_bucket{le="+Inf"}') == 4
+        assert _sample(text, "size_count") == 4
+        assert _sample(text, "size_sum") == 56.5
+
+    def test_get_or_create_returns_same_metric(self):
+        """Test registering a name twice returns the existing metric."""
+        registry = MetricsRegistry()
+
+        first = registry.counter("c", "C", ("topic",))
+
+        assert registry.counter("c", "C", ("topic",)) is first
+        with pytest.raises(KafkaError):
+            registry.gauge("c", "C", ("topic",))
+
+    def test_wrong_label_count_raises(self):
+        """Test labels() rejects values not matching the label names."""
+        registry = MetricsRegistry()
+
+        with pytest.raises(KafkaError):
+            registry.counter("c", "C", ("topic", "result")).labels("t")
+
+    def test_metric_without_child_cannot_be_created(self):
+        """Test a Metric subclass must implement _new_child."""
+
+        class Incomplete(Metric):
+            kind = "gauge"
+
+        with pytest.raises(TypeError):
+            Incomplete("incomplete", "Incomplete")
+
+    def test_metrics_server_serves_exposition(self):
+        """Test /metrics returns the rendered registry."""
+        registry = MetricsRegistry()
+        registry.counter("served", "Served").inc()
+        server = start_metrics_server(port=0, addr="127.0.0.1", registry=registry)
+        try:
+            url = f"http://127.0.0.1:{server.port}/metrics"
+            with urllib.request.urlopen(url, timeout=5) as response:
+                body = response.read().decode("utf-8")
+                content_type = response.headers["Content-Type"]
+        finally:
+            server.close()
+
+        assert content_type == CONTENT_TYPE
+        assert "served_total 1" in body
+
+
+class TestServiceMetrics:
+    """Test cases for producer and consumer instrumentation."""
+
+    def test_producer_and_consumer_record_metrics(self):
+        """Test sends, polls, lag and commits show up in the registry."""
+        broker = FakeBroker(num_partitions=1)
+        config = KafkaConfig(
+            topic="metrics-topic",
+            group_id="metrics-group",
+            auto_offset_reset="earliest",
+            max_poll_records=4,
+        )
+        producer = FakeBrokerProducerService(broker, config)
+        producer.send_batch([{"value": {"id": i}} for i in range(10)])
+        producer.send_message({"id": 10})
+        producer.close()
+
+        consumer = FakeBrokerConsumerService(broker, config)
+        list(consumer.consume(timeout_ms=100, max_messages=4))
+        consumer.commit()
+        consumer.close()
+
+        text = REGISTRY.render()
+        topic = 'topic="metrics-topic"'
+        assert (
+            _sample(text, f'kafka_producer_messages_total{{{topic},result="success"}}')
+            == 11
+        )
+        assert (
+            _sample(text, f"kafka_producer_send_latency_seconds_count{{{topic}}}")
+            == 11
+        )
+        assert _sample(text, f"kafka_producer_batch_size_count{{{topic}}}") == 1
+        assert (
+            _sample(text, f"kafka_producer_serialization_seconds_count{{{topic}}}")
+            == 11
+        )
+        assert _sample(text, f"kafka_consumer_messages_total{{{topic}}}") == 4
+        assert _sample(text, f"kafka_consumer_poll_records_sum{{{topic}}}") == 4
+        assert _sample(text, f'kafka_consumer_lag{{{topic},partition="0"}}') == 7
+        assert (
+            _sample(text, f"kafka_consumer_commit_latency_seconds_count{{{topic}}}")
+            == 1
+        )
+
+    def test_disabled_metrics_are_noops(self):
+        """Test metrics_enabled=False records nothing."""
+        broker = FakeBroker(num_partitions=1)
+        producer = FakeBrokerProducerService(
+            broker, KafkaConfig(topic="unmetered-topic", metrics_enabled=False)
+        )
+        producer.send_message({"id": 1})
+        producer.close()
+
+        assert producer._metrics.messages is NOOP
+        assert "unmetered-topic" not in REGISTRY.render()
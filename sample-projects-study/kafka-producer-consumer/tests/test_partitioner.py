@@ -0,0 +1,69 @@
+"""Tests for producer partitioners."""
+
+import pytest
+
+from src.kafka.exceptions import ProducerError
+from src.kafka.partitioner import (
+    CallablePartitioner,
+    DefaultPartitioner,
+    StickyPartitioner,
+    create_partitioner,
+    murmur2,
+    to_positive,
+)
+
+
+class TestPartitioner:
+    """Test cases for partitioners."""
+
+    @pytest.mark.parametrize(
+        "data,expected",
+        [
+            (b"21", -973932308),
+            (b"foobar", -790332482),
+            (b"a-little-bit-long-string", -985981536),
+            (b"a-little-bit-longer-string", -1486304829),
+            (b"lkjh234lh9fiuh90y23oiuhsafujhadof229phr9h19h89h8", -58897971),
+            (b"abc", 479470107),
+        ],
+    )
+    def test_murmur2_matches_java_client(self, data, expected):
+        """Test murmur2 against vectors from the Java client test suite."""
+        assert murmur2(data) == expected
+
+    def test_default_partitioner_hashes_keys(self):
+        """Test keyed records map to toPositive(murmur2(key)) % partitions."""
+        partitioner = DefaultPartitioner()
+        partitions = [0, 1, 2, 3, 4]
+
+        result = partitioner.partition("t", b"foobar", partitions, 10)
+
+        assert result == to_positive(murmur2(b"foobar")) % 5
+        assert result == partitioner.partition("t", b"foobar", partitions, 10)
+
+    def test_sticky_partitioner_switches_after_batch_size(self):
+        """Test keyless records stick to a partition until a batch is full."""
+        partitioner = StickyPartitioner(batch_size=100)
+        partitions = [0, 1, 2]
+
+        chosen = [partitioner.partition("t", None, partitions, 10) for _ in range(30)]
+
+        runs = [chosen[i : i + 10] for i in range(0, 30, 10)]
+        assert all(len(set(run)) == 1 for run in runs)
+        assert runs[0][0] != runs[1][0]
+        assert runs[1][0] != runs[2][0]
+
+    def test_callable_partitioner(self):
+        """Test a function can be used as partitioner."""
+        partitioner = create_partitioner(lambda topic, key, partitions: partitions[-1])
+
+        assert isinstance(partitioner, CallablePartitioner)
+        assert partitioner.partition("t", b"k", [0, 1, 2], 1) == 2
+
+    def test_create_partitioner_names(self):
+        """Test partitioner names resolve to implementations."""
+        assert create_partitioner("client") is None
+        assert isinstance(create_partitioner("default"), DefaultPartitioner)
+        assert isinstance(create_partitioner("sticky"), StickyPartitioner)
+        with pytest.raises(ProducerError):
+            create_partitioner("unknown")
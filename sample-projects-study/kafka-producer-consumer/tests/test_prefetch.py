@@ -0,0 +1,113 @@
+"""Tests for prefetching consumption."""
+
+import time
+
+import pytest
+
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import ConsumerError
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+    FakeKafkaConsumer,
+)
+from src.kafka.prefetch import PrefetchPoller
+
+
+class TestPrefetch:
+    """Test cases for PrefetchPoller and prefetching consume()."""
+
+    @pytest.fixture
+    def config(self):
+        """Create prefetching configuration."""
+        return KafkaConfig(
+            topic="test-topic",
+            group_id="test-group",
+            prefetch_batches=2,
+            max_poll_records=10,
+        )
+
+    @pytest.fixture
+    def broker(self, config):
+        """Create a broker holding 100 messages on two partitions."""
+        broker = FakeBroker(num_partitions=2)
+        producer = FakeBrokerProducerService(broker, config)
+        producer.send_batch([{"value": {"id": i}} for i in range(100)])
+        producer.close()
+        return broker
+
+    def test_stopping_rewinds_to_unhandled_messages(self, broker, config):
+        """Test prefetched but unhandled messages are consumed again."""
+        consumer = FakeBrokerConsumerService(broker, config)
+
+        first = [m["value"]["id"] for m in consumer.consume(max_messages=30)]
+        consumer.commit()
+        rest = [m["value"]["id"] for m in consumer.consume(max_messages=70)]
+        consumer.close()
+
+        assert len(first) == 30
+        assert sorted(first + rest) == list(range(100))
+        committed = broker.committed("test-group", "test-topic", 0)
+        committed += broker.committed("test-group", "test-topic", 1)
+        assert committed == 30
+
+    def test_commit_while_prefetching_uses_handled_offsets(self, broker, config):
+        """Test commit() does not commit messages still in the buffer."""
+        consumer = FakeBrokerConsumerService(broker, config)
+
+        messages = consumer.consume(max_messages=100)
+        message = next(messages)
+        time.sleep(0.05)
+        consumer.commit()
+
+        assert broker.committed(
+            "test-group", "test-topic", message["partition"]
+        ) == message["offset"] + 1
+        messages.close()
+        consumer.close()
+
+    def test_revocation_purges_queue(self, broker):
+        """Test a rebalance drops queued records and bumps the generation."""
+        consumer = FakeKafkaConsumer(
+            broker=broker,
+            group_id="g",
+            auto_offset_reset="earliest",
+            enable_auto_commit=False,
+            max_poll_records=10,
+        )
+        poller = PrefetchPoller(consumer, ["test-topic"], max_batches=3)
+        assert poller.get(1000) is not None
+
+        FakeKafkaConsumer("test-topic", broker=broker, group_id="g")
+        deadline = time.monotonic() + 2
+        while poller.generation == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        assert poller.generation == 1
+        leftovers = poller.stop()
+        assigned = consumer.assignment()
+        assert len(assigned) == 1
+        assert all(set(records) <= assigned for records in leftovers)
+
+    def test_prefetch_requires_manual_commit(self, broker, config):
+        """Test prefetching is refused with auto-commit enabled."""
+        config.enable_auto_commit = True
+        consumer = FakeBrokerConsumerService(broker, config)
+
+        with pytest.raises(ConsumerError):
+            next(consumer.consume())
+        consumer.close()
+
+    def test_unexpected_errors_become_consumer_errors(self, broker, config):
+        """Test prefetching wraps unexpected failures like consume() does."""
+        consumer = FakeBrokerConsumerService(broker, config)
+
+        def broken_decode(record):
+            raise RuntimeError("decoder crashed")
+
+        consumer._decode_value = broken_decode
+
+        with pytest.raises(ConsumerError, match="decoder crashed"):
+            next(consumer.consume(max_messages=10))
+        consumer.close()
@@ -0,0 +1,289 @@
+"""Tests for retry topics and the dead-letter queue."""
+
+import pickle
+import time
+
+import pytest
+from kafka import TopicPartition
+from kafka.errors import KafkaError as LibKafkaError
+
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import ConsumerError, ProducerError
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+)
+from src.kafka.retry import (
+    ATTEMPT_HEADER,
+    NOT_BEFORE_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+    DeadLetterRouter,
+    RetryConsumer,
+    dlq_topic,
+    header_value,
+    retry_topic,
+)
+from src.kafka.serializers import CODEC_HEADER
+
+
+def _values(broker, topic):
+    """Stored records of every partition of a topic."""
+    return [
+        record
+        for partition in sorted(broker.partitions_for(topic))
+        for record in broker.log(topic, partition)
+    ]
+
+
+class TestRetry:
+    """Test cases for DeadLetterRouter and RetryConsumer."""
+
+    @pytest.fixture
+    def broker(self):
+        """Create a single-partition broker."""
+        return FakeBroker(num_partitions=1)
+
+    @pytest.fixture
+    def producer(self, broker):
+        """Create a producer bound to the broker."""
+        producer = FakeBrokerProducerService(broker, KafkaConfig(topic="orders"))
+        yield producer
+        producer.close()
+
+    def _consumer(self, broker, topic):
+        """Create a manually committing consumer for a topic."""
+        return FakeBrokerConsumerService(
+            broker, KafkaConfig(topic=topic, group_id=f"{topic}-group")
+        )
+
+    def test_topic_names(self):
+        """Test retry and DLQ topic naming."""
+        assert retry_topic("orders", 2) == "orders.retry.2"
+        assert dlq_topic("orders") == "orders.dlq"
+
+    def test_wrapped_handler_routes_failures(self, broker, producer):
+        """Test a failing handler sends the message to the first retry topic."""
+        router = DeadLetterRouter(producer, delays_ms=[1000, 5000])
+
+        def handler(message):
+            raise ValueError("poison")
+
+        handle = router.wrap(handler)
+        message = {
+            "topic": "orders",
+            "partition": 0,
+            "offset": 7,
+            "key": "k1",
+            "value": {"id": 1},
+            "headers": [],
+        }
+
+        before = int(time.time() * 1000)
+        assert handle(message) is False
+        router.flush()
+
+        [record] = _values(broker, "orders.retry.1")
+        assert record.key == b"k1"
+        assert header_value(record.headers, ATTEMPT_HEADER) == "1"
+        assert header_value(record.headers, ORIGINAL_TOPIC_HEADER) == "orders"
+        assert int(header_value(record.headers, NOT_BEFORE_HEADER)) >= before + 1000
+        assert router.stats()["retried"] == 1
+
+    def test_exhausted_retries_go_to_dlq(self, broker, producer):
+        """Test a message past the last retry topic lands in the DLQ."""
+        router = DeadLetterRouter(producer, delays_ms=[0])
+        message = {
+            "topic": "orders.retry.1",
+            "partition": 0,
+            "offset": 0,
+            "key": None,
+            "value": {"id": 1},
+            "headers": [
+                (ATTEMPT_HEADER, b"1"),
+                (ORIGINAL_TOPIC_HEADER, b"orders"),
+            ],
+        }
+
+        assert router.route(message, ValueError("still failing")) == "orders.dlq"
+        router.flush()
+
+        [record] = _values(broker, "orders.dlq")
+        assert header_value(record.headers, ATTEMPT_HEADER) == "2"
+
+    def test_retry_consumer_waits_until_due(self, broker, producer):
+        """Test retry records are handled only after their delay."""
+        router = DeadLetterRouter(producer, delays_ms=[200])
+        router.route(
+            {
+                "topic": "orders",
+                "partition": 0,
+                "offset": 0,
+                "key": None,
+                "value": {"id": 1},
+                "headers": [],
+            },
+            ValueError("first failure"),
+        )
+        router.flush()
+
+        handled = []
+        consumer = self._consumer(broker, "orders.retry.1")
+        retry = RetryConsumer(consumer, lambda m: handled.append(time.time()), router)
+
+        start = time.time()
+        assert retry.run(timeout_ms=50, max_messages=1) == 1
+        consumer.close()
+
+        assert handled[0] - start >= 0.15
+        assert retry.stats()["deferred"] >= 1
+        assert broker.committed("orders.retry.1-group", "orders.retry.1", 0) == 1
+
+    def test_raw_value_is_forwarded_unchanged(self, broker, producer):
+        """Test routing keeps the original bytes and codec of a message."""
+        producer.config.topic_serializers = {"sensors": "reading"}
+        router = DeadLetterRouter(producer, delays_ms=[0])
+        tagged = {
+            "topic": "orders",
+            "partition": 0,
+            "offset": 0,
+            "key": None,
+            "value": {"sensor_id": 7},
+            "headers": [(CODEC_HEADER, b"reading")],
+        }
+        implied = dict(tagged, topic="sensors", headers=[])
+
+        router.route(tagged, ValueError("bad"), raw_value=b"\x07\x00\x00\x00")
+        router.route(implied, ValueError("bad"), raw_value=b"\x08\x00\x00\x00")
+        assert router.flush() == {}
+
+        [record] = _values(broker, "orders.retry.1")
+        assert record.value == b"\x07\x00\x00\x00"
+        assert header_value(record.headers, CODEC_HEADER) == "reading"
+        [record] = _values(broker, "sensors.retry.1")
+        assert record.value == b"\x08\x00\x00\x00"
+        assert header_value(record.headers, CODEC_HEADER) == "reading"
+
+    def test_failed_route_keeps_offset_uncommitted(self, broker, producer):
+        """Test a message whose retry send failed is not committed."""
+        router = DeadLetterRouter(producer, delays_ms=[0, 0])
+        router.route(
+            {
+                "topic": "orders",
+                "partition": 0,
+                "offset": 0,
+                "key": None,
+                "value": {"id": 1},
+                "headers": [],
+            },
+            ValueError("first failure"),
+        )
+        router.flush()
+
+        send = producer._producer.send
+
+        def failing_send(topic, *args, **kwargs):
+            if topic == "orders.retry.2":
+                raise LibKafkaError("broker unavailable")
+            return send(topic, *args, **kwargs)
+
+        producer._producer.send = failing_send
+
+        def handler(message):
+            raise ValueError("second failure")
+
+        consumer = self._consumer(broker, "orders.retry.1")
+        retry = RetryConsumer(consumer, handler, router)
+        assert retry.run(timeout_ms=50, max_messages=1) == 1
+
+        tp = TopicPartition("orders.retry.1", 0)
+        assert broker.committed("orders.retry.1-group", "orders.retry.1", 0) is None
+        assert consumer._consumer.position(tp) == 0
+        assert router.stats() == {
+            "retried": 1,
+            "dead_lettered": 0,
+            "route_failures": 1,
+        }
+        consumer.close()
+
+    def test_unqueued_message_is_not_counted(self, producer, monkeypatch):
+        """Test a message send_async rejects is not counted as routed."""
+        router = DeadLetterRouter(producer, delays_ms=[0])
+
+        def full_buffer(*args, **kwargs):
+            raise ProducerError("Delivery buffer is full")
+
+        monkeypatch.setattr(producer, "send_async", full_buffer)
+        message = {
+            "topic": "orders",
+            "partition": 0,
+            "offset": 0,
+            "key": None,
+            "value": {"id": 1},
+            "headers": [],
+        }
+
+        with pytest.raises(ProducerError):
+            router.route(message, ValueError("poison"))
+
+        assert router.stats()["retried"] == 0
+
+    def test_process_parallel_holds_back_undelivered_offsets(self, broker, producer):
+        """Test process_parallel does not commit past a message never routed."""
+        producer.send_batch([{"value": {"id": i}} for i in range(10)])
+        router = DeadLetterRouter(producer, delays_ms=[0])
+
+        send = producer._producer.send
+        retry_sends = []
+
+        def failing_send(topic, *args, **kwargs):
+            if topic == "orders.retry.1":
+                retry_sends.append(topic)
+                if len(retry_sends) == 2:
+                    raise LibKafkaError("broker unavailable")
+            return send(topic, *args, **kwargs)
+
+        producer._producer.send = failing_send
+
+        def handler(message):
+            if message["value"]["id"] in (3, 6):
+                raise ValueError("poison")
+
+        consumer = FakeBrokerConsumerService(
+            broker,
+            KafkaConfig(
+                topic="orders", group_id="orders-group", auto_offset_reset="earliest"
+            ),
+        )
+        count = consumer.process_parallel(
+            router.wrap(handler),
+            max_workers=2,
+            timeout_ms=50,
+            max_messages=10,
+            before_commit=router.flush,
+        )
+        consumer.close()
+
+        assert count == 10
+        assert broker.committed("orders-group", "orders", 0) == 6
+        [record] = _values(broker, "orders.retry.1")
+        assert header_value(record.headers, ATTEMPT_HEADER) == "1"
+        assert router.stats()["retried"] == 1
+        assert router.stats()["route_failures"] == 1
+
+    def test_routing_handler_is_thread_only(self, producer):
+        """Test a wrapped handler refuses to be sent to a process pool."""
+        handle = DeadLetterRouter(producer).wrap(print)
+
+        with pytest.raises(TypeError, match="use_processes"):
+            pickle.dumps(handle)
+
+    def test_retry_consumer_requires_manual_commit(self, broker, producer):
+        """Test auto-committing consumers are rejected."""
+        consumer = FakeBrokerConsumerService(
+            broker,
+            KafkaConfig(topic="orders.retry.1", group_id="g", enable_auto_commit=True),
+        )
+        with pytest.raises(ConsumerError):
+            RetryConsumer(consumer, print, DeadLetterRouter(producer))
+        consumer.close()
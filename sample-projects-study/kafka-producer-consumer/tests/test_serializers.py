@@ -0,0 +1,61 @@
+"""Tests for Kafka value serializers."""
+
+import pytest
+
+from src.kafka.exceptions import SerializationError
+from src.kafka.serializers import (
+    JsonSerializer,
+    SerializerRegistry,
+    StructSerializer,
+    default_registry,
+)
+
+
+class TestSerializers:
+    """Test cases for built-in serializers and the registry."""
+
+    def test_json_round_trip(self):
+        """Test JSON serializer round trip."""
+        serializer = JsonSerializer()
+        data = {"name": "test", "values": [1, 2, 3]}
+        assert serializer.deserialize(serializer.serialize(data)) == data
+
+    def test_json_invalid_value(self):
+        """Test JSON serializer rejects non-serializable values."""
+        with pytest.raises(SerializationError):
+            JsonSerializer().serialize(object())
+
+    def test_struct_round_trip(self):
+        """Test struct serializer packs fields in schema order."""
+        serializer = StructSerializer("reading", [("sensor_id", "I"), ("value", "d")])
+        data = serializer.serialize({"value": 1.5, "sensor_id": 7})
+        assert len(data) == 12
+        assert serializer.deserialize(data) == {"sensor_id": 7, "value": 1.5}
+
+    def test_struct_missing_field(self):
+        """Test struct serializer rejects values missing a schema field."""
+        serializer = StructSerializer("reading", [("sensor_id", "I")])
+        with pytest.raises(SerializationError):
+            serializer.serialize({})
+
+    def test_struct_invalid_schema(self):
+        """Test struct serializer rejects invalid format characters."""
+        with pytest.raises(SerializationError):
+            StructSerializer("broken", [("field", "Z")])
+
+    def test_registry_lookup(self):
+        """Test registry returns serializers by codec name."""
+        registry = SerializerRegistry()
+        serializer = StructSerializer("reading", [("sensor_id", "I")])
+        registry.register(serializer)
+        assert "reading" in registry
+        assert registry.get("reading") is serializer
+
+    def test_registry_unknown_codec(self):
+        """Test registry raises for unknown codec names."""
+        with pytest.raises(SerializationError):
+            SerializerRegistry().get("missing")
+
+    def test_default_registry_has_json(self):
+        """Test default registry always provides stdlib JSON."""
+        assert "json" in default_registry()
@@ -0,0 +1,128 @@
+"""Tests for transactional producing."""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.kafka.config import KafkaConfig
+from src.kafka.exceptions import ProducerError
+from src.kafka.fake_broker import (
+    FakeBroker,
+    FakeBrokerConsumerService,
+    FakeBrokerProducerService,
+    FakeKafkaConsumer,
+)
+from src.kafka.metrics import REGISTRY
+from src.kafka.producer import KafkaProducerService
+from src.kafka.transactions import TransactionalProcessor
+
+
+class TestTransactions:
+    """Test cases for transactional producer and TransactionalProcessor."""
+
+    @pytest.fixture
+    def broker(self):
+        """Create a broker with 25 input messages."""
+        broker = FakeBroker(num_partitions=2)
+        producer = FakeBrokerProducerService(broker, KafkaConfig(topic="input"))
+        producer.send_batch([{"value": {"id": i}} for i in range(25)])
+        producer.close()
+        return broker
+
+    def _processor(self, broker, transform, **kwargs):
+        """Create a processor reading 'input' and writing 'output'."""
+        producer = FakeBrokerProducerService(
+            broker, KafkaConfig(topic="output", transactional_id="tx-1")
+        )
+        consumer = FakeBrokerConsumerService(
+            broker,
+            KafkaConfig(
+                topic="input",
+                group_id="processor",
+                isolation_level="read_committed",
+            ),
+        )
+        return TransactionalProcessor(producer, consumer, transform, **kwargs)
+
+    def _read_committed(self, broker):
+        """Read values of committed records from 'output'."""
+        consumer = FakeKafkaConsumer(
+            "output",
+            broker=broker,
+            auto_offset_reset="earliest",
+            isolation_level="read_committed",
+        )
+        records = consumer.poll(timeout_ms=50, max_records=100)
+        consumer.close()
+        return [int(record.value) for batch in records.values() for record in batch]
+
+    def test_transactional_producer_configuration(self):
+        """Test transactional_id is passed on and transactions initialized."""
+        config = KafkaConfig(topic="test-topic", transactional_id="tx-1")
+        with patch("src.kafka.producer.KafkaProducer") as mock_kafka:
+            mock_kafka.return_value = MagicMock()
+            producer = KafkaProducerService(config=config)
+
+            with producer.transaction():
+                producer.send_batch([{"value": "a"}])
+
+            _, kwargs = mock_kafka.call_args
+            assert kwargs["transactional_id"] == "tx-1"
+            mock_kafka.return_value.init_transactions.assert_called_once()
+            mock_kafka.return_value.begin_transaction.assert_called_once()
+            mock_kafka.return_value.commit_transaction.assert_called_once()
+
+    def test_transaction_requires_transactional_id(self):
+        """Test transaction methods fail without transactional_id."""
+        with patch("src.kafka.producer.KafkaProducer"):
+            producer = KafkaProducerService(config=KafkaConfig(topic="test-topic"))
+            with pytest.raises(ProducerError):
+                producer.begin_transaction()
+
+    def test_processor_commits_outputs_and_offsets(self, broker):
+        """Test outputs and input offsets are committed in batches."""
+        processor = self._processor(
+            broker, lambda m: {"value": m["value"]["id"] * 2}, max_messages=10
+        )
+
+        assert processor.run(timeout_ms=50, max_messages=25) == 25
+
+        assert sorted(self._read_committed(broker)) == [i * 2 for i in range(25)]
+        committed = sum(
+            broker.committed("processor", "input", p) or 0 for p in (0, 1)
+        )
+        assert committed == 25
+        assert processor.stats()["transactions"] >= 3
+        assert processor._first_offsets == {}
+
+    def test_processor_polls_through_the_service(self, broker):
+        """Test polls are recorded in the consumer metrics."""
+
+        def consumed():
+            for line in REGISTRY.render().splitlines():
+                if line.startswith('kafka_consumer_messages_total{topic="input"} '):
+                    return float(line.rsplit(" ", 1)[1])
+            return 0.0
+
+        before = consumed()
+        processor = self._processor(broker, lambda m: None, max_messages=10)
+
+        assert processor.run(timeout_ms=50, max_messages=25) == 25
+        assert consumed() - before == 25
+
+    def test_failed_transaction_is_aborted_and_replayed(self, broker):
+        """Test an aborted transaction is invisible and its input replayed."""
+        processor = self._processor(
+            broker, lambda m: {"value": m["value"]["id"]}, max_messages=100
+        )
+        processor.producer.commit_transaction = MagicMock(
+            side_effect=ProducerError("fenced")
+        )
+
+        with pytest.raises(ProducerError):
+            processor.run(timeout_ms=50, max_messages=25)
+        assert self._read_committed(broker) == []
+        assert processor.stats()["aborted"] == 1
+
+        del processor.producer.commit_transaction
+        assert processor.run(timeout_ms=50, max_messages=25) == 25
+        assert sorted(self._read_committed(broker)) == list(range(25))
@@ -0,0 +1,57 @@
+"""Tests for the partition-ordered worker pool."""
+
+import threading
+
+from src.kafka.workers import PartitionWorkerPool
+
+
+def _messages(partition, offsets):
+    """Build message dictionaries for one partition."""
+    return [
+        {"topic": "test-topic", "partition": partition, "offset": offset}
+        for offset in offsets
+    ]
+
+
+class TestPartitionWorkerPool:
+    """Test cases for PartitionWorkerPool."""
+
+    def test_preserves_order_within_partition(self):
+        """Test chunks of a partition are processed in submission order."""
+        seen = {0: [], 1: []}
+        lock = threading.Lock()
+
+        def handler(message):
+            with lock:
+                seen[message["partition"]].append(message["offset"])
+
+        pool = PartitionWorkerPool(handler, max_workers=4)
+        for start in range(0, 100, 10):
+            pool.submit("p0", _messages(0, range(start, start + 10)))
+            pool.submit("p1", _messages(1, range(start, start + 10)))
+
+        assert pool.wait_idle(timeout_ms=5000)
+        pool.shutdown()
+
+        assert seen[0] == list(range(100))
+        assert seen[1] == list(range(100))
+        assert pool.committable_offsets() == {"p0": 100, "p1": 100}
+        assert pool.committable_offsets() == {}
+
+    def test_failure_stops_lane_at_last_good_offset(self):
+        """Test a handler failure keeps the contiguous offset committable."""
+        def handler(message):
+            if message["partition"] == 0 and message["offset"] == 5:
+                raise ValueError("poison")
+
+        pool = PartitionWorkerPool(handler, max_workers=2)
+        pool.submit("p0", _messages(0, range(0, 10)))
+        pool.submit("p0", _messages(0, range(10, 20)))
+        pool.submit("p1", _messages(1, range(0, 10)))
+
+        assert pool.wait_idle(timeout_ms=5000)
+        pool.shutdown()
+
+        assert pool.committable_offsets() == {"p0": 5, "p1": 10}
+        assert "poison" in pool.errors()["p0"]
+        assert pool.pending("p0") == 0
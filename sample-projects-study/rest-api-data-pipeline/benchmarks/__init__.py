@@ -0,0 +1 @@
+"""Benchmarks for the API client against a local stand-in server."""
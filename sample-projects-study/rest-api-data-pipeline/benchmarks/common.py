@@ -0,0 +1,109 @@
+"""Shared helpers for API client benchmarks."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Type
+from urllib.parse import parse_qs, urlparse
+
+
+class _JSONHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a small JSON page over persistent HTTP/1.1."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    latency_s = 0.0
+    total_pages = 100
+
+    def do_GET(self) -> None:
+        """Write a page of items for the requested page number."""
+        query = parse_qs(urlparse(self.path).query)
+        page = int(query.get("page", ["1"])[0])
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        body = json.dumps(
+            {
+                "items": [{"id": page * 10 + i} for i in range(10)],
+                "pagination": {"page": page, "total_pages": self.total_pages},
+            }
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+        pass
+
+
+class LocalServer:
+    """Threaded HTTP server on localhost, used as a context manager."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        total_pages: int = 100,
+        handler_class: Type[BaseHTTPRequestHandler] = _JSONHandler,
+    ):
+        """Initialize server.
+
+        Args:
+            latency_ms: Delay added to every response
+            total_pages: Page count reported in every response
+            handler_class: Request handler (defaults to small JSON pages)
+        """
+        handler = type(
+            "Handler",
+            (handler_class,),
+            {"latency_s": latency_ms / 1000, "total_pages": total_pages},
+        )
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self) -> "LocalServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def format_table(rows: List[Dict[str, Any]], columns: List[str]) -> str:
+    """Render rows as a fixed-width text table.
+
+    Args:
+        rows: Result dictionaries
+        columns: Keys to print, in order
+
+    Returns:
+        Table as a string
+    """
+    widths = {
+        column: max(len(column), *(len(str(row[column])) for row in rows))
+        for column in columns
+    }
+    lines = ["  ".join(column.rjust(widths[column]) for column in columns)]
+    for row in rows:
+        lines.append(
+            "  ".join(str(row[column]).rjust(widths[column]) for column in columns)
+        )
+    return "\n".join(lines)
+
+
+class Timer:
+    """Context manager measuring wall-clock time."""
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.elapsed = time.perf_counter() - self.start
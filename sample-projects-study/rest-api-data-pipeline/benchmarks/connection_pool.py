@@ -0,0 +1,81 @@
+"""Compare requests/s with and without connection reuse.
+
+Usage:
+    python -m benchmarks.connection_pool --requests 2000 --threads 8
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from src.api.client import StatelessAPIClient
+
+from .common import LocalServer, Timer, format_table
+
+COLUMNS = ["mode", "threads", "requests", "req/s"]
+
+
+def run_once(
+    mode: str, get: Callable[[int], Any], count: int, threads: int
+) -> Dict[str, Any]:
+    """Issue count GETs, spread over threads, and measure throughput.
+
+    Returns:
+        Result row for the table
+    """
+    with Timer() as timer:
+        if threads <= 1:
+            for page in range(count):
+                get(page)
+        else:
+            with ThreadPoolExecutor(max_workers=threads) as pool:
+                list(pool.map(get, range(count)))
+
+    return {
+        "mode": mode,
+        "threads": threads,
+        "requests": count,
+        "req/s": round(count / timer.elapsed),
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    rows = []
+    with LocalServer(latency_ms=args.latency_ms) as server:
+        url = f"{server.url}/items"
+
+        def module_get(page: int) -> Any:
+            return requests.get(url, params={"page": page}, timeout=30).json()
+
+        for threads in sorted({1, args.threads}):
+            rows.append(
+                run_once("requests.get", module_get, args.requests, threads)
+            )
+            for keep_alive in (False, True):
+                client = StatelessAPIClient(
+                    server.url, keep_alive=keep_alive, pool_maxsize=max(threads, 1)
+                )
+                rows.append(
+                    run_once(
+                        "pooled" if keep_alive else "no keep-alive",
+                        lambda page: client.get("items", {"page": page}),
+                        args.requests,
+                        threads,
+                    )
+                )
+                client.close()
+
+    print(format_table(rows, COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
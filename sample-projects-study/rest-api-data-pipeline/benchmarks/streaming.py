@@ -0,0 +1,104 @@
+"""Compare peak memory of response.json() and get_stream() on a large array.
+
+Usage:
+    python -m benchmarks.streaming --records 200000
+"""
+
+import argparse
+import json
+import tracemalloc
+from http.server import BaseHTTPRequestHandler
+from typing import Any, Callable, Dict, List
+
+from src.api.client import StatelessAPIClient
+
+from .common import LocalServer, Timer, format_table
+
+COLUMNS = ["mode", "records", "body MB", "peak MB", "seconds"]
+
+
+class _LargeArrayHandler(BaseHTTPRequestHandler):
+    """Answer every GET with a chunked {"items": [...]} body."""
+
+    protocol_version = "HTTP/1.1"
+    records = 0
+
+    def do_GET(self) -> None:
+        """Write records one chunk at a time without building the body."""
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        self._chunk(b'{"items": [')
+        for start in range(0, self.records, 1000):
+            records = (
+                {"id": i, "name": f"record {i}", "tags": ["a", "b"], "score": i / 7}
+                for i in range(start, min(start + 1000, self.records))
+            )
+            prefix = "," if start else ""
+            body = prefix + ",".join(json.dumps(record) for record in records)
+            self._chunk(body.encode("utf-8"))
+        self._chunk(b"]}")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _chunk(self, data: bytes) -> None:
+        """Write one chunk of the chunked transfer encoding."""
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging."""
+        pass
+
+
+def run_once(mode: str, consume: Callable[[], int], records: int) -> Dict[str, Any]:
+    """Consume the response once under tracemalloc.
+
+    Returns:
+        Result row for the table
+    """
+    tracemalloc.start()
+    with Timer() as timer:
+        count = consume()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert count == records, f"{mode} read {count} of {records} records"
+    return {
+        "mode": mode,
+        "records": records,
+        "peak MB": round(peak / 1e6, 1),
+        "seconds": round(timer.elapsed, 2),
+    }
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    handler = type("Handler", (_LargeArrayHandler,), {"records": args.records})
+    rows = []
+    with LocalServer(handler_class=handler) as server:
+        client = StatelessAPIClient(server.url)
+        body_mb = round(
+            len(client._session.get(f"{server.url}/items").content) / 1e6, 1
+        )
+        rows.append(
+            run_once("json()", lambda: len(client.get("items")["items"]), args.records)
+        )
+        rows.append(
+            run_once(
+                "get_stream()",
+                lambda: sum(1 for _ in client.get_stream("items")),
+                args.records,
+            )
+        )
+        client.close()
+
+    for row in rows:
+        row["body MB"] = body_mb
+    print(format_table(rows, COLUMNS))
+
+
+if __name__ == "__main__":
+    main()
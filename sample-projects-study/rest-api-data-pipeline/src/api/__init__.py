@@ -1,7 +1,18 @@
 """API client module for REST API Data Pipeline."""
 
-from .client import APIClient
+from .async_client import AsyncAPIClient
+from .client import BaseAPIClient, StatefulAPIClient, StatelessAPIClient
 from .exceptions import APIError, ValidationError
 
-__all__ = ["APIClient", "APIError", "ValidationError"]
+# Name exported before the clients were split; kept for existing imports.
+APIClient = BaseAPIClient
 
+__all__ = [
+    "APIClient",
+    "BaseAPIClient",
+    "StatelessAPIClient",
+    "StatefulAPIClient",
+    "AsyncAPIClient",
+    "APIError",
+    "ValidationError",
+]
@@ -0,0 +1,383 @@
+"""Asyncio API client built on aiohttp."""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, AsyncGenerator, Deque, Dict, Optional, Set
+
+from .client import BaseAPIClient
+from .exceptions import APIError, NetworkError, TimeoutError, ValidationError
+from .streaming import JSONItemStream
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """Asyncio API client with the surface of StatelessAPIClient.
+
+    Requests share one aiohttp connection pool and at most
+    ``max_concurrency`` of them are in flight at a time, so a single event
+    loop can schedule thousands of ``get`` calls (e.g. with
+    ``asyncio.gather``) without overwhelming the upstream or running out of
+    sockets.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 100
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = BaseAPIClient.DEFAULT_TIMEOUT,
+        max_retries: int = BaseAPIClient.DEFAULT_RETRIES,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        **pool_options: Any,
+    ):
+        """Initialize async API client.
+
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            max_concurrency: Maximum requests in flight
+            **pool_options: Connection pool settings of BaseAPIClient;
+                ``pool_maxsize`` limits connections per host
+
+        Raises:
+            APIError: If aiohttp is not installed
+            ValidationError: If max_concurrency is not positive
+        """
+        if aiohttp is None:
+            raise APIError("aiohttp is not installed")
+        if max_concurrency < 1:
+            raise ValidationError("max_concurrency must be >= 1")
+
+        super().__init__(base_url, timeout, max_retries, **pool_options)
+        self.max_concurrency = max_concurrency
+        self._http: Optional["aiohttp.ClientSession"] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.logger.info("Initialized AsyncAPIClient with base_url: %s", base_url)
+
+    def _get_http(self) -> "aiohttp.ClientSession":
+        """Get the aiohttp session, creating it on the running loop."""
+        if self._http is None or self._http.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.max_concurrency,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+            )
+            self._http = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[self._trace_config()] if self.instrumentation else None,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._http
+
+    @staticmethod
+    def _trace_config() -> "aiohttp.TraceConfig":
+        """Build a TraceConfig recording DNS and connect time on the span.
+
+        The span travels as ``trace_request_ctx``; aiohttp's connection time
+        includes DNS and TLS, so DNS is subtracted and TLS is not reported
+        separately.
+        """
+
+        async def on_dns_start(session, ctx, params):
+            ctx.dns_start = time.perf_counter()
+
+        async def on_dns_end(session, ctx, params):
+            if ctx.trace_request_ctx is not None:
+                ctx.trace_request_ctx.dns = time.perf_counter() - ctx.dns_start
+
+        async def on_connect_start(session, ctx, params):
+            ctx.connect_start = time.perf_counter()
+
+        async def on_connect_end(session, ctx, params):
+            span = ctx.trace_request_ctx
+            if span is not None:
+                elapsed = time.perf_counter() - ctx.connect_start
+                span.connect = max(0.0, elapsed - (span.dns or 0.0))
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_dns_resolvehost_start.append(on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_end)
+        trace_config.on_connection_create_start.append(on_connect_start)
+        trace_config.on_connection_create_end.append(on_connect_end)
+        return trace_config
+
+    async def get(
+        self, endpoint: str, params: Optional[Dict] = None
+    ) -> Dict[str, Any]:
+        """Make GET request to endpoint.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            ValidationError: If endpoint is invalid
+            NetworkError: If network error occurs
+            TimeoutError: If request times out
+            APIError: For HTTP error statuses and other request errors
+        """
+        if not endpoint:
+            raise ValidationError("endpoint cannot be empty")
+
+        url = self._build_url(endpoint)
+        self.logger.debug("GET request (async) to %s with params: %s", url, params)
+        http = self._get_http()
+
+        try:
+            async with self._semaphore:
+                with self._span("GET", url) as span:
+                    start = time.perf_counter()
+                    async with http.get(
+                        url,
+                        params=params or {},
+                        headers=self._get_headers(),
+                        trace_request_ctx=span,
+                    ) as response:
+                        if span is not None:
+                            span.ttfb = time.perf_counter() - start
+                            span.status_code = response.status
+                        response.raise_for_status()
+                        data = await response.json(content_type=None)
+                        if span is not None:
+                            span.download = time.perf_counter() - start - span.ttfb
+                        return data
+
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as e:
+            raise self._error(url, e)
+
+    async def get_stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items",
+        chunk_size: int = BaseAPIClient.DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> AsyncGenerator[Any, None]:
+        """Stream the elements of a JSON array response.
+
+        Same semantics as BaseAPIClient.get_stream. The request holds one
+        concurrency slot until the stream is exhausted or closed.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+            items_key: Member holding the array when the body is an object
+            chunk_size: Bytes read from the socket at a time
+
+        Yields:
+            Array elements in order
+
+        Raises:
+            ValidationError: If endpoint is invalid
+            NetworkError: If network error occurs
+            TimeoutError: If request times out
+            APIError: For HTTP error statuses and malformed bodies
+        """
+        if not endpoint:
+            raise ValidationError("endpoint cannot be empty")
+
+        url = self._build_url(endpoint)
+        self.logger.debug("GET stream (async) from %s with params: %s", url, params)
+        http = self._get_http()
+        stream = JSONItemStream(items_key)
+
+        try:
+            async with self._semaphore:
+                # The span ends with the headers; stream bodies are not timed
+                with self._span("GET", url) as span:
+                    start = time.perf_counter()
+                    response = await http.get(
+                        url,
+                        params=params or {},
+                        headers=self._get_headers(),
+                        trace_request_ctx=span,
+                    )
+                    if span is not None:
+                        span.ttfb = time.perf_counter() - start
+                        span.status_code = response.status
+                async with response:
+                    response.raise_for_status()
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        for item in stream.feed(chunk):
+                            yield item
+                        if stream.done:
+                            return
+                    for item in stream.close():
+                        yield item
+
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as e:
+            raise self._error(url, e)
+
+    def _error(self, url: str, error: Exception) -> APIError:
+        """Map an aiohttp or decoding failure to the client's exceptions.
+
+        Args:
+            url: Request URL
+            error: Exception raised by aiohttp or the JSON decoder
+
+        Returns:
+            Exception to raise
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            error_msg = f"Request to {url} timed out after {self.timeout}s"
+            self.logger.error(error_msg)
+            return TimeoutError(error_msg)
+
+        if isinstance(error, aiohttp.ClientResponseError):
+            error_msg = f"HTTP {error.status} from {url}"
+            self.logger.error(error_msg)
+            return APIError(error_msg, error.status)
+
+        if isinstance(error, aiohttp.ClientConnectionError):
+            error_msg = f"Connection error to {url}: {str(error)}"
+            self.logger.error(error_msg)
+            return NetworkError(error_msg)
+
+        error_msg = f"Request error to {url}: {str(error)}"
+        self.logger.error(error_msg)
+        return APIError(error_msg)
+
+    async def get_paginated(
+        self,
+        endpoint: str,
+        page_param: str = "page",
+        limit_param: str = "limit",
+        limit: int = 10,
+        max_workers: int = 1,
+        ordered: bool = True,
+        total_pages_key: str = "total_pages",
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Fetch paginated data from endpoint.
+
+        Same semantics as StatelessAPIClient.get_paginated: with
+        ``max_workers`` above 1 and a page count in the first response, up
+        to ``2 * max_workers`` pages are requested ahead of the consumer.
+
+        Args:
+            endpoint: API endpoint
+            page_param: Parameter name for page number
+            limit_param: Parameter name for page size
+            limit: Number of items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; if False, yield them as
+                they complete
+            total_pages_key: Response field holding the number of pages
+
+        Yields:
+            Data from each page
+        """
+        first = await self._get_page(endpoint, page_param, limit_param, limit, 1)
+        if first is None:
+            return
+        yield first
+
+        total_pages = self._total_pages(first, total_pages_key)
+        if max_workers <= 1 or total_pages is None:
+            page = 2
+            while True:
+                data = await self._get_page(
+                    endpoint, page_param, limit_param, limit, page
+                )
+                if data is None:
+                    return
+                yield data
+                page += 1
+
+        pages = iter(range(2, total_pages + 1))
+        window = 2 * max_workers
+
+        def submit() -> Optional[asyncio.Future]:
+            page = next(pages, None)
+            if page is None:
+                return None
+            return asyncio.ensure_future(
+                self._get_page(endpoint, page_param, limit_param, limit, page)
+            )
+
+        if ordered:
+            queue: Deque[asyncio.Future] = deque()
+            try:
+                for _ in range(window):
+                    task = submit()
+                    if task is not None:
+                        queue.append(task)
+                while queue:
+                    data = await queue.popleft()
+                    if data is None:
+                        return
+                    yield data
+                    task = submit()
+                    if task is not None:
+                        queue.append(task)
+            finally:
+                for task in queue:
+                    task.cancel()
+        else:
+            pending: Set[asyncio.Future] = set()
+            try:
+                for _ in range(window):
+                    task = submit()
+                    if task is not None:
+                        pending.add(task)
+                while pending:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for finished in done:
+                        data = finished.result()
+                        if data is None:
+                            return
+                        yield data
+                        task = submit()
+                        if task is not None:
+                            pending.add(task)
+            finally:
+                for task in pending:
+                    task.cancel()
+
+    async def _get_page(
+        self,
+        endpoint: str,
+        page_param: str,
+        limit_param: str,
+        limit: int,
+        page: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one page.
+
+        Returns:
+            Page data, or None if the page is empty or could not be fetched
+        """
+        params = {page_param: page, limit_param: limit}
+        try:
+            data = await self.get(endpoint, params)
+        except APIError as e:
+            self.logger.error("Error fetching page %d: %s", page, e)
+            return None
+        if self._is_empty_page(data):
+            return None
+        return data
+
+    async def aclose(self) -> None:
+        """Close the aiohttp session and its connections."""
+        if self._http is not None and not self._http.closed:
+            await self._http.close()
+            self.logger.info("Session closed")
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        await self.aclose()
@@ -0,0 +1,201 @@
+"""DataLoader-style batching of single-record lookups."""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any, Dict, Hashable, Iterable, List, Optional
+
+from .exceptions import APIError, ValidationError
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import BaseAPIClient
+
+
+class BatchLoader:
+    """Collect single-record loads into batched GETs.
+
+    ``load`` calls made from any thread within ``max_wait_ms`` of the first
+    one (or until ``max_batch_size`` distinct ids are waiting) are sent as
+    one request, ``GET endpoint?ids=1,2,3``, and the response is split back
+    to the callers by ``id_key``. The response may be a list of records, an
+    object with an ``items_key`` list, or an object mapping ids to records.
+    Ids missing from the response fail with a 404 APIError; a failed batch
+    request fails every load in it.
+    """
+
+    DEFAULT_MAX_BATCH_SIZE = 100
+    DEFAULT_MAX_WAIT_MS = 5.0
+
+    def __init__(
+        self,
+        client: "BaseAPIClient",
+        endpoint: str,
+        ids_param: str = "ids",
+        id_key: str = "id",
+        items_key: str = "items",
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        separator: str = ",",
+    ):
+        """Initialize batch loader.
+
+        Args:
+            client: Synchronous API client used to send batches
+            endpoint: Batch endpoint
+            ids_param: Query parameter carrying the ids
+            id_key: Record field holding its id
+            items_key: Member holding the records when the body is an object
+            max_batch_size: Most ids sent in one request
+            max_wait_ms: How long the first load waits for others to join
+            separator: Separator between ids in ids_param
+
+        Raises:
+            ValidationError: If the settings are invalid or the client is
+                asynchronous
+        """
+        if not endpoint:
+            raise ValidationError("endpoint cannot be empty")
+        if max_batch_size < 1 or max_wait_ms < 0:
+            raise ValidationError(
+                "expected max_batch_size >= 1 and max_wait_ms >= 0"
+            )
+        if asyncio.iscoroutinefunction(client.get):
+            raise ValidationError("BatchLoader needs a synchronous client")
+
+        self.client = client
+        self.endpoint = endpoint
+        self.ids_param = ids_param
+        self.id_key = id_key
+        self.items_key = items_key
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.separator = separator
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._pending: Dict[Hashable, Future] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        self._stats = {"loads": 0, "batches": 0}
+
+    def load(self, record_id: Hashable) -> Any:
+        """Load one record, batched with concurrent loads.
+
+        Args:
+            record_id: Id of the record
+
+        Returns:
+            The record
+
+        Raises:
+            APIError: If the batch request failed or the id was not returned
+        """
+        return self._enqueue(record_id).result()
+
+    def load_many(self, record_ids: Iterable[Hashable]) -> List[Any]:
+        """Load several records in as few requests as possible.
+
+        Batches are sent as soon as they are full and the remainder right
+        away, without waiting for ``max_wait_ms``.
+
+        Args:
+            record_ids: Ids of the records
+
+        Returns:
+            Records in the order of record_ids
+
+        Raises:
+            APIError: If a batch failed or an id was not returned
+        """
+        futures = [self._enqueue(record_id) for record_id in record_ids]
+        self.flush()
+        return [future.result() for future in futures]
+
+    def flush(self) -> None:
+        """Send the waiting loads now."""
+        with self._lock:
+            batch = self._take_pending()
+        if batch:
+            self._dispatch(batch)
+
+    def stats(self) -> Dict[str, int]:
+        """Get load counters.
+
+        Returns:
+            Dictionary with loads requested and batch requests sent
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def _enqueue(self, record_id: Hashable) -> Future:
+        """Add an id to the waiting batch, sending it once full."""
+        batch = None
+        with self._lock:
+            self._stats["loads"] += 1
+            future = self._pending.get(record_id)
+            if future is None:
+                future = self._pending[record_id] = Future()
+                if len(self._pending) >= self.max_batch_size:
+                    batch = self._take_pending()
+                elif self._timer is None:
+                    self._timer = threading.Timer(
+                        self.max_wait_ms / 1000, self._flush_batch, (self._pending,)
+                    )
+                    self._timer.daemon = True
+                    self._timer.start()
+        if batch:
+            self._dispatch(batch)
+        return future
+
+    def _flush_batch(self, pending: Dict[Hashable, Future]) -> None:
+        """Send a waiting batch when its timer fires, unless already sent."""
+        with self._lock:
+            batch = self._take_pending() if pending is self._pending else None
+        if batch:
+            self._dispatch(batch)
+
+    def _take_pending(self) -> Dict[Hashable, Future]:
+        """Detach the waiting batch; the caller holds the lock."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        if batch:
+            self._stats["batches"] += 1
+        return batch
+
+    def _dispatch(self, batch: Dict[Hashable, Future]) -> None:
+        """Send one batch request and resolve its futures."""
+        ids = self.separator.join(str(record_id) for record_id in batch)
+        self.logger.debug("Loading %d records from %s", len(batch), self.endpoint)
+        try:
+            data = self.client.get(self.endpoint, {self.ids_param: ids})
+            records = self._index(data)
+            for record_id, future in batch.items():
+                record = records.get(str(record_id))
+                if record is None:
+                    error_msg = f"{self.endpoint} did not return id {record_id}"
+                    future.set_exception(APIError(error_msg, 404))
+                else:
+                    future.set_result(record)
+        except Exception as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+
+    def _index(self, data: Any) -> Dict[str, Any]:
+        """Map the ids in a batch response to their records.
+
+        Raises:
+            APIError: If the response has an unexpected shape
+        """
+        if isinstance(data, dict) and isinstance(data.get(self.items_key), list):
+            data = data[self.items_key]
+        if isinstance(data, dict):
+            return {str(key): record for key, record in data.items()}
+        if isinstance(data, list):
+            return {
+                str(record[self.id_key]): record
+                for record in data
+                if isinstance(record, dict) and self.id_key in record
+            }
+        raise APIError(f"Unexpected batch response from {self.endpoint}")
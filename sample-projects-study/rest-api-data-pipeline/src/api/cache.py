@@ -0,0 +1,293 @@
+"""HTTP response cache with conditional revalidation."""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlencode
+
+
+@dataclass
+class CacheEntry:
+    """Parsed response payload with its validators and freshness."""
+
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    expires_at: float = 0.0
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the entry may be served without asking the server."""
+        return (now or time.time()) < self.expires_at
+
+    def has_validators(self) -> bool:
+        """Whether the entry can be revalidated with a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Get If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value: Optional[str]) -> Dict[str, Optional[str]]:
+    """Parse a Cache-Control header into lower-cased directives.
+
+    Args:
+        value: Header value
+
+    Returns:
+        Mapping of directive to its argument (None for flags)
+    """
+    directives: Dict[str, Optional[str]] = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def freshness_lifetime(headers: Mapping[str, str], default_ttl: float) -> float:
+    """Get how many seconds a response stays fresh.
+
+    ``max-age`` wins over ``Expires``; ``no-cache`` makes every use
+    revalidate. Without either, ``default_ttl`` applies. The ``Age`` header
+    is subtracted.
+
+    Args:
+        headers: Response headers (case-insensitive mapping)
+        default_ttl: Lifetime when the server gives none
+
+    Returns:
+        Freshness lifetime in seconds (0 means revalidate on every use)
+    """
+    directives = parse_cache_control(headers.get("Cache-Control"))
+    if "no-cache" in directives:
+        return 0.0
+
+    lifetime = default_ttl
+    if directives.get("max-age") is not None:
+        try:
+            lifetime = float(directives["max-age"])
+        except ValueError:
+            lifetime = 0.0
+    elif headers.get("Expires"):
+        try:
+            expires = parsedate_to_datetime(headers["Expires"]).timestamp()
+            lifetime = expires - time.time()
+        except (TypeError, ValueError):
+            lifetime = 0.0
+
+    try:
+        lifetime -= float(headers.get("Age") or 0)
+    except ValueError:
+        pass
+    return max(0.0, lifetime)
+
+
+def is_storable(headers: Mapping[str, str]) -> bool:
+    """Whether Cache-Control allows storing the response."""
+    return "no-store" not in parse_cache_control(headers.get("Cache-Control"))
+
+
+def cache_key(url: str, params: Optional[Dict] = None) -> str:
+    """Build the cache key of a GET request.
+
+    Args:
+        url: Request URL
+        params: Query parameters
+
+    Returns:
+        Key independent of parameter order
+    """
+    if not params:
+        return url
+    return f"{url}?{urlencode(sorted(params.items()), doseq=True)}"
+
+
+class ResponseCache:
+    """In-memory LRU of parsed responses with an optional on-disk store.
+
+    Entries stay cached after they expire as long as they carry an ETag or
+    Last-Modified validator, so the next request can revalidate them with a
+    conditional GET; a 304 then reuses the parsed payload. Cached payloads
+    are shared between callers and must not be mutated.
+
+    With ``directory`` set, entries are also written there as JSON files and
+    survive restarts; memory acts as the first level.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        default_ttl: float = 0.0,
+        directory: Optional[str] = None,
+    ):
+        """Initialize response cache.
+
+        Args:
+            max_entries: Entries kept in memory before evicting the least
+                recently used one
+            default_ttl: Freshness in seconds for responses without
+                Cache-Control max-age or Expires
+            directory: Directory of the on-disk store (None for memory only)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.directory = directory
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0}
+
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Look up an entry, falling back to the disk store.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry (fresh or stale but revalidatable), or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None and self.directory:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+
+        if entry is not None and not entry.is_fresh() and not entry.has_validators():
+            self.delete(key)
+            return None
+        return entry
+
+    def store(self, key: str, data: Any, headers: Mapping[str, str]) -> None:
+        """Cache a parsed 200 response if its headers allow it.
+
+        Args:
+            key: Cache key
+            data: Parsed payload
+            headers: Response headers
+        """
+        if not is_storable(headers):
+            self.delete(key)
+            return
+
+        entry = CacheEntry(
+            data=data,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires_at=time.time() + freshness_lifetime(headers, self.default_ttl),
+        )
+        if not entry.is_fresh() and not entry.has_validators():
+            return
+        self._remember(key, entry)
+        if self.directory:
+            self._save(key, entry)
+
+    def refresh(
+        self, key: str, entry: CacheEntry, headers: Mapping[str, str]
+    ) -> CacheEntry:
+        """Extend an entry after a 304 Not Modified.
+
+        Args:
+            key: Cache key
+            entry: Entry that was revalidated
+            headers: Headers of the 304 response
+
+        Returns:
+            Updated entry
+        """
+        entry.expires_at = time.time() + freshness_lifetime(headers, self.default_ttl)
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        self._remember(key, entry)
+        if self.directory:
+            self._save(key, entry)
+        return entry
+
+    def record(self, outcome: str) -> None:
+        """Count a lookup outcome: 'hits', 'revalidated' or 'misses'."""
+        with self._lock:
+            self._stats[outcome] += 1
+
+    def stats(self) -> Dict[str, int]:
+        """Get lookup counters.
+
+        Returns:
+            Dictionary with hits, revalidated, misses and entries counts
+        """
+        with self._lock:
+            return dict(self._stats, entries=len(self._entries))
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from memory and disk."""
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.directory:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        """Remove every entry from memory (the disk store is kept)."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        """Insert an entry into the LRU, evicting the oldest if full."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        """Get the file path of a key in the disk store."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{digest}.json")
+
+    def _save(self, key: str, entry: CacheEntry) -> None:
+        """Write an entry to the disk store atomically."""
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Failed to write cache entry for %s: %s", key, e)
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        """Read an entry from the disk store."""
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return CacheEntry(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            self.logger.warning("Failed to read cache entry for %s: %s", key, e)
+            return None
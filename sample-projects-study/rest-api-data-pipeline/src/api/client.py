@@ -1,27 +1,115 @@
 """API client module with support for both stateless and stateful operations."""
 
+import http.cookiejar
 import logging
+import socket
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator, Optional
+from collections import deque
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import (
+    Any,
+    ContextManager,
+    Deque,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import requests
 from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
 from urllib3.util.retry import Retry
 
+from .batching import BatchLoader
+from .cache import ResponseCache, cache_key
+from .coalesce import SingleFlight
 from .exceptions import APIError, NetworkError, TimeoutError, ValidationError
+from .hedging import RequestHedger
+from .instrumentation import (
+    Instrumentation,
+    RequestHook,
+    RequestSpan,
+    TimedHTTPConnectionPool,
+    TimedHTTPSConnectionPool,
+    endpoint_template,
+)
+from .ratelimit import OVERLOAD_STATUSES, RateLimiter
+from .streaming import iter_json_items
+
+KEEPALIVE_SOCKET_OPTIONS: List[Tuple[int, int, int]] = [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+]
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections use extra socket options."""
+
+    def __init__(
+        self,
+        socket_options: Optional[List[Tuple[int, int, int]]] = None,
+        timed: bool = False,
+        **kwargs: Any,
+    ):
+        """Initialize adapter.
+
+        Args:
+            socket_options: Options set on every new connection, in addition
+                to urllib3's defaults
+            timed: Record DNS, connect and TLS time of new connections on
+                the current request span
+            **kwargs: HTTPAdapter arguments
+        """
+        self.socket_options = socket_options or []
+        self.timed = timed
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with the configured socket options."""
+        if self.socket_options:
+            kwargs["socket_options"] = (
+                HTTPConnection.default_socket_options + self.socket_options
+            )
+        super().init_poolmanager(*args, **kwargs)
+        if self.timed:
+            self.poolmanager.pool_classes_by_scheme = {
+                "http": TimedHTTPConnectionPool,
+                "https": TimedHTTPSConnectionPool,
+            }
 
 
 class BaseAPIClient(ABC):
-    """Abstract base class for API clients."""
+    """Abstract base class for API clients.
+
+    Every client owns a ``requests.Session`` whose connection pool is reused
+    across calls, so repeated requests to the same host skip DNS, TCP and
+    TLS setup.
+
+    With ``hooks``, every request attempt produces a RequestSpan (DNS,
+    connect, TLS, time to first byte, download and total time, keyed by
+    endpoint template and status) that is passed to each RequestHook.
+    """
 
     DEFAULT_TIMEOUT = 30
     DEFAULT_RETRIES = 3
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_STREAM_CHUNK_SIZE = 64 * 1024
 
     def __init__(
         self,
         base_url: str,
         timeout: int = DEFAULT_TIMEOUT,
         max_retries: int = DEFAULT_RETRIES,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        hooks: Optional[Sequence[RequestHook]] = None,
     ):
         """Initialize API client.
 
@@ -29,15 +117,54 @@ class BaseAPIClient(ABC):
             base_url: Base URL for API
             timeout: Request timeout in seconds
             max_retries: Maximum number of retries
+            pool_connections: Number of hosts to keep connection pools for
+            pool_maxsize: Connections kept open per host
+            pool_block: Wait for a free connection instead of opening a
+                throwaway one when all pooled connections are busy
+            keep_alive: Reuse connections and enable TCP keep-alive; if
+                False every request closes its connection
+            hooks: Instrumentation hooks receiving a span per request
         """
         if not base_url:
             raise ValidationError("base_url cannot be empty")
+        if pool_connections < 1 or pool_maxsize < 1:
+            raise ValidationError("pool_connections and pool_maxsize must be >= 1")
 
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.instrumentation = Instrumentation(hooks) if hooks else None
+        self._session: Optional[requests.Session] = None
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    def _build_session(self, max_retries: Any = 0) -> requests.Session:
+        """Create a session mounted with the configured connection pool.
+
+        Args:
+            max_retries: Retry count or urllib3 Retry for the adapter
+
+        Returns:
+            Configured requests.Session
+        """
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(
+            socket_options=KEEPALIVE_SOCKET_OPTIONS if self.keep_alive else None,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=max_retries,
+            timed=self.instrumentation is not None,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
     @abstractmethod
     def get(self, endpoint: str, **kwargs) -> Dict[str, Any]:
         """GET request to API.
@@ -51,54 +178,153 @@ class BaseAPIClient(ABC):
         """
         pass
 
+    def _build_url(self, endpoint: str) -> str:
+        """Build full URL from base URL and endpoint.
 
-class StatelessAPIClient(BaseAPIClient):
-    """Stateless API client - each request is independent.
+        Args:
+            endpoint: API endpoint
 
-    This client does not maintain state between requests.
-    Each request is a complete, independent operation.
-    """
+        Returns:
+            Full URL
+        """
+        endpoint = endpoint.lstrip("/")
+        return f"{self.base_url}/{endpoint}"
 
-    def __init__(
-        self,
-        base_url: str,
-        timeout: int = BaseAPIClient.DEFAULT_TIMEOUT,
-        max_retries: int = BaseAPIClient.DEFAULT_RETRIES,
-    ):
-        """Initialize stateless API client."""
-        super().__init__(base_url, timeout, max_retries)
-        self.logger.info(f"Initialized StatelessAPIClient with base_url: {base_url}")
+    def _get_headers(self) -> Dict[str, str]:
+        """Get default headers for requests.
 
-    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
-        """Make GET request to endpoint.
+        Returns:
+            Dictionary of headers
+        """
+        return {"Content-Type": "application/json"}
+
+    @staticmethod
+    def _total_pages(data: Any, key: str) -> Optional[int]:
+        """Read the page count from a page response.
+
+        Args:
+            data: First page data
+            key: Name of the page count field
+
+        Returns:
+            Number of pages, or None if the response does not say
+        """
+        if not isinstance(data, dict):
+            return None
+        total = data.get(key)
+        if total is None and isinstance(data.get("pagination"), dict):
+            total = data["pagination"].get(key)
+        try:
+            return int(total) if total is not None else None
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _is_empty_page(data: Any) -> bool:
+        """Whether a page response signals the end of pagination."""
+        return not data or (isinstance(data, dict) and not data.get("items"))
+
+    def batch_loader(self, endpoint: str, **options: Any) -> BatchLoader:
+        """Create a loader batching single-record lookups on endpoint.
+
+        Concurrent ``loader.load(id)`` calls are sent as one
+        ``GET endpoint?ids=1,2,3`` request and split back to their callers.
+
+        Args:
+            endpoint: Batch endpoint
+            **options: BatchLoader settings (ids_param, id_key, items_key,
+                max_batch_size, max_wait_ms, separator)
+
+        Returns:
+            BatchLoader sending its requests through this client
+        """
+        return BatchLoader(self, endpoint, **options)
+
+    def get_stream(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        items_key: str = "items",
+        chunk_size: int = DEFAULT_STREAM_CHUNK_SIZE,
+    ) -> Generator[Any, None, None]:
+        """Stream the elements of a JSON array response.
+
+        The body is read from the socket in ``chunk_size`` pieces and parsed
+        incrementally, so memory stays flat however large the array is. The
+        response is either a top-level array or an object whose
+        ``items_key`` member is the array. Records can be passed straight to
+        ``StreamingDataProcessor.process``. Responses are never cached.
 
         Args:
             endpoint: API endpoint
             params: Query parameters
+            items_key: Member holding the array when the body is an object
+            chunk_size: Bytes read from the socket at a time
 
-        Returns:
-            Response JSON as dictionary
+        Yields:
+            Array elements in order
 
         Raises:
             ValidationError: If endpoint is invalid
             NetworkError: If network error occurs
             TimeoutError: If request times out
+            APIError: For HTTP error statuses and malformed bodies
         """
         if not endpoint:
             raise ValidationError("endpoint cannot be empty")
 
         url = self._build_url(endpoint)
-        self.logger.debug(f"GET request to {url} with params: {params}")
+        self.logger.debug("GET stream from %s with params: %s", url, params)
+        response = self._send(url, params, self._get_headers(), stream=True)
 
+        with response:
+            try:
+                chunks = response.iter_content(chunk_size)
+                yield from iter_json_items(chunks, items_key)
+                # Read the rest of the body so the connection can be reused
+                for _ in chunks:
+                    pass
+
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.ChunkedEncodingError,
+            ) as e:
+                error_msg = f"Connection error reading {url}: {str(e)}"
+                self.logger.error(error_msg)
+                raise NetworkError(error_msg)
+
+            except (requests.exceptions.RequestException, ValueError) as e:
+                error_msg = f"Stream error from {url}: {str(e)}"
+                self.logger.error(error_msg)
+                raise APIError(error_msg)
+
+    def _send(
+        self,
+        url: str,
+        params: Optional[Dict],
+        headers: Dict[str, str],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a GET and map failures to API exceptions.
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            headers: Request headers
+            stream: Leave the body unread for iter_content
+
+        Returns:
+            Response with a non-error status
+
+        Raises:
+            NetworkError: If network error occurs
+            TimeoutError: If request times out
+            APIError: For HTTP error statuses and other request errors
+        """
         try:
-            response = requests.get(
-                url,
-                params=params or {},
-                timeout=self.timeout,
-                headers=self._get_headers(),
-            )
+            response = self._request(url, params, headers, stream)
             response.raise_for_status()
-            return response.json()
+            return response
 
         except requests.exceptions.Timeout as e:
             error_msg = f"Request to {url} timed out after {self.timeout}s"
@@ -111,6 +337,7 @@ class StatelessAPIClient(BaseAPIClient):
             raise NetworkError(error_msg)
 
         except requests.exceptions.HTTPError as e:
+            e.response.close()
             status_code = e.response.status_code
             error_msg = f"HTTP {status_code} from {url}"
             self.logger.error(error_msg)
@@ -121,59 +348,306 @@ class StatelessAPIClient(BaseAPIClient):
             self.logger.error(error_msg)
             raise APIError(error_msg)
 
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict],
+        headers: Dict[str, str],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send one GET through the session.
+
+        Instrumented requests always read headers first so time to first
+        byte and download time can be told apart; the body is then read
+        unless ``stream`` is set.
+
+        Returns:
+            Raw response, whatever its status
+        """
+        if self.instrumentation is None:
+            return self._session.get(
+                url,
+                params=params or {},
+                timeout=self.timeout,
+                headers=headers,
+                stream=stream,
+            )
+
+        with self._span("GET", url) as span:
+            start = time.perf_counter()
+            response = self._session.get(
+                url,
+                params=params or {},
+                timeout=self.timeout,
+                headers=headers,
+                stream=True,
+            )
+            span.ttfb = time.perf_counter() - start
+            span.status_code = response.status_code
+            if not stream:
+                response.content  # read the body inside the span
+                span.download = time.perf_counter() - start - span.ttfb
+            return response
+
+    def _span(self, method: str, url: str) -> ContextManager[Optional[RequestSpan]]:
+        """Open a request span, or a no-op context without instrumentation."""
+        if self.instrumentation is None:
+            return nullcontext()
+        return self.instrumentation.span(method, url, self.base_url)
+
+    def _decode(self, url: str, response: requests.Response) -> Any:
+        """Parse a JSON response body.
+
+        Raises:
+            APIError: If the body is not valid JSON
+        """
+        try:
+            return response.json()
+        except ValueError as e:
+            error_msg = f"Request error to {url}: {str(e)}"
+            self.logger.error(error_msg)
+            raise APIError(error_msg)
+
+    def close(self) -> None:
+        """Close the session and its pooled connections."""
+        if self._session:
+            self._session.close()
+            self.logger.info("Session closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+
+class StatelessAPIClient(BaseAPIClient):
+    """Stateless API client - each request is independent.
+
+    This client does not maintain state between requests.
+    Each request is a complete, independent operation. Only the connection
+    pool is shared; cookies are never stored.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = BaseAPIClient.DEFAULT_TIMEOUT,
+        max_retries: int = BaseAPIClient.DEFAULT_RETRIES,
+        **pool_options: Any,
+    ):
+        """Initialize stateless API client.
+
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            **pool_options: Connection pool settings of BaseAPIClient
+        """
+        super().__init__(base_url, timeout, max_retries, **pool_options)
+        self._session = self._build_session()
+        self._session.cookies.set_policy(
+            http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+        )
+        self.logger.info(f"Initialized StatelessAPIClient with base_url: {base_url}")
+
+    def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
+        """Make GET request to endpoint.
+
+        Args:
+            endpoint: API endpoint
+            params: Query parameters
+
+        Returns:
+            Response JSON as dictionary
+
+        Raises:
+            ValidationError: If endpoint is invalid
+            NetworkError: If network error occurs
+            TimeoutError: If request times out
+        """
+        if not endpoint:
+            raise ValidationError("endpoint cannot be empty")
+
+        url = self._build_url(endpoint)
+        self.logger.debug("GET request to %s with params: %s", url, params)
+        return self._decode(url, self._send(url, params, self._get_headers()))
+
     def get_paginated(
         self,
         endpoint: str,
         page_param: str = "page",
         limit_param: str = "limit",
         limit: int = 10,
+        max_workers: int = 1,
+        ordered: bool = True,
+        total_pages_key: str = "total_pages",
     ) -> Generator[Dict[str, Any], None, None]:
         """Fetch paginated data from endpoint.
 
         Yields data page by page without maintaining state.
         Each page fetch is an independent request.
 
+        With ``max_workers`` above 1 and a page count in the first response
+        (``total_pages_key`` at the top level or under ``pagination``), the
+        remaining pages are fetched concurrently over the client's
+        connection pool, which should hold at least ``max_workers``
+        connections (``pool_maxsize``). At most ``2 * max_workers`` pages
+        are requested ahead of the consumer. Without a page count, pages are
+        fetched sequentially.
+
         Args:
             endpoint: API endpoint
             page_param: Parameter name for page number
             limit_param: Parameter name for page size
             limit: Number of items per page
+            max_workers: Number of concurrent page requests
+            ordered: Yield pages in page order; if False, yield them as
+                they complete
+            total_pages_key: Response field holding the number of pages
 
         Yields:
             Data from each page
         """
-        page = 1
+        if max_workers <= 1:
+            yield from self._get_pages_sequential(
+                endpoint, page_param, limit_param, limit, first_page=1
+            )
+            return
+
+        first = self._get_page(endpoint, page_param, limit_param, limit, 1)
+        if first is None:
+            return
+        yield first
+
+        total_pages = self._total_pages(first, total_pages_key)
+        if total_pages is None:
+            yield from self._get_pages_sequential(
+                endpoint, page_param, limit_param, limit, first_page=2
+            )
+            return
+
+        yield from self._get_pages_concurrent(
+            endpoint,
+            page_param,
+            limit_param,
+            limit,
+            range(2, total_pages + 1),
+            max_workers,
+            ordered,
+        )
+
+    def _get_pages_sequential(
+        self,
+        endpoint: str,
+        page_param: str,
+        limit_param: str,
+        limit: int,
+        first_page: int,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Fetch pages one after another until an empty page or an error."""
+        page = first_page
         while True:
-            params = {page_param: page, limit_param: limit}
-            try:
-                data = self.get(endpoint, params)
-                if not data or (isinstance(data, dict) and not data.get("items")):
-                    break
-                yield data
-                page += 1
-            except APIError as e:
-                self.logger.error(f"Error fetching page {page}: {e}")
+            data = self._get_page(endpoint, page_param, limit_param, limit, page)
+            if data is None:
                 break
+            yield data
+            page += 1
 
-    def _build_url(self, endpoint: str) -> str:
-        """Build full URL from base URL and endpoint.
-
-        Args:
-            endpoint: API endpoint
+    def _get_pages_concurrent(
+        self,
+        endpoint: str,
+        page_param: str,
+        limit_param: str,
+        limit: int,
+        pages: range,
+        max_workers: int,
+        ordered: bool,
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Fetch known pages on a thread pool sharing the connection pool.
 
-        Returns:
-            Full URL
+        Stops at the first empty or failed page; pages after it that were
+        already requested are discarded.
         """
-        endpoint = endpoint.lstrip("/")
-        return f"{self.base_url}/{endpoint}"
+        if max_workers > self.pool_maxsize:
+            self.logger.warning(
+                "max_workers %d exceeds pool_maxsize %d; extra connections "
+                "will not be reused",
+                max_workers,
+                self.pool_maxsize,
+            )
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="get_paginated"
+        )
+        page_iter = iter(pages)
+        window = 2 * max_workers
+
+        def submit() -> Optional[Future]:
+            page = next(page_iter, None)
+            if page is None:
+                return None
+            return executor.submit(
+                self._get_page, endpoint, page_param, limit_param, limit, page
+            )
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get default headers for requests.
+        try:
+            if ordered:
+                queue: Deque[Future] = deque()
+                for _ in range(window):
+                    future = submit()
+                    if future is not None:
+                        queue.append(future)
+                while queue:
+                    data = queue.popleft().result()
+                    if data is None:
+                        break
+                    yield data
+                    future = submit()
+                    if future is not None:
+                        queue.append(future)
+            else:
+                pending = set()
+                for _ in range(window):
+                    future = submit()
+                    if future is not None:
+                        pending.add(future)
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        data = future.result()
+                        if data is None:
+                            return
+                        yield data
+                        future = submit()
+                        if future is not None:
+                            pending.add(future)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _get_page(
+        self,
+        endpoint: str,
+        page_param: str,
+        limit_param: str,
+        limit: int,
+        page: int,
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch one page.
 
         Returns:
-            Dictionary of headers
+            Page data, or None if the page is empty or could not be fetched
         """
-        return {"Content-Type": "application/json"}
+        params = {page_param: page, limit_param: limit}
+        try:
+            data = self.get(endpoint, params)
+        except APIError as e:
+            self.logger.error(f"Error fetching page {page}: {e}")
+            return None
+        if self._is_empty_page(data):
+            return None
+        return data
 
 
 class StatefulAPIClient(BaseAPIClient):
@@ -181,6 +655,24 @@ class StatefulAPIClient(BaseAPIClient):
 
     This client maintains context across multiple operations,
     such as authentication tokens, session data, etc.
+
+    With a ResponseCache, fresh responses are served from memory (or disk)
+    and stale ones are revalidated with If-None-Match/If-Modified-Since, so
+    an unchanged payload costs a 304 and no JSON parsing.
+
+    With a RateLimiter, every request waits for a token and a concurrency
+    slot, and 429/503 responses are retried through the limiter (honouring
+    Retry-After and rate-limit headers) instead of urllib3's fixed
+    exponential backoff.
+
+    With ``single_flight``, identical GETs (same URL and params) issued
+    concurrently from several threads share one request and its parsed
+    result.
+
+    With a RequestHedger, a request slower than the endpoint's usual
+    latency percentile gets a second attempt and the first to answer wins,
+    within the hedger's load budget. Only GETs are sent, so hedging is safe
+    as long as the upstream treats GETs as idempotent.
     """
 
     def __init__(
@@ -188,11 +680,32 @@ class StatefulAPIClient(BaseAPIClient):
         base_url: str,
         timeout: int = BaseAPIClient.DEFAULT_TIMEOUT,
         max_retries: int = BaseAPIClient.DEFAULT_RETRIES,
+        cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        single_flight: bool = False,
+        hedger: Optional[RequestHedger] = None,
+        **pool_options: Any,
     ):
-        """Initialize stateful API client."""
-        super().__init__(base_url, timeout, max_retries)
+        """Initialize stateful API client.
+
+        Args:
+            base_url: Base URL for API
+            timeout: Request timeout in seconds
+            max_retries: Maximum number of retries
+            cache: Response cache for GET requests (optional)
+            rate_limiter: Client-side rate limiter (optional)
+            single_flight: Coalesce concurrent identical GETs into one
+                request; callers then share the returned object
+            hedger: Hedges slow requests (optional); closed with the client
+            **pool_options: Connection pool settings of BaseAPIClient
+        """
+        super().__init__(base_url, timeout, max_retries, **pool_options)
+        self.rate_limiter = rate_limiter
         self._session = self._create_session()
         self._state: Dict[str, Any] = {}
+        self.cache = cache
+        self.single_flight = SingleFlight() if single_flight else None
+        self.hedger = hedger
         self.logger.info(f"Initialized StatefulAPIClient with base_url: {base_url}")
 
     def _create_session(self) -> requests.Session:
@@ -201,19 +714,21 @@ class StatefulAPIClient(BaseAPIClient):
         Returns:
             Configured requests.Session
         """
-        session = requests.Session()
-
-        # Configure retry strategy
+        # Configure retry strategy; overload statuses (429, 503) are
+        # retried through the rate limiter instead when one is set
+        status_forcelist = [429, 500, 502, 503, 504]
+        if self.rate_limiter is not None:
+            status_forcelist = [
+                status for status in status_forcelist
+                if status not in OVERLOAD_STATUSES
+            ]
         retry_strategy = Retry(
             total=self.max_retries,
             backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=status_forcelist,
+            respect_retry_after_header=self.rate_limiter is None,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
-
-        return session
+        return self._build_session(retry_strategy)
 
     def get(self, endpoint: str, params: Optional[Dict] = None) -> Dict[str, Any]:
         """Make GET request using session.
@@ -234,40 +749,134 @@ class StatefulAPIClient(BaseAPIClient):
             raise ValidationError("endpoint cannot be empty")
 
         url = self._build_url(endpoint)
-        self.logger.debug(f"GET request (stateful) to {url}")
+        self.logger.debug("GET request (stateful) to %s", url)
 
-        try:
-            response = self._session.get(
-                url,
-                params=params or {},
-                timeout=self.timeout,
-                headers=self._get_headers(),
+        if self.single_flight is None:
+            data = self._fetch(url, params)
+        else:
+            data, shared = self.single_flight.do(
+                cache_key(url, params), lambda: self._fetch(url, params)
             )
-            response.raise_for_status()
-            data = response.json()
-            self._update_state(data)
-            return data
+            if shared:
+                self.logger.debug("Coalesced GET to %s", url)
+        self._update_state(data)
+        return data
 
-        except requests.exceptions.Timeout as e:
-            error_msg = f"Request to {url} timed out after {self.timeout}s"
-            self.logger.error(error_msg)
-            raise TimeoutError(error_msg)
+    def _fetch(self, url: str, params: Optional[Dict]) -> Any:
+        """Get a parsed response, from the cache if one is configured."""
+        if self.cache is None:
+            return self._decode(url, self._send(url, params, self._get_headers()))
+        return self._get_cached(url, params)
 
-        except requests.exceptions.ConnectionError as e:
-            error_msg = f"Connection error to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise NetworkError(error_msg)
+    def _get_cached(self, url: str, params: Optional[Dict]) -> Any:
+        """Serve a GET from the cache, revalidating stale entries.
 
-        except requests.exceptions.HTTPError as e:
-            status_code = e.response.status_code
-            error_msg = f"HTTP {status_code} from {url}"
-            self.logger.error(error_msg)
-            raise APIError(error_msg, status_code)
+        Args:
+            url: Request URL
+            params: Query parameters
 
-        except requests.exceptions.RequestException as e:
-            error_msg = f"Request error to {url}: {str(e)}"
-            self.logger.error(error_msg)
-            raise APIError(error_msg)
+        Returns:
+            Parsed response payload
+        """
+        key = cache_key(url, params)
+        entry = self.cache.get(key)
+        if entry is not None and entry.is_fresh():
+            self.cache.record("hits")
+            return entry.data
+
+        headers = self._get_headers()
+        if entry is not None:
+            headers.update(entry.conditional_headers())
+        response = self._send(url, params, headers)
+
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            return self.cache.refresh(key, entry, response.headers).data
+
+        self.cache.record("misses")
+        data = self._decode(url, response)
+        self.cache.store(key, data, response.headers)
+        return data
+
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict],
+        headers: Dict[str, str],
+        stream: bool = False,
+    ) -> requests.Response:
+        """Send a GET, hedged if a hedger is configured.
+
+        Streamed requests are never hedged.
+
+        Returns:
+            Raw response of the winning attempt, whatever its status
+        """
+        if self.hedger is None or stream:
+            return self._attempt(url, params, headers, stream)
+
+        return self.hedger.run(
+            endpoint_template(url[len(self.base_url):]),
+            lambda: self._attempt(url, params, headers, False),
+            discard=lambda response: response.close(),
+            accept=self._hedge_accepts,
+        )
+
+    @staticmethod
+    def _hedge_accepts(response: requests.Response) -> bool:
+        """Whether a hedged attempt may win: not a 5xx or 429 response."""
+        return response.status_code < 500 and response.status_code != 429
+
+    def _attempt(
+        self,
+        url: str,
+        params: Optional[Dict],
+        headers: Dict[str, str],
+        stream: bool,
+    ) -> requests.Response:
+        """Send a GET, through the rate limiter if configured.
+
+        With a limiter, 429 and 503 responses are retried up to max_retries
+        times; each retry waits on the limiter, which has already applied
+        the response's Retry-After and rate-limit headers.
+
+        Returns:
+            Raw response, whatever its status
+        """
+        if self.rate_limiter is None:
+            return super()._request(url, params, headers, stream)
+
+        response = self._limited_request(url, params, headers, stream)
+        attempt = 0
+        while response.status_code in OVERLOAD_STATUSES and attempt < self.max_retries:
+            attempt += 1
+            self.logger.warning(
+                "HTTP %d from %s, retry %d/%d",
+                response.status_code,
+                url,
+                attempt,
+                self.max_retries,
+            )
+            response.close()
+            response = self._limited_request(url, params, headers, stream)
+        return response
+
+    def _limited_request(
+        self,
+        url: str,
+        params: Optional[Dict],
+        headers: Dict[str, str],
+        stream: bool,
+    ) -> requests.Response:
+        """Send one GET once the rate limiter allows it."""
+        ticket = self.rate_limiter.acquire()
+        try:
+            response = super()._request(url, params, headers, stream)
+        except requests.exceptions.RequestException:
+            self.rate_limiter.release(ticket)
+            raise
+        self.rate_limiter.release(ticket, response.status_code, response.headers)
+        return response
 
     def set_state(self, key: str, value: Any) -> None:
         """Set state value.
@@ -291,6 +900,12 @@ class StatefulAPIClient(BaseAPIClient):
         """
         return self._state.get(key, default)
 
+    def close(self) -> None:
+        """Close the session and stop the hedger's attempt threads."""
+        if self.hedger is not None:
+            self.hedger.close()
+        super().close()
+
     def _update_state(self, data: Dict[str, Any]) -> None:
         """Update internal state based on response data.
 
@@ -301,18 +916,6 @@ class StatefulAPIClient(BaseAPIClient):
             if "pagination" in data:
                 self.set_state("last_pagination", data["pagination"])
 
-    def _build_url(self, endpoint: str) -> str:
-        """Build full URL from base URL and endpoint.
-
-        Args:
-            endpoint: API endpoint
-
-        Returns:
-            Full URL
-        """
-        endpoint = endpoint.lstrip("/")
-        return f"{self.base_url}/{endpoint}"
-
     def _get_headers(self) -> Dict[str, str]:
         """Get headers including any state-based headers.
 
@@ -322,17 +925,3 @@ class StatefulAPIClient(BaseAPIClient):
         headers = {"Content-Type": "application/json"}
         return headers
 
-    def close(self) -> None:
-        """Close the session."""
-        if self._session:
-            self._session.close()
-            self.logger.info("Session closed")
-
-    def __enter__(self):
-        """Context manager entry."""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
-
@@ -0,0 +1,84 @@
+"""Single-flight de-duplication of concurrent identical calls."""
+
+import threading
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+class _Call:
+    """An in-flight call whose outcome is shared by every waiter."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Run at most one call per key at a time and share its outcome.
+
+    The first caller for a key executes the function; callers arriving with
+    the same key while it runs block until it finishes and receive the same
+    result (or the same exception). Once the call returns, the key is free
+    again, so results are never reused after the fact - that is what
+    ResponseCache is for.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._calls: Dict[str, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "coalesced": 0}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """Call fn unless a call for key is already in flight.
+
+        Args:
+            key: Identity of the call
+            fn: Function producing the result
+
+        Returns:
+            Tuple of the result and whether it was shared from another
+            caller's call
+
+        Raises:
+            Exception: Whatever fn raised, in the caller and every waiter
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self._stats["calls"] += 1
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def in_flight(self) -> int:
+        """Number of keys with a call in progress."""
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self) -> Dict[str, int]:
+        """Get call counters.
+
+        Returns:
+            Dictionary with calls executed and calls coalesced into them
+        """
+        with self._lock:
+            return dict(self._stats)
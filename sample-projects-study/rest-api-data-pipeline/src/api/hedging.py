@@ -0,0 +1,229 @@
+"""Hedged requests for idempotent calls."""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Deque, Dict, Optional
+
+
+def _accept_all(result: Any) -> bool:
+    """Treat every returned result as a success."""
+    return True
+
+
+class RequestHedger:
+    """Send a second attempt when the first is slower than usual.
+
+    Per key (endpoint template), the latencies of the last ``window``
+    attempts are kept. Once ``min_samples`` are known, a call whose first
+    attempt has not finished after the ``percentile`` latency fires a
+    second attempt, and the first successful one to finish wins. An attempt
+    counts as successful if it returns a result that ``accept`` approves,
+    so a fast error response cannot beat a slower good one; only successful
+    attempts feed the latency window. The other attempt is left to finish
+    in the background and its result discarded.
+
+    Extra load is capped by a budget: every call earns ``budget`` hedge
+    tokens (up to ``max_tokens``) and every hedge spends one, so at most
+    about ``budget`` of all calls are hedged.
+
+    Only use it for idempotent requests.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        budget: float = 0.05,
+        min_delay: float = 0.005,
+        max_delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 1000,
+        max_tokens: float = 10.0,
+        max_workers: int = 32,
+    ):
+        """Initialize hedger.
+
+        Args:
+            percentile: Latency percentile after which to hedge (0-100)
+            budget: Fraction of calls allowed to send a hedge
+            min_delay: Lowest hedge delay in seconds
+            max_delay: Highest hedge delay in seconds (None for no cap)
+            min_samples: Latencies needed per key before hedging
+            window: Recent latencies kept per key
+            max_tokens: Most hedges that can be saved up for a burst
+            max_workers: Threads running attempts
+
+        Raises:
+            ValueError: If any setting is out of range
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be in (0, 100)")
+        if not 0 <= budget <= 1:
+            raise ValueError("budget must be in [0, 1]")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("expected 1 <= min_samples <= window")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_tokens = max_tokens
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "over_budget": 0}
+
+    def run(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        discard: Optional[Callable[[Any], None]] = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+    ) -> Any:
+        """Call fn, hedging it if the first attempt is slow.
+
+        Args:
+            key: Latency group of the call, e.g. the endpoint template
+            fn: Idempotent function performing one attempt
+            discard: Called with the result of the losing attempt, e.g. to
+                close a response
+            accept: Tells whether a result is a success (every result is
+                when None)
+
+        Returns:
+            Result of the first successful attempt, otherwise the first
+            attempt's result if any attempt returned one
+
+        Raises:
+            Exception: The first attempt's exception if every attempt failed
+        """
+        if accept is None:
+            accept = _accept_all
+        with self._lock:
+            self._stats["calls"] += 1
+            self._tokens = min(self.max_tokens, self._tokens + self.budget)
+
+        delay = self.delay(key)
+        if delay is None:
+            return self._timed(key, fn, accept)
+
+        primary = self._executor.submit(self._timed, key, fn, accept)
+        done, _ = wait([primary], timeout=delay)
+        if done or not self._spend_token():
+            return primary.result()
+
+        self.logger.debug("Hedging %s after %.3fs", key, delay)
+        hedge = self._executor.submit(self._timed, key, fn, accept)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None and accept(future.result()):
+                    if future is hedge:
+                        with self._lock:
+                            self._stats["hedge_wins"] += 1
+                    loser = primary if future is hedge else hedge
+                    self._discard_when_done(loser, discard)
+                    return future.result()
+
+        # Neither attempt succeeded: prefer a returned result to an error
+        if primary.exception() is None or hedge.exception() is not None:
+            self._discard_when_done(hedge, discard)
+            return primary.result()
+        return hedge.result()
+
+    def delay(self, key: str) -> Optional[float]:
+        """Get the hedge delay for a key.
+
+        Returns:
+            Seconds to wait before hedging, or None until min_samples
+            latencies are known
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        rank = math.ceil(self.percentile / 100 * len(ordered))
+        delay = max(self.min_delay, ordered[min(len(ordered), rank) - 1])
+        if self.max_delay is not None:
+            delay = min(delay, self.max_delay)
+        return delay
+
+    def observe(self, key: str, latency: float) -> None:
+        """Record the latency of one successful attempt.
+
+        Args:
+            key: Latency group
+            latency: Seconds the attempt took
+        """
+        with self._lock:
+            samples = self._latencies.get(key)
+            if samples is None:
+                samples = self._latencies[key] = deque(maxlen=self.window)
+            samples.append(latency)
+
+    def stats(self) -> Dict[str, int]:
+        """Get hedging counters.
+
+        Returns:
+            Dictionary with calls, hedged calls, calls won by the hedge and
+            hedges skipped for lack of budget
+        """
+        with self._lock:
+            return dict(self._stats)
+
+    def close(self) -> None:
+        """Stop the attempt threads once running attempts finish."""
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def _timed(
+        self, key: str, fn: Callable[[], Any], accept: Callable[[Any], bool]
+    ) -> Any:
+        """Run one attempt and record its latency if it succeeds."""
+        start = time.perf_counter()
+        result = fn()
+        if accept(result):
+            self.observe(key, time.perf_counter() - start)
+        return result
+
+    def _spend_token(self) -> bool:
+        """Take a hedge token, counting calls that found none."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self._stats["hedged"] += 1
+                return True
+            self._stats["over_budget"] += 1
+            return False
+
+    @staticmethod
+    def _discard_when_done(
+        future: Future, discard: Optional[Callable[[Any], None]]
+    ) -> None:
+        """Hand the losing attempt's result to discard once it arrives."""
+        if discard is None:
+            return
+
+        def callback(finished: Future) -> None:
+            if not finished.cancelled() and finished.exception() is None:
+                discard(finished.result())
+
+        future.add_done_callback(callback)
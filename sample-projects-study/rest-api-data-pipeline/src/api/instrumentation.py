@@ -0,0 +1,360 @@
+"""Request timing spans, latency histograms and exporter hooks."""
+
+import bisect
+import contextvars
+import logging
+import re
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Generator, List, Optional, Sequence, Tuple
+
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+# Default histogram bucket upper bounds in seconds.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-"
+    r"[0-9a-fA-F]{12}|[0-9a-fA-F]{16,})$"
+)
+
+_current_span: contextvars.ContextVar[Optional["RequestSpan"]] = (
+    contextvars.ContextVar("current_span", default=None)
+)
+
+
+def endpoint_template(path: str) -> str:
+    """Collapse id-like path segments so requests group per endpoint.
+
+    Numbers, UUIDs and long hex strings become ``{id}``, e.g.
+    ``/users/42/orders`` becomes ``/users/{id}/orders``.
+
+    Args:
+        path: URL path (query string is dropped)
+
+    Returns:
+        Endpoint template
+    """
+    path = path.split("?", 1)[0]
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment
+        for segment in path.split("/")
+    )
+
+
+@dataclass
+class RequestSpan:
+    """Timing of one HTTP request, in seconds.
+
+    Phases are None when they did not happen: ``dns``, ``connect`` and
+    ``tls`` only apply to requests that opened a new connection, and
+    ``download`` is not measured for streamed responses.
+    """
+
+    method: str
+    url: str
+    endpoint: str
+    started_at: float = field(default_factory=time.time)
+    status_code: Optional[int] = None
+    error: Optional[str] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    tls: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    total: Optional[float] = None
+
+    @property
+    def outcome(self) -> str:
+        """Status code, or the exception name for failed requests."""
+        if self.status_code is not None:
+            return str(self.status_code)
+        return self.error or "unknown"
+
+
+def current_span() -> Optional[RequestSpan]:
+    """Get the span of the request running in this thread or task."""
+    return _current_span.get()
+
+
+class RequestHook:
+    """Receives request spans; override either method.
+
+    Hooks run on the requesting thread and must be quick. Exceptions they
+    raise are logged and ignored.
+    """
+
+    def on_request_start(self, span: RequestSpan) -> None:
+        """Called before the request is sent."""
+        pass
+
+    def on_request_end(self, span: RequestSpan) -> None:
+        """Called once the request has finished or failed."""
+        pass
+
+
+class CallbackHook(RequestHook):
+    """Pass every finished span to a callable.
+
+    This is the exporter-neutral hook: forward spans to StatsD,
+    OpenTelemetry, Prometheus or a log line without the client depending on
+    any of them.
+    """
+
+    def __init__(self, callback: Callable[[RequestSpan], None]):
+        """Initialize callback hook.
+
+        Args:
+            callback: Function receiving each finished span
+        """
+        self.callback = callback
+
+    def on_request_end(self, span: RequestSpan) -> None:
+        """Forward the span."""
+        self.callback(span)
+
+
+class LatencyHistogram:
+    """Cumulative-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a duration."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate a percentile as the upper bound of its bucket.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Upper bound in seconds (inf past the last bucket), or None if
+            nothing was recorded
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get count, sum and cumulative bucket counts."""
+        cumulative = 0
+        buckets = {}
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class LatencyHistograms(RequestHook):
+    """Latency histograms keyed by endpoint template and status code."""
+
+    def __init__(
+        self, phase: str = "total", buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """Initialize histograms.
+
+        Args:
+            phase: Span attribute to record (total, ttfb, download, ...)
+            buckets: Bucket upper bounds in seconds
+        """
+        self.phase = phase
+        self.bucket_bounds = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def on_request_end(self, span: RequestSpan) -> None:
+        """Record the span's phase duration."""
+        value = getattr(span, self.phase)
+        if value is None:
+            return
+        key = (span.endpoint, span.outcome)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram(
+                    self.bucket_bounds
+                )
+            histogram.observe(value)
+
+    def percentile(
+        self, endpoint: str, q: float, status: Optional[str] = None
+    ) -> Optional[float]:
+        """Estimate a latency percentile for an endpoint template.
+
+        Args:
+            endpoint: Endpoint template
+            q: Percentile between 0 and 100
+            status: Only this status code (all statuses if None)
+
+        Returns:
+            Percentile in seconds, or None without observations
+        """
+        with self._lock:
+            matching = [
+                histogram
+                for (name, outcome), histogram in self._histograms.items()
+                if name == endpoint and (status is None or outcome == str(status))
+            ]
+            if not matching:
+                return None
+            merged = LatencyHistogram(self.bucket_bounds)
+            for histogram in matching:
+                merged.count += histogram.count
+                merged.sum += histogram.sum
+                merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+        return merged.percentile(q)
+
+    def snapshot(self) -> Dict[Tuple[str, str], Dict[str, Any]]:
+        """Get every histogram keyed by (endpoint template, status)."""
+        with self._lock:
+            return {key: h.snapshot() for key, h in self._histograms.items()}
+
+
+class Instrumentation:
+    """Create request spans and deliver them to hooks."""
+
+    def __init__(
+        self,
+        hooks: Sequence[RequestHook],
+        templater: Callable[[str], str] = endpoint_template,
+    ):
+        """Initialize instrumentation.
+
+        Args:
+            hooks: Hooks receiving every span
+            templater: Maps a URL path to its endpoint template
+        """
+        self.hooks: List[RequestHook] = list(hooks)
+        self.templater = templater
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    @contextmanager
+    def span(
+        self, method: str, url: str, base_url: str = ""
+    ) -> Generator[RequestSpan, None, None]:
+        """Time a request and make its span current while it runs.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            base_url: Prefix stripped before templating the endpoint
+
+        Yields:
+            The span, for the caller to fill in status and phases
+        """
+        path = url[len(base_url):] if base_url and url.startswith(base_url) else url
+        span = RequestSpan(method, url, self.templater(path))
+        self._emit("on_request_start", span)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.total = time.perf_counter() - start
+            _current_span.reset(token)
+            self._emit("on_request_end", span)
+
+    def _emit(self, event: str, span: RequestSpan) -> None:
+        """Call a hook method on every hook, ignoring their failures."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, event)(span)
+            except Exception as e:
+                self.logger.warning("Request hook %r failed: %s", hook, e)
+
+
+class _TimedConnectionMixin:
+    """Record DNS, TCP connect and TLS time on the current span."""
+
+    def _new_conn(self) -> socket.socket:
+        span = current_span()
+        if span is None:
+            return super()._new_conn()
+
+        start = time.perf_counter()
+        try:
+            addresses = [
+                info[4][0]
+                for info in socket.getaddrinfo(
+                    self._dns_host, self.port, 0, socket.SOCK_STREAM
+                )
+            ]
+        except OSError:
+            # Let urllib3 raise its own resolution error
+            return super()._new_conn()
+        resolved = time.perf_counter()
+        span.dns = resolved - start
+
+        # Connect to the resolved addresses without resolving again
+        dns_host = self._dns_host
+        try:
+            for address in dict.fromkeys(addresses):
+                self._dns_host = address
+                try:
+                    sock = super()._new_conn()
+                    break
+                except NewConnectionError as e:
+                    error = e
+            else:
+                raise error
+        finally:
+            self._dns_host = dns_host
+        span.connect = time.perf_counter() - resolved
+        return sock
+
+    def connect(self) -> None:
+        span = current_span()
+        start = time.perf_counter()
+        super().connect()
+        if span is not None and isinstance(self, HTTPSConnection):
+            setup = (span.dns or 0.0) + (span.connect or 0.0)
+            span.tls = max(0.0, time.perf_counter() - start - setup)
+
+
+class TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    """HTTP connection reporting setup phases to the current span."""
+
+
+class TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    """HTTPS connection reporting setup phases to the current span."""
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    """HTTP pool creating TimedHTTPConnection."""
+
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    """HTTPS pool creating TimedHTTPSConnection."""
+
+    ConnectionCls = TimedHTTPSConnection
@@ -0,0 +1,368 @@
+"""Client-side rate limiting and adaptive concurrency control."""
+
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Mapping, Optional
+
+# Status codes that mean the provider wants fewer requests.
+OVERLOAD_STATUSES = frozenset({429, 503})
+
+# Reset values above this are absolute epoch seconds, not deltas.
+_EPOCH_THRESHOLD = 1_000_000_000
+
+# Token shortfalls below this are float rounding, not a reason to wait.
+_TOKEN_EPSILON = 1e-9
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current epoch time (defaults to time.time())
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+def _header(headers: Mapping[str, str], name: str) -> Optional[float]:
+    """Read a numeric RateLimit-* header, falling back to X-RateLimit-*."""
+    for key in (f"RateLimit-{name}", f"X-RateLimit-{name}"):
+        value = headers.get(key)
+        if value is None:
+            continue
+        try:
+            return float(str(value).split(",")[0].split(";")[0])
+        except ValueError:
+            return None
+    return None
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing ``rate`` acquisitions per second.
+
+    Up to ``burst`` tokens accumulate while idle. ``pause`` blocks every
+    caller until the given delay has passed, e.g. for a Retry-After.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize token bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (defaults to max(1, rate))
+            clock: Monotonic time source
+            sleep: Function used to wait
+
+        Raises:
+            ValueError: If rate or burst is not positive
+        """
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        burst = burst if burst is not None else max(1.0, rate)
+        if burst < 1:
+            raise ValueError("burst must be >= 1")
+
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._refill(now)
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                elif self._tokens >= 1 - _TOKEN_EPSILON:
+                    self._tokens = max(0.0, self._tokens - 1)
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens already accumulated."""
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for ``seconds``, then resume without a burst.
+
+        One request may go as soon as the pause ends; the rest follow at
+        ``rate``.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens = min(self._tokens, 1.0)
+            self._blocked_until = max(self._blocked_until, now + seconds)
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last update (none while paused)."""
+        start = max(self._updated, self._blocked_until)
+        if now > start:
+            self._tokens = min(self.burst, self._tokens + (now - start) * self.rate)
+        self._updated = now
+
+
+class AIMDConcurrencyLimiter:
+    """Concurrency limit with additive increase, multiplicative decrease.
+
+    Every successful request raises the limit by ``increase / limit`` (about
+    ``increase`` per limit's worth of requests); an overload response cuts
+    it by ``decrease``. Requests that were already in flight when the limit
+    was cut do not cut it again, so a burst of 429s halves it once.
+    """
+
+    def __init__(
+        self,
+        initial: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+    ):
+        """Initialize concurrency limiter.
+
+        Args:
+            initial: Starting limit
+            min_limit: Lowest limit
+            max_limit: Highest limit
+            increase: Additive increase per limit's worth of successes
+            decrease: Factor applied to the limit on overload
+
+        Raises:
+            ValueError: If the bounds or factors are invalid
+        """
+        if not 1 <= min_limit <= initial <= max_limit:
+            raise ValueError("expected 1 <= min_limit <= initial <= max_limit")
+        if increase <= 0 or not 0 < decrease < 1:
+            raise ValueError("expected increase > 0 and 0 < decrease < 1")
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self._limit = float(initial)
+        self._in_flight = 0
+        self._generation = 0
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current number of requests allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently in flight."""
+        return self._in_flight
+
+    def acquire(self) -> int:
+        """Wait for a free slot.
+
+        Returns:
+            Ticket to pass to release
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return self._generation
+
+    def release(self, ticket: int, overloaded: Optional[bool] = False) -> None:
+        """Free a slot and adjust the limit.
+
+        Args:
+            ticket: Value returned by acquire
+            overloaded: True to decrease the limit, False to increase it,
+                None to leave it unchanged (e.g. network errors)
+        """
+        with self._condition:
+            self._in_flight -= 1
+            if overloaded:
+                if ticket == self._generation:
+                    self._limit = max(self.min_limit, self._limit * self.decrease)
+                    self._generation += 1
+            elif overloaded is not None:
+                self._limit = min(
+                    self.max_limit, self._limit + self.increase / self._limit
+                )
+            self._condition.notify_all()
+
+
+class RateLimiter:
+    """Token bucket plus AIMD concurrency driven by response headers.
+
+    ``rate`` is the ceiling in requests per second. Responses adjust it:
+
+    - ``Retry-After`` pauses the bucket for the requested delay;
+    - ``RateLimit-Remaining``/``RateLimit-Reset`` (or the ``X-RateLimit-*``
+      variants) set the rate to ``headroom`` of what is left in the window,
+      and an exhausted window pauses until it resets;
+    - 429 and 503 halve the concurrency limit, other responses grow it.
+
+    Sustained throughput therefore settles just under the provider's limit
+    instead of oscillating between bursts of 429s and idle backoff.
+    """
+
+    def __init__(
+        self,
+        rate: float = 10.0,
+        burst: Optional[float] = None,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        initial_concurrency: Optional[int] = None,
+        headroom: float = 0.9,
+        default_retry_after: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize rate limiter.
+
+        Args:
+            rate: Maximum requests per second
+            burst: Requests allowed back to back after idling
+            max_concurrency: Highest number of requests in flight
+            min_concurrency: Lowest number of requests in flight
+            initial_concurrency: Starting limit (defaults to max_concurrency)
+            headroom: Fraction of the provider's remaining budget to use
+            default_retry_after: Pause after a 429 without Retry-After
+            clock: Monotonic time source
+            sleep: Function used to wait
+
+        Raises:
+            ValueError: If any setting is out of range
+        """
+        if not 0 < headroom <= 1:
+            raise ValueError("headroom must be in (0, 1]")
+
+        self.max_rate = float(rate)
+        self.headroom = headroom
+        self.default_retry_after = default_retry_after
+        self.bucket = TokenBucket(rate, burst, clock=clock, sleep=sleep)
+        self.concurrency = AIMDConcurrencyLimiter(
+            initial=initial_concurrency or max_concurrency,
+            min_limit=min_concurrency,
+            max_limit=max_concurrency,
+        )
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "waited": 0.0}
+
+    def acquire(self) -> int:
+        """Wait for a concurrency slot and a token.
+
+        Returns:
+            Ticket to pass to release
+        """
+        ticket = self.concurrency.acquire()
+        try:
+            waited = self.bucket.acquire()
+        except BaseException:
+            self.concurrency.release(ticket, overloaded=None)
+            raise
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["waited"] += waited
+        return ticket
+
+    def release(
+        self,
+        ticket: int,
+        status_code: Optional[int] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Release a slot and learn from the response.
+
+        Args:
+            ticket: Value returned by acquire
+            status_code: Response status (None if the request failed)
+            headers: Response headers
+        """
+        overloaded = None if status_code is None else status_code in OVERLOAD_STATUSES
+        try:
+            if headers is not None:
+                self._observe(status_code, headers)
+        finally:
+            self.concurrency.release(ticket, overloaded)
+
+    def stats(self) -> Dict[str, float]:
+        """Get limiter counters and current settings.
+
+        Returns:
+            Dictionary with requests, throttled, waited seconds, rate and
+            concurrency limit
+        """
+        with self._lock:
+            return dict(
+                self._stats,
+                rate=self.bucket.rate,
+                concurrency=self.concurrency.limit,
+            )
+
+    def _observe(
+        self, status_code: Optional[int], headers: Mapping[str, str]
+    ) -> None:
+        """Adjust the bucket to Retry-After and rate-limit headers."""
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        if status_code == 429:
+            with self._lock:
+                self._stats["throttled"] += 1
+            if retry_after is None:
+                retry_after = self.default_retry_after
+        if retry_after:
+            self.logger.warning("Provider asked to wait %.2fs", retry_after)
+            self.bucket.pause(retry_after)
+
+        remaining = _header(headers, "Remaining")
+        reset = _header(headers, "Reset")
+        if remaining is None or reset is None:
+            return
+        if reset > _EPOCH_THRESHOLD:
+            reset -= time.time()
+        if reset <= 0:
+            return
+        if remaining < 1:
+            self.bucket.pause(reset)
+            return
+        rate = min(self.max_rate, self.headroom * remaining / reset)
+        self.bucket.set_rate(rate)
@@ -0,0 +1,230 @@
+"""Incremental JSON decoding of array responses."""
+
+import codecs
+import json
+import re
+from typing import Any, Generator, Iterable, List, Tuple, Union
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Parser states
+_START = "start"
+_KEY_OR_END = "key_or_end"
+_KEY = "key"
+_COLON = "colon"
+_MEMBER = "member"
+_MEMBER_SEP = "member_sep"
+_ITEM_OR_END = "item_or_end"
+_ITEM = "item"
+_ITEM_SEP = "item_sep"
+_DONE = "done"
+
+_INCOMPLETE = object()
+
+
+class JSONItemStream:
+    """Push parser yielding the elements of a JSON array as they arrive.
+
+    The document is either a top-level array or an object whose
+    ``items_key`` member is an array. Only the element being parsed is kept
+    in memory, so peak memory depends on the largest element rather than
+    the size of the body. Other members of the object are parsed and
+    discarded; anything after the array is ignored.
+
+    Feed it raw chunks and collect the elements each call completes::
+
+        stream = JSONItemStream()
+        for chunk in chunks:
+            yield from stream.feed(chunk)
+            if stream.done:
+                break
+        yield from stream.close()
+    """
+
+    def __init__(self, items_key: str = "items"):
+        """Initialize stream parser.
+
+        Args:
+            items_key: Member holding the array when the body is an object
+        """
+        self.items_key = items_key
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the array has been read to its end."""
+        return self._state == _DONE
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Any]:
+        """Add a chunk of the body.
+
+        Args:
+            chunk: Next bytes (UTF-8) or text of the document
+
+        Returns:
+            Elements completed by this chunk
+
+        Raises:
+            ValueError: If the document is not valid JSON of the expected shape
+        """
+        if isinstance(chunk, bytes):
+            chunk = self._text_decoder.decode(chunk)
+        return self._parse(chunk, final=False)
+
+    def close(self) -> List[Any]:
+        """Signal the end of the body.
+
+        Returns:
+            Elements completed by the end of input
+
+        Raises:
+            ValueError: If the document is truncated or invalid
+        """
+        items = self._parse(self._text_decoder.decode(b"", final=True), final=True)
+        if not self.done:
+            raise ValueError("Truncated JSON document")
+        return items
+
+    def _parse(self, text: str, final: bool) -> List[Any]:
+        """Append text and parse as far as the buffer allows."""
+        if self.done:
+            return []
+        if self._pos:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += text
+
+        items: List[Any] = []
+        while not self.done and self._step(items, final):
+            pass
+        return items
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        """Consume one token or value.
+
+        Returns:
+            False if more input is needed
+        """
+        pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        self._pos = pos
+        if pos >= len(self._buffer):
+            return False
+        char = self._buffer[pos]
+        state = self._state
+
+        if state == _START:
+            if char == "[":
+                self._advance(pos + 1, _ITEM_OR_END)
+            elif char == "{":
+                self._advance(pos + 1, _KEY_OR_END)
+            else:
+                raise ValueError(f"Expected a JSON array or object at {pos}")
+
+        elif state in (_KEY_OR_END, _KEY):
+            if char == "}" and state == _KEY_OR_END:
+                self._advance(pos + 1, _DONE)
+                return True
+            if char != '"':
+                raise ValueError(f"Expected a member name at {pos}")
+            key, end = self._decode(pos, final)
+            if key is _INCOMPLETE:
+                return False
+            self._key = key
+            self._advance(end, _COLON)
+
+        elif state == _COLON:
+            self._expect(char, ":", pos)
+            self._advance(pos + 1, _MEMBER)
+
+        elif state == _MEMBER:
+            if self._key == self.items_key and char == "[":
+                self._advance(pos + 1, _ITEM_OR_END)
+                return True
+            value, end = self._decode(pos, final)
+            if value is _INCOMPLETE:
+                return False
+            self._advance(end, _MEMBER_SEP)
+
+        elif state == _MEMBER_SEP:
+            if char == "}":
+                self._advance(pos + 1, _DONE)
+            else:
+                self._expect(char, ",", pos)
+                self._advance(pos + 1, _KEY)
+
+        elif state in (_ITEM_OR_END, _ITEM):
+            if char == "]" and state == _ITEM_OR_END:
+                self._advance(pos + 1, _DONE)
+                return True
+            value, end = self._decode(pos, final)
+            if value is _INCOMPLETE:
+                return False
+            items.append(value)
+            self._advance(end, _ITEM_SEP)
+
+        elif state == _ITEM_SEP:
+            if char == "]":
+                self._advance(pos + 1, _DONE)
+            else:
+                self._expect(char, ",", pos)
+                self._advance(pos + 1, _ITEM)
+
+        return True
+
+    def _decode(self, pos: int, final: bool) -> Tuple[Any, int]:
+        """Decode the value at pos, or report that it is not complete yet.
+
+        A value ending exactly at the end of the buffer is treated as
+        incomplete unless the input is final, since a number such as ``12``
+        may continue in the next chunk.
+        """
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return _INCOMPLETE, pos
+        if end >= len(self._buffer) and not final:
+            return _INCOMPLETE, pos
+        return value, end
+
+    def _advance(self, pos: int, state: str) -> None:
+        """Move past a token into a new state."""
+        self._pos = pos
+        self._state = state
+
+    @staticmethod
+    def _expect(char: str, expected: str, pos: int) -> None:
+        """Raise unless char is the expected delimiter."""
+        if char != expected:
+            raise ValueError(f"Expected {expected!r} at {pos}, got {char!r}")
+
+
+def iter_json_items(
+    chunks: Iterable[Union[bytes, str]], items_key: str = "items"
+) -> Generator[Any, None, None]:
+    """Yield array elements from an iterable of body chunks.
+
+    Stops reading as soon as the array is complete.
+
+    Args:
+        chunks: Pieces of a JSON document
+        items_key: Member holding the array when the body is an object
+
+    Yields:
+        Array elements in document order
+
+    Raises:
+        ValueError: If the document is invalid or truncated
+    """
+    stream = JSONItemStream(items_key)
+    for chunk in chunks:
+        yield from stream.feed(chunk)
+        if stream.done:
+            return
+    yield from stream.close()
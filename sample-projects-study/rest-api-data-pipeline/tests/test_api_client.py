@@ -1,5 +1,7 @@
 """Tests for API client module."""
 
+import json
+
 import pytest
 import responses
 from unittest.mock import patch, MagicMock
@@ -94,6 +96,83 @@ class TestStatelessAPIClient:
             # Note: This test demonstrates how to mock timeout
             # Actual timeout testing would require more complex setup
 
+    def test_connection_pool_settings(self):
+        """Test the session adapter uses the configured pool size."""
+        client = StatelessAPIClient(
+            "https://api.example.com", pool_connections=2, pool_maxsize=32
+        )
+
+        adapter = client._session.get_adapter("https://api.example.com")
+        assert adapter._pool_connections == 2
+        assert adapter._pool_maxsize == 32
+        client.close()
+
+    def test_invalid_pool_size(self):
+        """Test pool sizes must be positive."""
+        with pytest.raises(ValidationError):
+            StatelessAPIClient("https://api.example.com", pool_maxsize=0)
+
+    def test_keep_alive_disabled_closes_connections(self):
+        """Test keep_alive=False asks the server to close each connection."""
+        client = StatelessAPIClient("https://api.example.com", keep_alive=False)
+        assert client._session.headers["Connection"] == "close"
+
+    @responses.activate
+    def test_cookies_are_not_kept(self, client):
+        """Test the shared session stays stateless."""
+        responses.add(
+            responses.GET,
+            "https://api.example.com/login",
+            json={},
+            headers={"Set-Cookie": "session=abc; Path=/"},
+        )
+
+        client.get("login")
+
+        assert len(client._session.cookies) == 0
+
+    @staticmethod
+    def _add_pages(total_pages, failing_page=None):
+        """Register a paginated endpoint reporting total_pages."""
+
+        def callback(request):
+            page = int(request.params["page"])
+            if page == failing_page:
+                return 500, {}, "{}"
+            body = {"items": [page], "pagination": {"total_pages": total_pages}}
+            return 200, {}, json.dumps(body)
+
+        responses.add_callback(
+            responses.GET, "https://api.example.com/items", callback=callback
+        )
+
+    @responses.activate
+    def test_get_paginated_concurrent_keeps_page_order(self, client):
+        """Test concurrent pagination yields every page in order."""
+        self._add_pages(20)
+
+        pages = list(client.get_paginated("items", max_workers=4))
+
+        assert [page["items"][0] for page in pages] == list(range(1, 21))
+
+    @responses.activate
+    def test_get_paginated_concurrent_unordered(self, client):
+        """Test unordered pagination yields every page once."""
+        self._add_pages(20)
+
+        pages = list(client.get_paginated("items", max_workers=4, ordered=False))
+
+        assert sorted(page["items"][0] for page in pages) == list(range(1, 21))
+
+    @responses.activate
+    def test_get_paginated_concurrent_stops_at_failed_page(self, client):
+        """Test pages after a failed page are not yielded."""
+        self._add_pages(20, failing_page=5)
+
+        pages = list(client.get_paginated("items", max_workers=4))
+
+        assert [page["items"][0] for page in pages] == [1, 2, 3, 4]
+
 
 class TestStatefulAPIClient:
     """Test cases for StatefulAPIClient."""
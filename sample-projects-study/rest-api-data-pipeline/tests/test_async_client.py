@@ -0,0 +1,207 @@
+"""Tests for the asyncio API client."""
+
+import asyncio
+import json
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+from aiohttp import web  # noqa: E402
+
+from src.api.async_client import AsyncAPIClient  # noqa: E402
+from src.api.exceptions import APIError, NetworkError, ValidationError  # noqa: E402
+from src.api.instrumentation import CallbackHook  # noqa: E402
+
+
+async def _start_server(handler):
+    """Serve handler on a free local port.
+
+    Returns:
+        Tuple of runner and base URL
+    """
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}"
+
+
+class TestAsyncAPIClient:
+    """Test cases for AsyncAPIClient."""
+
+    def test_get_success(self):
+        """Test a successful GET returns the decoded JSON."""
+
+        async def handler(request):
+            return web.json_response({"path": request.path, **request.query})
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url) as client:
+                    return await client.get("/users", params={"id": "1"})
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(scenario()) == {"path": "/users", "id": "1"}
+
+    def test_http_error_maps_to_api_error(self):
+        """Test HTTP error statuses raise APIError with the status code."""
+
+        async def handler(request):
+            return web.Response(status=404)
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url) as client:
+                    await client.get("users")
+            finally:
+                await runner.cleanup()
+
+        with pytest.raises(APIError) as excinfo:
+            asyncio.run(scenario())
+        assert excinfo.value.status_code == 404
+
+    def test_connection_error_maps_to_network_error(self):
+        """Test an unreachable host raises NetworkError."""
+
+        async def scenario():
+            async with AsyncAPIClient("http://127.0.0.1:1") as client:
+                await client.get("users")
+
+        with pytest.raises(NetworkError):
+            asyncio.run(scenario())
+
+    def test_empty_endpoint(self):
+        """Test an empty endpoint is rejected before any request."""
+
+        async def scenario():
+            async with AsyncAPIClient("https://api.example.com") as client:
+                await client.get("")
+
+        with pytest.raises(ValidationError):
+            asyncio.run(scenario())
+
+    def test_concurrency_is_limited(self):
+        """Test no more than max_concurrency requests are in flight."""
+        state = {"active": 0, "peak": 0}
+
+        async def handler(request):
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return web.json_response({})
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url, max_concurrency=5) as client:
+                    await asyncio.gather(*(client.get("x") for _ in range(50)))
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(scenario())
+        assert state["peak"] == 5
+
+    @pytest.mark.parametrize("ordered", [True, False])
+    def test_get_paginated_concurrent(self, ordered):
+        """Test concurrent pagination yields every page once."""
+
+        async def handler(request):
+            page = int(request.query["page"])
+            return web.json_response(
+                {"items": [page], "pagination": {"total_pages": 20}}
+            )
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url) as client:
+                    return [
+                        page["items"][0]
+                        async for page in client.get_paginated(
+                            "items", max_workers=4, ordered=ordered
+                        )
+                    ]
+            finally:
+                await runner.cleanup()
+
+        pages = asyncio.run(scenario())
+        if ordered:
+            assert pages == list(range(1, 21))
+        else:
+            assert sorted(pages) == list(range(1, 21))
+
+    def test_get_stream(self):
+        """Test get_stream yields items from a chunked body."""
+        items = [{"id": i} for i in range(200)]
+
+        async def handler(request):
+            response = web.StreamResponse()
+            await response.prepare(request)
+            body = json.dumps({"items": items}).encode("utf-8")
+            for start in range(0, len(body), 100):
+                await response.write(body[start : start + 100])
+            await response.write_eof()
+            return response
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url) as client:
+                    return [
+                        item async for item in client.get_stream("items", chunk_size=64)
+                    ]
+            finally:
+                await runner.cleanup()
+
+        assert asyncio.run(scenario()) == items
+
+    def test_get_stream_malformed_body(self):
+        """Test a truncated body raises APIError."""
+
+        async def handler(request):
+            return web.Response(text='{"items": [1, 2', content_type="application/json")
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            try:
+                async with AsyncAPIClient(url) as client:
+                    return [item async for item in client.get_stream("items")]
+            finally:
+                await runner.cleanup()
+
+        with pytest.raises(APIError):
+            asyncio.run(scenario())
+
+    def test_request_spans(self):
+        """Test hooks receive spans with connection and response timings."""
+        spans = []
+
+        async def handler(request):
+            return web.json_response({})
+
+        async def scenario():
+            runner, url = await _start_server(handler)
+            url = url.replace("127.0.0.1", "localhost")
+            try:
+                async with AsyncAPIClient(
+                    url, hooks=[CallbackHook(spans.append)]
+                ) as client:
+                    await client.get("users/1")
+                    await client.get("users/2")
+            finally:
+                await runner.cleanup()
+
+        asyncio.run(scenario())
+        first, second = spans
+        assert first.endpoint == "/users/{id}"
+        assert first.status_code == 200
+        assert first.connect is not None
+        assert first.ttfb is not None and first.download is not None
+        assert second.connect is None
@@ -0,0 +1,123 @@
+"""Tests for DataLoader-style batching."""
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from src.api.async_client import AsyncAPIClient
+from src.api.batching import BatchLoader
+from src.api.client import StatefulAPIClient, StatelessAPIClient
+from src.api.exceptions import APIError, ValidationError
+
+URL = "https://api.example.com/items"
+
+
+def _batch_endpoint(calls, missing=(), status=200):
+    """Register an ids endpoint that echoes a record per requested id."""
+
+    def callback(request):
+        ids = request.params["ids"].split(",")
+        calls.append(ids)
+        if status != 200:
+            return status, {}, "{}"
+        items = [{"id": int(i), "name": f"item {i}"} for i in ids if i not in missing]
+        return 200, {}, json.dumps({"items": items})
+
+    responses.add_callback(responses.GET, URL, callback=callback)
+
+
+class TestBatchLoader:
+    """Test cases for BatchLoader."""
+
+    @pytest.fixture
+    def client(self):
+        """Create client instance for testing."""
+        return StatelessAPIClient("https://api.example.com")
+
+    @responses.activate
+    def test_concurrent_loads_share_one_request(self, client):
+        """Test loads within the wait window are sent together."""
+        calls = []
+        _batch_endpoint(calls)
+        loader = client.batch_loader("items", max_wait_ms=200)
+        barrier = threading.Barrier(20)
+
+        def load(record_id):
+            barrier.wait()
+            return loader.load(record_id)
+
+        with ThreadPoolExecutor(max_workers=20) as pool:
+            records = list(pool.map(load, range(20)))
+
+        assert [record["id"] for record in records] == list(range(20))
+        assert len(calls) == 1
+        assert sorted(map(int, calls[0])) == list(range(20))
+        assert loader.stats() == {"loads": 20, "batches": 1}
+
+    @responses.activate
+    def test_load_many_splits_by_batch_size(self, client):
+        """Test load_many sends full batches and the remainder at once."""
+        calls = []
+        _batch_endpoint(calls)
+        loader = client.batch_loader("items", max_batch_size=10, max_wait_ms=10_000)
+
+        records = loader.load_many(range(25))
+
+        assert [record["id"] for record in records] == list(range(25))
+        assert [len(ids) for ids in calls] == [10, 10, 5]
+
+    @responses.activate
+    def test_duplicate_ids_are_requested_once(self, client):
+        """Test the same id in one batch is sent once and shared."""
+        calls = []
+        _batch_endpoint(calls)
+        loader = client.batch_loader("items")
+
+        records = loader.load_many([1, 2, 1])
+
+        assert calls == [["1", "2"]]
+        assert records[0] is records[2]
+
+    @responses.activate
+    def test_missing_id_fails_only_that_load(self, client):
+        """Test ids absent from the response raise a 404 APIError."""
+        _batch_endpoint([], missing={"2"})
+        loader = client.batch_loader("items")
+        futures = [loader._enqueue(i) for i in (1, 2)]
+        loader.flush()
+
+        assert futures[0].result()["id"] == 1
+        with pytest.raises(APIError) as excinfo:
+            futures[1].result()
+        assert excinfo.value.status_code == 404
+
+    @responses.activate
+    def test_failed_batch_fails_every_load(self, client):
+        """Test a failed batch request is raised to every caller."""
+        _batch_endpoint([], status=404)
+        loader = client.batch_loader("items")
+
+        with pytest.raises(APIError):
+            loader.load_many([1, 2])
+
+    @responses.activate
+    def test_mapping_response(self):
+        """Test responses keyed by id are split without id_key."""
+        responses.add(responses.GET, URL, json={"1": {"name": "a"}, "2": {"name": "b"}})
+        loader = StatefulAPIClient("https://api.example.com").batch_loader("items")
+
+        assert loader.load_many([2, 1]) == [{"name": "b"}, {"name": "a"}]
+
+    def test_invalid_settings(self, client):
+        """Test batch size and wait time are validated."""
+        with pytest.raises(ValidationError):
+            BatchLoader(client, "items", max_batch_size=0)
+
+    def test_async_client_rejected(self):
+        """Test the loader refuses clients whose get is a coroutine."""
+        pytest.importorskip("aiohttp")
+        with pytest.raises(ValidationError):
+            AsyncAPIClient("https://api.example.com").batch_loader("items")
@@ -0,0 +1,128 @@
+"""Tests for the HTTP response cache."""
+
+import pytest
+import responses
+
+from src.api.cache import (
+    ResponseCache,
+    cache_key,
+    freshness_lifetime,
+    parse_cache_control,
+)
+from src.api.client import StatefulAPIClient
+
+URL = "https://api.example.com/reference"
+
+
+class TestCacheHelpers:
+    """Test cases for Cache-Control parsing."""
+
+    def test_parse_cache_control(self):
+        """Test directives are lower-cased and arguments unquoted."""
+        directives = parse_cache_control('Max-Age=60, no-cache, private="x"')
+        assert directives == {"max-age": "60", "no-cache": None, "private": "x"}
+
+    def test_freshness_lifetime(self):
+        """Test max-age, Age and no-cache handling."""
+        assert freshness_lifetime({"Cache-Control": "max-age=60"}, 0) == 60
+        assert freshness_lifetime({"Cache-Control": "max-age=60", "Age": "20"}, 0) == 40
+        assert freshness_lifetime({"Cache-Control": "no-cache, max-age=60"}, 0) == 0
+        assert freshness_lifetime({}, 5) == 5
+
+    def test_cache_key_ignores_param_order(self):
+        """Test parameter order does not change the key."""
+        assert cache_key(URL, {"a": 1, "b": 2}) == cache_key(URL, {"b": 2, "a": 1})
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted first."""
+        cache = ResponseCache(max_entries=2)
+        headers = {"Cache-Control": "max-age=60"}
+        cache.store("a", 1, headers)
+        cache.store("b", 2, headers)
+        cache.get("a")
+        cache.store("c", 3, headers)
+
+        assert cache.get("a").data == 1
+        assert cache.get("b") is None
+
+    def test_invalid_max_entries(self):
+        """Test the cache needs room for at least one entry."""
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+class TestCachedStatefulClient:
+    """Test cases for StatefulAPIClient with a ResponseCache."""
+
+    @responses.activate
+    def test_fresh_entry_skips_request(self):
+        """Test a response within max-age is served without a request."""
+        responses.add(
+            responses.GET, URL, json={"v": 1}, headers={"Cache-Control": "max-age=60"}
+        )
+        client = StatefulAPIClient("https://api.example.com", cache=ResponseCache())
+
+        first = client.get("reference")
+        second = client.get("reference")
+
+        assert first == second == {"v": 1}
+        assert len(responses.calls) == 1
+        assert client.cache.stats()["hits"] == 1
+
+    @responses.activate
+    def test_stale_entry_revalidates_with_etag(self):
+        """Test a stale entry sends If-None-Match and reuses the payload on 304."""
+        responses.add(
+            responses.GET, URL, json={"v": 1}, headers={"ETag": '"abc"'}
+        )
+        responses.add(responses.GET, URL, status=304)
+        client = StatefulAPIClient("https://api.example.com", cache=ResponseCache())
+
+        first = client.get("reference")
+        second = client.get("reference")
+
+        assert second is first
+        assert responses.calls[1].request.headers["If-None-Match"] == '"abc"'
+        assert client.cache.stats()["revalidated"] == 1
+
+    @responses.activate
+    def test_no_store_is_not_cached(self):
+        """Test Cache-Control: no-store responses are always fetched."""
+        responses.add(
+            responses.GET,
+            URL,
+            json={"v": 1},
+            headers={"Cache-Control": "no-store", "ETag": '"abc"'},
+        )
+        client = StatefulAPIClient("https://api.example.com", cache=ResponseCache())
+
+        client.get("reference")
+        client.get("reference")
+
+        assert len(responses.calls) == 2
+        assert "If-None-Match" not in responses.calls[1].request.headers
+
+    @responses.activate
+    def test_disk_store_survives_restart(self, tmp_path):
+        """Test entries written to disk are used by a new cache instance."""
+        responses.add(
+            responses.GET,
+            URL,
+            json={"v": 1},
+            headers={"Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+        )
+        responses.add(responses.GET, URL, status=304)
+
+        first = StatefulAPIClient(
+            "https://api.example.com", cache=ResponseCache(directory=str(tmp_path))
+        )
+        first.get("reference")
+        second = StatefulAPIClient(
+            "https://api.example.com", cache=ResponseCache(directory=str(tmp_path))
+        )
+
+        assert second.get("reference") == {"v": 1}
+        assert (
+            responses.calls[1].request.headers["If-Modified-Since"]
+            == "Wed, 01 Jan 2025 00:00:00 GMT"
+        )
@@ -0,0 +1,121 @@
+"""Tests for single-flight request coalescing."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from src.api.client import StatefulAPIClient
+from src.api.coalesce import SingleFlight
+from src.api.exceptions import APIError
+
+URL = "https://api.example.com/users"
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test callers with the same key get the leader's result."""
+        flight = SingleFlight()
+        release = threading.Event()
+        executions = []
+
+        def fn():
+            executions.append(1)
+            release.wait(5)
+            return {"value": 42}
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(flight.do, "key", fn) for _ in range(8)]
+            while flight.stats()["coalesced"] < 7:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert len(executions) == 1
+        assert all(result is results[0][0] for result, _ in results)
+        assert sorted(shared for _, shared in results) == [False] + [True] * 7
+        assert flight.in_flight() == 0
+
+    def test_error_is_shared(self):
+        """Test waiters receive the leader's exception."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fn():
+            started.set()
+            release.wait(5)
+            raise APIError("boom", 502)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(flight.do, "key", fn)
+            started.wait(5)
+            follower = pool.submit(flight.do, "key", fn)
+            while flight.stats()["coalesced"] < 1:
+                time.sleep(0.001)
+            release.set()
+
+            for future in (leader, follower):
+                with pytest.raises(APIError):
+                    future.result()
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test a key runs again once its call has finished."""
+        flight = SingleFlight()
+
+        flight.do("key", lambda: 1)
+        result, shared = flight.do("key", lambda: 2)
+
+        assert (result, shared) == (2, False)
+        assert flight.stats() == {"calls": 2, "coalesced": 0}
+
+
+class TestCoalescedStatefulClient:
+    """Test cases for StatefulAPIClient with single_flight enabled."""
+
+    @staticmethod
+    def _slow_endpoint(calls):
+        """Register a GET that records its params and answers after a delay."""
+
+        def callback(request):
+            calls.append(request.params.get("id"))
+            time.sleep(0.1)
+            return 200, {}, '{"ok": true}'
+
+        responses.add_callback(responses.GET, URL, callback=callback)
+
+    @responses.activate
+    def test_identical_gets_send_one_request(self):
+        """Test concurrent identical GETs reach the upstream once."""
+        calls = []
+        self._slow_endpoint(calls)
+        client = StatefulAPIClient("https://api.example.com", single_flight=True)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(
+                pool.map(lambda _: client.get("users", {"id": "1"}), range(8))
+            )
+
+        assert calls == ["1"]
+        assert all(result == {"ok": True} for result in results)
+        assert client.single_flight.stats()["coalesced"] == 7
+
+    @responses.activate
+    def test_different_params_are_not_coalesced(self):
+        """Test requests differing in params are sent separately."""
+        calls = []
+        self._slow_endpoint(calls)
+        client = StatefulAPIClient("https://api.example.com", single_flight=True)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda i: client.get("users", {"id": str(i)}), range(4)))
+
+        assert sorted(calls) == ["0", "1", "2", "3"]
+
+    def test_disabled_by_default(self):
+        """Test coalescing is opt-in."""
+        assert StatefulAPIClient("https://api.example.com").single_flight is None
@@ -0,0 +1,204 @@
+"""Tests for hedged requests."""
+
+import time
+
+import pytest
+import responses
+
+from src.api.client import StatefulAPIClient
+from src.api.hedging import RequestHedger
+
+URL = "https://api.example.com/users/1"
+
+
+def _warm(hedger, key, latency=0.01, samples=20):
+    """Give a key enough latency history to hedge."""
+    for _ in range(samples):
+        hedger.observe(key, latency)
+
+
+class TestRequestHedger:
+    """Test cases for RequestHedger."""
+
+    @pytest.fixture
+    def hedger(self):
+        """Create a hedger that may hedge every call."""
+        hedger = RequestHedger(percentile=90, budget=1.0, min_samples=20)
+        yield hedger
+        hedger.close()
+
+    def test_no_hedge_without_history(self, hedger):
+        """Test calls are not hedged until min_samples are known."""
+        assert hedger.delay("key") is None
+        assert hedger.run("key", lambda: "ok") == "ok"
+        assert hedger.stats()["hedged"] == 0
+
+    def test_delay_follows_percentile(self, hedger):
+        """Test the hedge delay is the configured latency percentile."""
+        for latency in range(1, 101):
+            hedger.observe("key", latency / 1000)
+
+        assert hedger.delay("key") == pytest.approx(0.09)
+
+    def test_fast_call_is_not_hedged(self, hedger):
+        """Test a call finishing before the delay runs once."""
+        _warm(hedger, "key", latency=0.2)
+        calls = []
+
+        assert hedger.run("key", lambda: calls.append(1) or "ok") == "ok"
+        assert len(calls) == 1
+        assert hedger.stats()["hedged"] == 0
+
+    def test_hedge_wins_over_slow_attempt(self, hedger):
+        """Test a slow first attempt is overtaken by the hedge."""
+        _warm(hedger, "key")
+        attempts = []
+        discarded = []
+
+        def fn():
+            attempts.append(1)
+            if len(attempts) == 1:
+                time.sleep(0.3)
+                return "slow"
+            return "fast"
+
+        start = time.perf_counter()
+        result = hedger.run("key", fn, discard=discarded.append)
+
+        assert result == "fast"
+        assert time.perf_counter() - start < 0.25
+        assert hedger.stats()["hedge_wins"] == 1
+        time.sleep(0.35)
+        assert discarded == ["slow"]
+
+    def test_failed_attempt_falls_back_to_other(self, hedger):
+        """Test a failing hedge does not hide a successful first attempt."""
+        _warm(hedger, "key")
+        attempts = []
+
+        def fn():
+            attempts.append(1)
+            if len(attempts) == 1:
+                time.sleep(0.1)
+                return "primary"
+            raise RuntimeError("hedge failed")
+
+        assert hedger.run("key", fn) == "primary"
+        assert hedger.stats()["hedge_wins"] == 0
+
+    def test_rejected_result_does_not_win(self, hedger):
+        """Test a fast rejected result loses to a slower accepted one."""
+        _warm(hedger, "key")
+        attempts = []
+        discarded = []
+
+        def fn():
+            attempts.append(1)
+            if len(attempts) == 1:
+                time.sleep(0.1)
+                return 200
+            return 503
+
+        result = hedger.run(
+            "key", fn, discard=discarded.append, accept=lambda status: status < 500
+        )
+
+        assert result == 200
+        assert discarded == [503]
+        assert hedger.stats()["hedge_wins"] == 0
+
+    def test_rejected_results_are_not_observed(self, hedger):
+        """Test only accepted attempts feed the latency window."""
+        hedger.run("key", lambda: 503, accept=lambda status: status < 500)
+        hedger.run("key", lambda: 200, accept=lambda status: status < 500)
+
+        assert len(hedger._latencies["key"]) == 1
+
+    def test_budget_caps_hedges(self):
+        """Test no more hedges are sent than the budget allows."""
+        hedger = RequestHedger(percentile=50, budget=0.5, max_tokens=1)
+        _warm(hedger, "key", latency=0.001, samples=100)
+
+        for _ in range(4):
+            hedger.run("key", lambda: time.sleep(0.05))
+
+        stats = hedger.stats()
+        assert stats["hedged"] == 2
+        assert stats["over_budget"] == 2
+        hedger.close()
+
+    def test_invalid_settings(self):
+        """Test percentile and budget are validated."""
+        with pytest.raises(ValueError):
+            RequestHedger(percentile=100)
+        with pytest.raises(ValueError):
+            RequestHedger(budget=2)
+
+
+class TestHedgedStatefulClient:
+    """Test cases for StatefulAPIClient with a RequestHedger."""
+
+    @responses.activate
+    def test_slow_replica_is_hedged(self):
+        """Test the client returns the hedge's response when it is faster."""
+        calls = []
+
+        def callback(request):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.3)
+                return 200, {}, '{"replica": "slow"}'
+            return 200, {}, '{"replica": "fast"}'
+
+        responses.add_callback(responses.GET, URL, callback=callback)
+        hedger = RequestHedger(percentile=90, budget=1.0)
+        _warm(hedger, "/users/{id}")
+        client = StatefulAPIClient("https://api.example.com", hedger=hedger)
+
+        assert client.get("users/1") == {"replica": "fast"}
+        assert hedger.stats()["hedge_wins"] == 1
+        hedger.close()
+
+    @responses.activate
+    def test_error_response_does_not_beat_slow_success(self):
+        """Test a fast 5xx from the hedge does not replace a 200."""
+        calls = []
+
+        def callback(request):
+            calls.append(1)
+            if len(calls) == 1:
+                time.sleep(0.1)
+                return 200, {}, '{"replica": "slow"}'
+            return 501, {}, '{"error": "not implemented"}'
+
+        responses.add_callback(responses.GET, URL, callback=callback)
+        hedger = RequestHedger(percentile=90, budget=1.0)
+        _warm(hedger, "/users/{id}")
+
+        with StatefulAPIClient("https://api.example.com", hedger=hedger) as client:
+            assert client.get("users/1") == {"replica": "slow"}
+
+        assert hedger.stats()["hedged"] == 1
+        assert hedger.stats()["hedge_wins"] == 0
+
+    def test_closing_client_closes_hedger(self):
+        """Test the hedger's threads are stopped with the client."""
+        hedger = RequestHedger()
+        client = StatefulAPIClient("https://api.example.com", hedger=hedger)
+
+        client.close()
+
+        with pytest.raises(RuntimeError):
+            hedger._executor.submit(print)
+
+    @responses.activate
+    def test_streams_are_not_hedged(self):
+        """Test get_stream sends a single attempt."""
+        responses.add(responses.GET, URL, json=[1])
+        hedger = RequestHedger(budget=1.0, min_samples=1)
+        hedger.observe("/users/{id}", 0.0)
+        client = StatefulAPIClient("https://api.example.com", hedger=hedger)
+
+        assert list(client.get_stream("users/1")) == [1]
+        assert hedger.stats()["calls"] == 0
+        hedger.close()
@@ -0,0 +1,157 @@
+"""Tests for request instrumentation."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from src.api.client import StatefulAPIClient, StatelessAPIClient
+from src.api.exceptions import NetworkError
+from src.api.instrumentation import (
+    CallbackHook,
+    LatencyHistogram,
+    LatencyHistograms,
+    RequestHook,
+    endpoint_template,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Answer every GET with a small JSON body."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    """Serve _Handler on localhost for the duration of a test."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://localhost:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHelpers:
+    """Test cases for templating and histograms."""
+
+    @pytest.mark.parametrize(
+        "path, template",
+        [
+            ("/users/42", "/users/{id}"),
+            ("/users/42/orders?page=2", "/users/{id}/orders"),
+            ("/items/3f2b6c1e-1d2a-4f9e-8a7b-0c1d2e3f4a5b", "/items/{id}"),
+            ("/v2/users", "/v2/users"),
+        ],
+    )
+    def test_endpoint_template(self, path, template):
+        """Test id-like segments are collapsed."""
+        assert endpoint_template(path) == template
+
+    def test_histogram_percentile(self):
+        """Test percentiles resolve to bucket upper bounds."""
+        histogram = LatencyHistogram(buckets=(0.1, 0.5, 1.0))
+        for value in [0.05] * 90 + [0.3] * 9 + [2.0]:
+            histogram.observe(value)
+
+        assert histogram.percentile(50) == 0.1
+        assert histogram.percentile(99) == 0.5
+        assert histogram.percentile(100) == float("inf")
+        assert histogram.snapshot()["buckets"][0.5] == 99
+
+
+class TestInstrumentedClient:
+    """Test cases for clients with request hooks."""
+
+    def test_span_phases_on_new_connection(self, server_url):
+        """Test a fresh connection reports DNS, connect, TTFB and download."""
+        spans = []
+        client = StatelessAPIClient(server_url, hooks=[CallbackHook(spans.append)])
+
+        client.get("users/7")
+        client.get("users/8")
+
+        first, second = spans
+        assert first.endpoint == "/users/{id}"
+        assert first.status_code == 200
+        assert first.dns is not None and first.connect is not None
+        assert first.tls is None
+        assert first.ttfb is not None and first.download is not None
+        assert first.total >= first.ttfb
+        assert second.dns is None and second.connect is None
+        client.close()
+
+    def test_histograms_by_endpoint_and_status(self, server_url):
+        """Test LatencyHistograms groups spans by template and status."""
+        histograms = LatencyHistograms()
+        client = StatefulAPIClient(server_url, hooks=[histograms])
+
+        for user_id in range(5):
+            client.get(f"users/{user_id}")
+
+        snapshot = histograms.snapshot()
+        assert list(snapshot) == [("/users/{id}", "200")]
+        assert snapshot[("/users/{id}", "200")]["count"] == 5
+        assert histograms.percentile("/users/{id}", 99) is not None
+        client.close()
+
+    def test_failed_request_span(self):
+        """Test connection failures produce a span with the error name."""
+        spans = []
+        client = StatelessAPIClient(
+            "http://127.0.0.1:1", hooks=[CallbackHook(spans.append)]
+        )
+
+        with pytest.raises(NetworkError):
+            client.get("users")
+
+        assert spans[0].status_code is None
+        assert spans[0].outcome == "ConnectionError"
+
+    @responses.activate
+    def test_stream_span_ends_at_headers(self):
+        """Test streamed responses report TTFB but no download time."""
+        responses.add(responses.GET, "https://api.example.com/items", json=[1, 2])
+        spans = []
+        client = StatelessAPIClient(
+            "https://api.example.com", hooks=[CallbackHook(spans.append)]
+        )
+
+        assert list(client.get_stream("items")) == [1, 2]
+        assert spans[0].ttfb is not None
+        assert spans[0].download is None
+
+    @responses.activate
+    def test_failing_hook_does_not_break_requests(self):
+        """Test hook exceptions are logged and ignored."""
+        responses.add(responses.GET, "https://api.example.com/users", json={})
+
+        class BrokenHook(RequestHook):
+            def on_request_start(self, span):
+                raise RuntimeError("exporter down")
+
+        client = StatelessAPIClient("https://api.example.com", hooks=[BrokenHook()])
+
+        assert client.get("users") == {}
+
+    def test_no_hooks_no_instrumentation(self):
+        """Test instrumentation is off by default."""
+        client = StatelessAPIClient("https://api.example.com")
+
+        assert client.instrumentation is None
+        assert client._session.get_adapter("https://x").timed is False
@@ -0,0 +1,175 @@
+"""Tests for client-side rate limiting."""
+
+import pytest
+import responses
+
+from src.api.client import StatefulAPIClient
+from src.api.exceptions import APIError
+from src.api.ratelimit import (
+    AIMDConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    parse_retry_after,
+)
+
+URL = "https://api.example.com/users"
+
+
+class FakeClock:
+    """Manual clock whose sleep advances time instantly."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+
+    def test_burst_then_rate(self):
+        """Test burst tokens are free and later ones arrive at rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == pytest.approx(0.1)
+
+    def test_pause_blocks_until_elapsed(self):
+        """Test pause delays the next token and drops the burst."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=10, burst=5, clock=clock, sleep=clock.sleep)
+
+        bucket.pause(2.0)
+
+        assert bucket.acquire() == pytest.approx(2.0)
+        assert bucket.acquire() == pytest.approx(0.1)
+
+    def test_invalid_rate(self):
+        """Test the rate must be positive."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestAIMDConcurrencyLimiter:
+    """Test cases for AIMDConcurrencyLimiter."""
+
+    def test_additive_increase(self):
+        """Test a limit's worth of successes raises the limit by one."""
+        limiter = AIMDConcurrencyLimiter(initial=4, max_limit=10)
+
+        for _ in range(5):
+            limiter.release(limiter.acquire())
+
+        assert limiter.limit == 5
+
+    def test_burst_of_overloads_decreases_once(self):
+        """Test concurrent overload responses halve the limit only once."""
+        limiter = AIMDConcurrencyLimiter(initial=8)
+        tickets = [limiter.acquire() for _ in range(4)]
+
+        for ticket in tickets:
+            limiter.release(ticket, overloaded=True)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    def test_limit_respects_minimum(self):
+        """Test the limit never drops below min_limit."""
+        limiter = AIMDConcurrencyLimiter(initial=2, min_limit=2)
+
+        limiter.release(limiter.acquire(), overloaded=True)
+
+        assert limiter.limit == 2
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter header handling."""
+
+    def test_parse_retry_after(self):
+        """Test delay seconds and HTTP dates are both understood."""
+        assert parse_retry_after("3") == 3
+        assert parse_retry_after("Thu, 01 Jan 1970 00:01:00 GMT", now=30) == 30
+        assert parse_retry_after("soon") is None
+
+    def test_remaining_budget_sets_rate(self):
+        """Test the rate follows headroom of the remaining window budget."""
+        limiter = RateLimiter(rate=100, headroom=0.9)
+
+        limiter.release(
+            limiter.acquire(),
+            200,
+            {"X-RateLimit-Remaining": "50", "X-RateLimit-Reset": "10"},
+        )
+
+        assert limiter.stats()["rate"] == pytest.approx(4.5)
+
+    def test_rate_never_exceeds_ceiling(self):
+        """Test a generous provider budget does not raise the configured rate."""
+        limiter = RateLimiter(rate=5)
+
+        limiter.release(
+            limiter.acquire(),
+            200,
+            {"RateLimit-Remaining": "1000", "RateLimit-Reset": "1"},
+        )
+
+        assert limiter.stats()["rate"] == 5
+
+    def test_throttled_response_pauses_and_cuts_concurrency(self):
+        """Test a 429 honours Retry-After and halves the concurrency limit."""
+        clock = FakeClock()
+        limiter = RateLimiter(
+            rate=100, max_concurrency=8, clock=clock, sleep=clock.sleep
+        )
+
+        limiter.release(limiter.acquire(), 429, {"Retry-After": "2"})
+        limiter.acquire()
+
+        assert clock.sleeps[0] == pytest.approx(2)
+        assert limiter.stats()["throttled"] == 1
+        assert limiter.stats()["concurrency"] == 4
+
+
+class TestRateLimitedClient:
+    """Test cases for StatefulAPIClient with a RateLimiter."""
+
+    @responses.activate
+    def test_retries_429_through_limiter(self):
+        """Test a 429 is retried after the provider's Retry-After."""
+        clock = FakeClock()
+        responses.add(responses.GET, URL, status=429, headers={"Retry-After": "1"})
+        responses.add(responses.GET, URL, json={"id": 1})
+        client = StatefulAPIClient(
+            "https://api.example.com",
+            rate_limiter=RateLimiter(rate=10, clock=clock, sleep=clock.sleep),
+        )
+
+        assert client.get("users") == {"id": 1}
+        assert len(responses.calls) == 2
+        assert clock.sleeps == [pytest.approx(1)]
+
+    @responses.activate
+    def test_gives_up_after_max_retries(self):
+        """Test persistent 429s raise APIError after max_retries retries."""
+        clock = FakeClock()
+        responses.add(responses.GET, URL, status=429)
+        client = StatefulAPIClient(
+            "https://api.example.com",
+            max_retries=2,
+            rate_limiter=RateLimiter(rate=10, clock=clock, sleep=clock.sleep),
+        )
+
+        with pytest.raises(APIError) as excinfo:
+            client.get("users")
+
+        assert excinfo.value.status_code == 429
+        assert len(responses.calls) == 3
+        assert client.rate_limiter.concurrency.in_flight == 0
@@ -0,0 +1,121 @@
+"""Tests for streaming JSON decoding."""
+
+import json
+
+import pytest
+import responses
+
+from src.api.client import StatefulAPIClient, StatelessAPIClient
+from src.api.exceptions import APIError
+from src.api.streaming import JSONItemStream, iter_json_items
+from src.data.processor import DataValidator, StreamingDataProcessor
+
+URL = "https://api.example.com/records"
+
+
+def _chunks(data, size):
+    """Split data into pieces of size bytes."""
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJSONItemStream:
+    """Test cases for the incremental parser."""
+
+    DOCUMENT = {
+        "meta": {"note": "brackets ]} and commas, in strings", "ids": [1, [2]]},
+        "items": [
+            {"id": i, "name": "café \"x\"", "score": i * 1.5e3} for i in range(20)
+        ]
+        + [7, 1234, True, None, "end"],
+        "pagination": {"total_pages": 3},
+    }
+
+    @pytest.mark.parametrize("size", [1, 2, 5, 64, 1 << 20])
+    def test_items_member_any_chunking(self, size):
+        """Test elements are identical however the body is split."""
+        body = json.dumps(self.DOCUMENT, ensure_ascii=False).encode("utf-8")
+
+        assert list(iter_json_items(_chunks(body, size))) == self.DOCUMENT["items"]
+
+    @pytest.mark.parametrize("size", [1, 3])
+    def test_top_level_array(self, size):
+        """Test a bare array, including numbers split across chunks."""
+        body = b"[1, 22, 333, [4], {\"a\": 5}]"
+
+        assert list(iter_json_items(_chunks(body, size))) == [1, 22, 333, [4], {"a": 5}]
+
+    def test_custom_items_key(self):
+        """Test the array can live under another member name."""
+        body = b'{"items": 1, "data": [1, 2]}'
+
+        assert list(iter_json_items([body], items_key="data")) == [1, 2]
+
+    def test_elements_arrive_before_end_of_body(self):
+        """Test an element is returned as soon as it is complete."""
+        stream = JSONItemStream()
+
+        assert stream.feed(b'{"items": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert stream.feed(b": 2}]") == [{"id": 2}]
+        assert stream.done
+
+    def test_empty_and_missing_arrays(self):
+        """Test empty arrays and objects without the member yield nothing."""
+        assert list(iter_json_items([b"[]"])) == []
+        assert list(iter_json_items([b'{"other": [1]}'])) == []
+
+    @pytest.mark.parametrize(
+        "body", [b"[1, 2", b'{"items": [1,', b'"text"', b"[1 2]", b"[1,]"]
+    )
+    def test_invalid_documents(self, body):
+        """Test truncated or malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            list(iter_json_items([body]))
+
+
+class TestGetStream:
+    """Test cases for get_stream on the synchronous clients."""
+
+    @pytest.fixture(params=[StatelessAPIClient, StatefulAPIClient])
+    def client(self, request):
+        """Create each synchronous client."""
+        return request.param("https://api.example.com")
+
+    @responses.activate
+    def test_streams_items(self, client):
+        """Test records are yielded from an items member."""
+        body = {"items": [{"id": i} for i in range(100)], "total": 100}
+        responses.add(responses.GET, URL, json=body)
+
+        assert list(client.get_stream("records", chunk_size=7)) == body["items"]
+
+    @responses.activate
+    def test_feeds_streaming_processor(self, client):
+        """Test get_stream plugs into StreamingDataProcessor.process."""
+        records = [{"id": i, "name": f" n{i} "} for i in range(5)] + [{"name": "x"}]
+        responses.add(responses.GET, URL, json=records)
+        processor = StreamingDataProcessor(DataValidator(["id"]), batch_size=2)
+
+        batches = list(processor.process(client.get_stream("records")))
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert batches[0][0] == {"id": 0, "name": "n0"}
+        assert processor.get_stats() == {"processed": 5, "skipped": 1}
+
+    @responses.activate
+    def test_http_error(self, client):
+        """Test error statuses raise APIError before any record."""
+        responses.add(responses.GET, URL, status=404)
+
+        with pytest.raises(APIError) as excinfo:
+            list(client.get_stream("records"))
+        assert excinfo.value.status_code == 404
+
+    @responses.activate
+    def test_malformed_body(self, client):
+        """Test a truncated body raises APIError after the parsed records."""
+        responses.add(responses.GET, URL, body='[{"id": 1}, {"id": 2')
+        stream = client.get_stream("records")
+
+        assert next(stream) == {"id": 1}
+        with pytest.raises(APIError):
+            next(stream)